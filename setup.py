@@ -10,6 +10,7 @@ setup(
         'solders>=0.23.0',
         'solana>=0.29.0',
         'aiohttp==3.10.11',
+        'numpy>=1.24',
         'python-dotenv==1.0.0',
         'beautifulsoup4==4.12.2'
     ],
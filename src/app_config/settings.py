@@ -1,22 +1,34 @@
 # app_config/settings.py
 import os
 import logging
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent
 dotenv_path = BASE_DIR / ".env"
 
-if not dotenv_path.exists():
+# Variables already in the environment (containers, the benchmark) take precedence.
+# Values .env supplied last time are dropped first, so a hot reload sees edits.
+for name in globals().get("_DOTENV_KEYS", ()):
+    os.environ.pop(name, None)
+_DOTENV_KEYS = []
+if dotenv_path.exists():
+    _DOTENV_KEYS = [name for name in dotenv_values(dotenv_path) if name not in os.environ]
+    load_dotenv(dotenv_path)
+elif not os.getenv("DISCORD_TOKEN"):
     raise RuntimeError(f".env file not found at {dotenv_path}")
 
-load_dotenv(dotenv_path)
-
 # Core Configuration
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "").strip()
 HELIUS_API_KEY = os.getenv("HELIUS_API_KEY", "").strip()
 BIRDEYE_API_KEY = os.getenv("BIRDEYE_API_KEY", "").strip()
 
+# Provider Endpoints (overridable to point the bot at the offline simulator)
+HELIUS_RPC_URL = os.getenv("HELIUS_RPC_URL", "https://mainnet.helius-rpc.com").rstrip("/")
+BIRDEYE_API_URL = os.getenv("BIRDEYE_API_URL", "https://public-api.birdeye.so").rstrip("/")
+JUPITER_PRICE_URL = os.getenv("JUPITER_PRICE_URL", "https://price.jup.ag").rstrip("/")
+PUMPFUN_URL = os.getenv("PUMPFUN_URL", "https://pump.fun").rstrip("/")
+
 # ID Validation
 try:
     DISCORD_CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID", 0))
@@ -28,6 +40,72 @@ try:
 except ValueError:
     TEST_GUILD_ID = 0
 
+# Scan Pipeline
+SCAN_TICK_DEADLINE = float(os.getenv("SCAN_TICK_DEADLINE", 90))  # seconds per tick
+SCAN_INTERVAL = float(os.getenv("SCAN_INTERVAL", 180))  # starting cadence, adapted per tick
+SCAN_MIN_INTERVAL = float(os.getenv("SCAN_MIN_INTERVAL", 60))
+SCAN_MAX_INTERVAL = float(os.getenv("SCAN_MAX_INTERVAL", 600))
+HELIUS_CONCURRENCY = int(os.getenv("HELIUS_CONCURRENCY", 4))
+BIRDEYE_CONCURRENCY = int(os.getenv("BIRDEYE_CONCURRENCY", 8))
+JUPITER_CONCURRENCY = int(os.getenv("JUPITER_CONCURRENCY", 4))
+SCAN_MAX_CANDIDATES = int(os.getenv("SCAN_MAX_CANDIDATES", 200))
+HELIUS_PAGE_SIZE = int(os.getenv("HELIUS_PAGE_SIZE", 100))
+HELIUS_MAX_PAGES = int(os.getenv("HELIUS_MAX_PAGES", 10))
+SCAN_REFRESH_SECONDS = float(os.getenv("SCAN_REFRESH_SECONDS", 300))
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", 50))  # recent tick traces kept
+
+# Streaming Discovery (opt-in, e.g. wss://pumpportal.fun/api/data; merged with polling)
+DISCOVERY_WS_URL = os.getenv("DISCOVERY_WS_URL", "").strip()
+DISCOVERY_RESCORE_DELAY = float(os.getenv("DISCOVERY_RESCORE_DELAY", 10))  # batches arrivals into one rescore
+DISCOVERY_STALE_SECONDS = float(os.getenv("DISCOVERY_STALE_SECONDS", 120))
+DISCOVERY_MAX_BACKOFF = float(os.getenv("DISCOVERY_MAX_BACKOFF", 60))
+
+# Provider Resilience
+PROVIDER_TIMEOUT = float(os.getenv("PROVIDER_TIMEOUT", 20))  # seconds per attempt
+BREAKER_FAILURE_RATIO = float(os.getenv("BREAKER_FAILURE_RATIO", 0.5))
+BREAKER_WINDOW = int(os.getenv("BREAKER_WINDOW", 20))  # most recent calls considered
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", 5))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", 30))
+HEDGE_REQUESTS = os.getenv("HEDGE_REQUESTS", "false").lower() in ("1", "true", "yes")
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", 95))
+HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", 0.25))  # seconds
+
+# Metrics Cache (TTLs in seconds)
+PRICE_TTL = float(os.getenv("PRICE_TTL", 30))
+VOLUME_TTL = float(os.getenv("VOLUME_TTL", 120))
+LIQUIDITY_TTL = float(os.getenv("LIQUIDITY_TTL", 300))
+MARKET_CAP_TTL = float(os.getenv("MARKET_CAP_TTL", 300))
+METRICS_MAX_STALE = float(os.getenv("METRICS_MAX_STALE", 600))
+METRICS_CACHE_SIZE = int(os.getenv("METRICS_CACHE_SIZE", 5000))
+METRICS_NEGATIVE_TTL = float(os.getenv("METRICS_NEGATIVE_TTL", 60))  # mints a provider has no data for
+
+# Metadata Store
+METADATA_MAX_AGE_DAYS = float(os.getenv("METADATA_MAX_AGE_DAYS", 7))
+DESCRIPTION_CACHE_SIZE = int(os.getenv("DESCRIPTION_CACHE_SIZE", 2048))
+PUMPFUN_MAX_BYTES = int(os.getenv("PUMPFUN_MAX_BYTES", 65536))
+
+# HTTP Pool
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 100))
+HTTP_POOL_PER_HOST = int(os.getenv("HTTP_POOL_PER_HOST", 10))
+
+# Telemetry (/health and /metrics; scripts/deploy/healthcheck.py probes this port)
+TELEMETRY_HOST = os.getenv("TELEMETRY_HOST", "0.0.0.0")
+TELEMETRY_PORT = int(os.getenv("TELEMETRY_PORT", 8080))
+
+# Startup
+FORCE_COMMAND_SYNC = os.getenv("FORCE_COMMAND_SYNC", "false").lower() in ("1", "true", "yes")  # sync even if unchanged
+
+# Discord Publishing
+PUBLISH_CONCURRENCY = int(os.getenv("PUBLISH_CONCURRENCY", 8))
+PUBLISH_RATE = float(os.getenv("PUBLISH_RATE", 40))  # requests per second, below the global 50
+
+# Logging (JSON lines in data/bot.log, written from a background thread)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", 5))
+LOG_DEBUG_BURST = int(os.getenv("LOG_DEBUG_BURST", 20))  # debug records per call site per window
+LOG_DEBUG_WINDOW = float(os.getenv("LOG_DEBUG_WINDOW", 60))
+
 # Unified Validation
 required_config = {
     "DISCORD_TOKEN": DISCORD_TOKEN,
@@ -43,9 +121,4 @@ for name, value in required_config.items():
     if "ID" in name and not isinstance(value, int):
         raise TypeError(f"Invalid type for {name} - must be integer")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s"
-)
-
 logging.info("Configuration validated successfully")
\ No newline at end of file
@@ -6,20 +6,33 @@ import logging
 import os
 import sys
 import asyncio
-from pathlib import Path
+import importlib
+from contextlib import aclosing
+from typing import Dict, List, Optional
 from src.app_config import settings
+from src.bot.cadence import AdaptiveCadence
+from src.bot.command_sync import CommandSync
+from src.bot.discovery import StreamingDiscovery
+from src.bot.filters import metric_columns
+from src.bot.logs import setup_logging, stop_logging
+from src.bot.pipeline import fan_out
+from src.bot import providers
+from src.bot.publisher import EmbedPublisher, PublishScheduler
+from src.bot.scan_state import ScanState
+from src.bot.telemetry import TICK_DURATION, TICKS, TOKENS_PASSED, TOKENS_SCANNED, TelemetryServer
+from src.bot.tracing import Tracer, span
 
-LOG_DIR = Path(__file__).parent.parent / "data"
-LOG_DIR.mkdir(exist_ok=True)
+EXTENSIONS = ("bot.commands", "bot.filters", "bot.utils", "bot.embeds")
 
-logging.basicConfig(
-    level=logging.DEBUG,  # 💡 Changed to DEBUG
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",  # 💡 Added name
-    handlers=[
-        logging.FileHandler(LOG_DIR / "bot.log", encoding="utf-8"),
-        logging.StreamHandler()
-    ]
-)
+def reload_settings() -> None:
+    """Re-read .env and the environment into the settings module in place"""
+    # Modules read settings.NAME at use time, so nothing needs re-importing
+    previous = dict(vars(settings))
+    try:
+        importlib.reload(settings)
+    except Exception:
+        vars(settings).update(previous)
+        raise
 
 class MemeBot(commands.AutoShardedBot):
     def __init__(self):
@@ -37,75 +50,340 @@ class MemeBot(commands.AutoShardedBot):
             chunk_guilds_at_startup=False
         )
         self.launch_time = discord.utils.utcnow()
+        self.scan_state = ScanState(settings.SCAN_REFRESH_SECONDS)
+        self.cadence = AdaptiveCadence(
+            base=settings.SCAN_INTERVAL,
+            min_interval=settings.SCAN_MIN_INTERVAL,
+            max_interval=settings.SCAN_MAX_INTERVAL
+        )
+        self._tick: Optional[asyncio.Task] = None
+        self._arrivals: Optional[asyncio.Task] = None
+        # Last polled discovery results, reused by rescores between polls
+        self._polled: List[Dict] = []
+        self._reloading = False
+        # Cog state in transit during a hot reload, keyed by cog name
+        self.handoffs: Dict[str, Dict] = {}
+        self.last_tick_at: Optional[float] = None
+        self.tracer = Tracer(settings.TRACE_BUFFER_SIZE, budget=settings.SCAN_TICK_DEADLINE)
+        self.telemetry = TelemetryServer(
+            self.health, host=settings.TELEMETRY_HOST, port=settings.TELEMETRY_PORT
+        )
+        self.discovery = StreamingDiscovery(
+            settings.DISCOVERY_WS_URL,
+            max_tokens=settings.SCAN_MAX_CANDIDATES,
+            stale_after=settings.DISCOVERY_STALE_SECONDS,
+            max_backoff=settings.DISCOVERY_MAX_BACKOFF
+        ) if settings.DISCOVERY_WS_URL else None
+        self.publisher = EmbedPublisher()
+        self.command_sync = CommandSync()
+        self.scheduler = PublishScheduler(
+            self.publisher,
+            concurrency=settings.PUBLISH_CONCURRENCY,
+            per_second=settings.PUBLISH_RATE
+        )
 
     async def setup_hook(self):
-        await self.load_extension("bot.commands")
-        await self.load_extension("bot.filters")
-        await self.load_extension("bot.utils")
-        await self.load_extension("bot.embeds")
-        
+        # Up first so container health checks pass while the rest starts
+        try:
+            await self.telemetry.start()
+        except OSError as e:
+            logging.error(f"Telemetry server failed to start: {str(e)}")
+        for extension in EXTENSIONS:
+            await self.load_extension(extension)
+
+        self.publisher.start()
+        await self.scheduler.start()
+        if self.discovery:
+            self.discovery.start(self.get_cog("Utils").pool.session)
+            self._arrivals = asyncio.create_task(self.watch_arrivals())
+        # The first tick scans while the gateway connects; it publishes once ready
+        self.update_task.start()
+
+        await self.sync_commands()
+
+    async def sync_commands(self) -> List[str]:
+        """Upload the command tree; sync requests are slow and rate limited, so unchanged scopes are skipped"""
         test_guild = discord.Object(id=settings.TEST_GUILD_ID)
         self.tree.copy_global_to(guild=test_guild)
-        await self.tree.sync(guild=test_guild)
-        await self.tree.sync()
-        
-        self.update_task.start()
+        return await self.command_sync.sync(
+            self.tree, self.application_id, [test_guild, None], force=settings.FORCE_COMMAND_SYNC
+        )
+
+    async def reload(self) -> List[str]:
+        """Reload settings and extensions in place, keeping long-lived cog state"""
+        # Scan history, the publish queue, limiters and breakers live outside
+        # the extensions and are untouched
+        self._reloading = True
+        try:
+            if self._tick and not self._tick.done():
+                await asyncio.wait({self._tick})
+            reload_settings()
+            self.apply_settings()
+            for extension in EXTENSIONS:
+                # Live objects (pool, caches, stores) pass to the replacement instance
+                for cog in list(self.cogs.values()):
+                    if type(cog).__module__ == extension and hasattr(cog, "handoff"):
+                        self.handoffs[cog.qualified_name] = cog.handoff()
+                await self.reload_extension(extension)
+            # Commands defined in the reloaded cogs may have changed
+            await self.sync_commands()
+            return list(EXTENSIONS)
+        finally:
+            self._reloading = False
+            # A failed load leaves state behind; give it back to whichever instance is live
+            for name, state in self.handoffs.items():
+                cog = self.get_cog(name)
+                if cog:
+                    cog.adopt(state)
+                else:
+                    logging.error(f"Reload dropped the state of {name}")
+            self.handoffs.clear()
+
+    def apply_settings(self) -> None:
+        """Push reloaded settings into the bot-owned objects that copied them"""
+        self.scan_state.refresh_interval = settings.SCAN_REFRESH_SECONDS
+        self.cadence.base = settings.SCAN_INTERVAL
+        self.cadence.min_interval = settings.SCAN_MIN_INTERVAL
+        self.cadence.max_interval = settings.SCAN_MAX_INTERVAL
+        self.tracer.budget = settings.SCAN_TICK_DEADLINE
+        providers.apply_settings()
+
+    async def close(self) -> None:
+        """Release pooled provider connections before disconnecting"""
+        self.update_task.cancel()
+        if self._arrivals:
+            self._arrivals.cancel()
+            await asyncio.gather(self._arrivals, return_exceptions=True)
+        if self._tick:
+            self._tick.cancel()
+            await asyncio.gather(self._tick, return_exceptions=True)
+        if self.discovery:
+            await self.discovery.close()
+        await self.scheduler.close()
+        await self.publisher.close()
+        await self.telemetry.close()
+        utils = self.get_cog("Utils")
+        if utils:
+            await utils.pool.close()
+        await super().close()
+
+    def health(self) -> dict:
+        """Readiness: gateway up, cogs loaded and the scan loop not stalled"""
+        tick_age = None
+        if self.last_tick_at is not None:
+            tick_age = round(asyncio.get_running_loop().time() - self.last_tick_at, 1)
+        stalled = tick_age is not None and tick_age > 2 * settings.SCAN_MAX_INTERVAL
+        cogs = all(self.get_cog(name) for name in ("Utils", "Filters", "Embeds"))
+        return {
+            "ready": self.is_ready() and cogs and not stalled,
+            "gateway": self.is_ready(),
+            "latency_ms": round(self.latency * 1000, 1) if self.is_ready() else None,
+            "last_tick_age": tick_age
+        }
 
     async def on_error(self, event_method: str, *args, **kwargs) -> None:
         logging.error(f"Unhandled error in {event_method}", exc_info=True)
 
-    async def process_coins(self) -> list:
-        """Orchestrate data collection from all sources"""
+    async def process_coins(self, poll: bool = True) -> dict:
+        """Orchestrate data collection from all sources, keyed by publishing channel"""
         try:
-            valid_coins = []
-            tokens = await self.get_cog("Utils").fetch_helius_assets()
-            
-            for token in tokens:
+            utils = self.get_cog("Utils")
+            deadline = asyncio.get_running_loop().time() + settings.SCAN_TICK_DEADLINE
+            discovered = {}
+
+            def add(token):
                 contract = token.get("id", "")
-                if not contract or not self.get_cog("Utils").validate_solana_address(contract):
-                    continue
-
-                metrics = await self.get_cog("Utils").fetch_birdeye_metrics(contract)
-                if self.get_cog("Filters").meets_criteria(metrics):
-                    coin_data = self.get_cog("Utils").format_coin_data(token, metrics)
-                    valid_coins.append(coin_data)
-            
-            return sorted(valid_coins, key=lambda x: x["volume_5min"], reverse=True)[:5]
+                if contract:
+                    discovered[contract] = token
+                return len(discovered) >= settings.SCAN_MAX_CANDIDATES
+
+            polled = []
+
+            async def discover():
+                async with aclosing(utils.iter_helius_assets()) as tokens:
+                    async for token in tokens:
+                        polled.append(token)
+                        if add(token):
+                            break
+
+            # Streamed mints go first so the newest are never crowded out;
+            # polled searchAssets results fill the rest of the candidate set
+            streamed = self.discovery.candidates() if self.discovery else []
+            if self.discovery:
+                self.discovery.arrived.clear()
+            with span("discovery", source="poll" if poll else "rescore", streamed=len(streamed)):
+                for token in streamed:
+                    if add(token):
+                        break
+                if len(discovered) < settings.SCAN_MAX_CANDIDATES:
+                    if poll:
+                        try:
+                            await asyncio.wait_for(discover(), timeout=settings.SCAN_TICK_DEADLINE / 2)
+                        except asyncio.TimeoutError:
+                            logging.warning(f"Discovery timed out with {len(discovered)} candidates")
+                        self._polled = polled
+                    else:
+                        # A rescore reuses the last poll and only fetches what is new
+                        for token in self._polled:
+                            if add(token):
+                                break
+
+            with span("validation", tokens=len(discovered)):
+                candidates = {
+                    contract: token for contract, token in discovered.items()
+                    if utils.validate_solana_address(contract)
+                }
+
+            # Only new, changed or due tokens are fetched, filtered and formatted again
+            with span("incremental"):
+                filters = self.get_cog("Filters")
+                self.scan_state.track_filters(filters.version)
+                dirty = self.scan_state.dirty(candidates)
+
+            # Cached and batched per provider; concurrency is capped by the rate limiters
+            with span("metrics", tokens=len(dirty)):
+                metrics = await utils.get_metrics(dirty, deadline=deadline) if dirty else {}
+
+            # One shared scan is evaluated against every guild profile at once
+            with span("filter"):
+                profiles = filters.compile_profiles(
+                    settings.DISCORD_CHANNEL_ID, settings.TEST_GUILD_ID
+                )
+                fetched = list(metrics)
+                passed = profiles.any_mask(
+                    metric_columns([metrics[contract] for contract in fetched])
+                )
+            with span("format"):
+                for contract, ok in zip(fetched, passed):
+                    token = candidates[contract]
+                    coin_data = None
+                    if ok:
+                        coin_data = utils.format_coin_data(
+                            token, metrics[contract], utils.token_metadata(token)
+                        )
+                    self.scan_state.record(contract, token, coin_data)
+                # Mints Birdeye has no data on wait for their refresh like the
+                # rest; only mints the deadline dropped stay dirty
+                empty = utils.metrics_answered([contract for contract in dirty if contract not in metrics])
+                for contract in empty:
+                    self.scan_state.record(contract, candidates[contract], None)
+            logging.debug(f"Incremental scan: {len(fetched)}/{len(candidates)} tokens rescored")
+
+            with span("filter"):
+                valid_coins = self.scan_state.passing()
+                TOKENS_SCANNED.set(len(candidates))
+                TOKENS_PASSED.set(len(valid_coins))
+                picks = profiles.top_k(metric_columns(valid_coins), 5)
+                results = {
+                    channel_id: [valid_coins[i] for i in top]
+                    for channel_id, top in picks.items()
+                }
+
+            # Descriptions come from the metadata store; only new tokens are scraped
+            with span("format"):
+                shown = {coin["contract"]: coin for coins in results.values() for coin in coins}
+                descriptions = await fan_out(shown, utils.describe, deadline=deadline)
+                for contract, description in descriptions.items():
+                    shown[contract]["description"] = description
+                # Staged rows stay queued on failure; the tick's results are still good
+                try:
+                    await utils.metadata.flush()
+                except Exception as e:
+                    logging.error(f"Metadata flush failed: {str(e)}")
+
+            return results
         
         except Exception as e:
             logging.error(f"Processing failed: {str(e)}")
-            return []
+            return {}
 
-    @tasks.loop(minutes=3)
+    @tasks.loop(seconds=settings.SCAN_INTERVAL)
     async def update_task(self):
-        """Periodic market data update"""
+        """Start a scan tick unless the previous one is still running"""
+        if self._tick and not self._tick.done():
+            self.cadence.skipped += 1
+            TICKS.inc(outcome="skipped")
+            logging.warning("Previous scan tick still running; skipping this one")
+            return
+        if self._reloading:
+            TICKS.inc(outcome="skipped")
+            logging.info("Reload in progress; skipping this scan tick")
+            return
+        # Its own task, so a slow tick never makes the loop fire back-to-back to catch up
+        self._tick = asyncio.create_task(self.run_tick())
+
+    async def watch_arrivals(self):
+        """Rescore shortly after new mints stream in instead of at the next interval"""
+        while True:
+            await self.discovery.arrived.wait()
+            # Let a burst of mints land in one rescore
+            await asyncio.sleep(settings.DISCOVERY_RESCORE_DELAY)
+            if self._tick and not self._tick.done():
+                await asyncio.wait({self._tick})
+            # A tick that started after the arrivals already scored them
+            if self._reloading or not self.discovery.arrived.is_set():
+                continue
+            self._tick = asyncio.create_task(self.run_tick(poll=False))
+
+    async def run_tick(self, poll: bool = True):
+        """Market data update, then the next interval is chosen"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        outcome = "failed"
         try:
-            channel = self.get_channel(settings.DISCORD_CHANNEL_ID)
-            if not channel:
-                return
-
-            coins = await self.process_coins()
-            if coins:
-                await self.update_embed(channel, coins)
-            else:
-                await self.handle_no_coins(channel)
+            # The trace stays open until the queued publish jobs have run
+            with self.tracer.tick() as trace:
+                results = await self.process_coins(poll)
+                if not self.is_ready():
+                    with span("gateway"):
+                        await self.wait_until_ready()
+                with span("submit", channels=len(results)):
+                    for channel_id, coins in results.items():
+                        channel = self.get_channel(channel_id)
+                        if not channel:
+                            continue
+                        if coins:
+                            await self.update_embed(channel, coins)
+                        else:
+                            await self.handle_no_coins(channel)
+            logging.debug(f"Tick trace: {trace.summary()}")
+            logging.debug(f"Publish queue: {self.scheduler.stats()}")
+            logging.debug(f"Provider single-flight: {self.get_cog('Utils').flight_stats()}")
+            logging.debug(f"Provider breakers: {self.get_cog('Utils').breaker_stats()}")
+
+            # Busy boards are scanned more often, quiet ones and thin quotas less.
+            # Rescores of streamed arrivals leave the cadence to the polling ticks.
+            if poll:
+                self.cadence.observe({
+                    channel_id: [coin["contract"] for coin in coins]
+                    for channel_id, coins in results.items()
+                })
+                interval = self.cadence.next_interval(self.get_cog("Utils").provider_budget())
+                self.update_task.change_interval(seconds=interval)
+                logging.debug(f"Scan cadence: {self.cadence.stats()}")
+            if self.discovery:
+                logging.debug(f"Discovery stream: {self.discovery.stats()}")
+            outcome = "completed"
         except Exception as e:
             logging.error(f"Update task failed: {str(e)}")
+        finally:
+            self.last_tick_at = loop.time()
+            TICK_DURATION.observe(self.last_tick_at - started)
+            TICKS.inc(outcome=outcome)
 
     async def update_embed(self, channel, coins):
-        """Handle message update/create"""
-        messages = [msg async for msg in channel.history(limit=1)]
-        embed = self.get_cog("Embeds").create_embed(coins)
-        
-        if messages and messages[0].author == self.user:
-            await messages[0].edit(embed=embed)
-        else:
-            await channel.send(embed=embed)
+        """Queue the channel's embed; the scheduler edits or skips it"""
+        embed = self.get_cog("Embeds").create_embed(
+            coins, self.cadence.min_interval, self.cadence.max_interval
+        )
+        self.scheduler.submit(channel, embed=embed)
 
     async def handle_no_coins(self, channel):
         """No coins found handler"""
         logging.info("⚠️ No matching coins found")
-        await channel.send("⚠️ No coins matched filters. Retrying in 3 minutes.")
+        self.scheduler.submit(
+            channel, content="⚠️ No coins matched filters. Retrying on the next scan."
+        )
 
 bot = MemeBot()
 
@@ -125,6 +403,40 @@ async def on_ready():
         logging.debug("Launching update task...")
         bot.update_task.start()
 
+@bot.tree.command(name="profile", description="Profile the next scan ticks (Admin only)")
+@app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
+@app_commands.default_permissions(administrator=True)
+@app_commands.describe(ticks="How many upcoming ticks to profile")
+async def profile(interaction: discord.Interaction, ticks: app_commands.Range[int, 1, 20] = 3):
+    """cProfile the next ticks and write the hottest stages and functions to data/"""
+    bot.tracer.request_profile(ticks)
+    recent = ", ".join(
+        f"#{trace['tick']} {trace['duration']:.1f}s" for trace in list(bot.tracer.recent)[-5:]
+    )
+    await interaction.response.send_message(
+        f"🔬 Profiling the next {ticks} scan ticks; the report goes to data/.\n"
+        f"Recent ticks: {recent or 'none yet'}",
+        ephemeral=True
+    )
+    logging.info(f"Profiling of {ticks} ticks requested by {interaction.user}")
+
+@bot.tree.command(name="reload", description="Reload cogs and configuration (Admin only)")
+@app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
+@app_commands.default_permissions(administrator=True)
+async def reload(interaction: discord.Interaction):
+    """Hot reload without dropping pools, caches or scan history"""
+    await interaction.response.defer(ephemeral=True)
+    logging.info(f"Reload initiated by {interaction.user}")
+    try:
+        reloaded = await bot.reload()
+    except Exception as e:
+        logging.error(f"Reload failed: {str(e)}")
+        await interaction.followup.send(f"❌ Reload failed: {str(e)}", ephemeral=True)
+        return
+    await interaction.followup.send(
+        f"♻️ Reloaded settings and {', '.join(reloaded)}", ephemeral=True
+    )
+
 @bot.tree.command(name="restart", description="Restart the bot (Admin only)")
 @app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
 @app_commands.default_permissions(administrator=True)
@@ -132,11 +444,21 @@ async def restart(interaction: discord.Interaction):
     """Secure container-friendly restart"""
     await interaction.response.send_message("🔄 Restarting...")
     logging.info(f"Restart initiated by {interaction.user}")
+    # execv skips atexit, so drain the log queue first
+    stop_logging()
     os.execv(sys.executable, ["python", "-m", "bot.bot"])
 
 if __name__ == "__main__":
+    setup_logging(
+        settings.LOG_LEVEL,
+        max_bytes=settings.LOG_MAX_BYTES,
+        backups=settings.LOG_BACKUPS,
+        debug_burst=settings.LOG_DEBUG_BURST,
+        debug_window=settings.LOG_DEBUG_WINDOW
+    )
     try:
-        bot.run(settings.DISCORD_TOKEN)
+        # Root logging is already configured; keep discord.py from adding its own handler
+        bot.run(settings.DISCORD_TOKEN, log_handler=None)
     except KeyboardInterrupt:
         logging.info("Bot shutdown requested")
         bot.loop.run_until_complete(bot.close())
@@ -0,0 +1,173 @@
+# bot/cache.py
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used key"""
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._data.pop(key, default)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Entries from least to most recently used"""
+        return list(self._data.items())
+
+Loader = Callable[[List[str], Optional[float]], Awaitable[Dict[str, Dict[str, Any]]]]
+
+NO_DATA = object()  # stored for a field the provider answered without
+
+class MetricsCache:
+    """Per-field TTL cache with stale-while-revalidate in front of the batch fetchers"""
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        max_size: int = 5000,
+        max_stale: float = 600,
+        negative_ttl: float = 60
+    ):
+        # Fields keep their own fetch time, so a price can expire before the market cap
+        self.ttls = ttls
+        # Past its TTL but within max_stale an entry is served and refreshed in the background
+        self.max_stale = max_stale
+        # How long a field the provider had no data for is remembered as empty
+        self.negative_ttl = negative_ttl
+        self._entries = LRUCache(max_size)
+        self._refreshing: set = set()
+        self._tasks: set = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    async def get_many(
+        self,
+        mints: Iterable[str],
+        fields: Tuple[str, ...],
+        loader: Loader,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return `fields` for each mint, loading misses through `loader`"""
+        # The loader maps every mint the provider answered for to the fields it
+        # had data on, and leaves out mints it never got to
+        mints = list(mints)
+        now = time.monotonic()
+        missing, stale = [], []
+        for mint in mints:
+            state = self._state(mint, fields, now)
+            if state == "fresh":
+                self.hits += 1
+            elif state == "empty":
+                self.negative_hits += 1
+            elif state == "stale":
+                self.stale_hits += 1
+                stale.append(mint)
+            else:
+                self.misses += 1
+                missing.append(mint)
+
+        if stale:
+            self._schedule_refresh(stale, fields, loader)
+        if missing:
+            self._store(await loader(missing, deadline), fields)
+
+        results = {}
+        for mint in mints:
+            entry = self._entries.get(mint)
+            if entry and all(field in entry and entry[field][0] is not NO_DATA for field in fields):
+                results[mint] = {field: entry[field][0] for field in fields}
+        return results
+
+    def answered(self, mints: Iterable[str], fields: Tuple[str, ...]) -> List[str]:
+        """Mints whose `fields` are cached, with data or as known to have none"""
+        now = time.monotonic()
+        return [mint for mint in mints if self._state(mint, fields, now) != "miss"]
+
+    def _state(self, mint: str, fields: Tuple[str, ...], now: float) -> str:
+        entry = self._entries.get(mint)
+        if not entry or not all(field in entry for field in fields):
+            return "miss"
+        empty = [field for field in fields if entry[field][0] is NO_DATA]
+        if empty:
+            # No-data markers are never served stale; they just expire
+            expired = any(now - entry[field][1] > self.negative_ttl for field in empty)
+            return "miss" if expired else "empty"
+        overdue = max(now - entry[field][1] - self.ttls[field] for field in fields)
+        if overdue <= 0:
+            return "fresh"
+        return "stale" if overdue <= self.max_stale else "miss"
+
+    def _store(self, loaded: Dict[str, Dict[str, Any]], fields: Tuple[str, ...]) -> None:
+        now = time.monotonic()
+        for mint, values in loaded.items():
+            entry = dict(self._entries.get(mint) or {})
+            for field in fields:
+                entry[field] = (values[field] if field in values else NO_DATA, now)
+            self._entries.set(mint, entry)
+
+    def _schedule_refresh(self, mints: List[str], fields: Tuple[str, ...], loader: Loader) -> None:
+        pending = [mint for mint in mints if (mint, fields) not in self._refreshing]
+        if not pending:
+            return
+        keys = {(mint, fields) for mint in pending}
+        self._refreshing |= keys
+
+        async def refresh():
+            try:
+                self._store(await loader(pending, None), fields)
+                self.refreshes += 1
+            except Exception as e:
+                logging.warning(f"Background metrics refresh failed: {str(e)}")
+            finally:
+                self._refreshing -= keys
+
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def invalidate(self, mint: str) -> None:
+        self._entries.pop(mint)
+
+    async def close(self) -> None:
+        """Cancel in-flight background refreshes"""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "evictions": self._entries.evictions
+        }
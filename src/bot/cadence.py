@@ -0,0 +1,73 @@
+# bot/cadence.py
+from typing import Dict, Hashable, Optional, Sequence
+
+class AdaptiveCadence:
+    """Picks the next scan interval from top-result churn and provider budget"""
+    def __init__(
+        self,
+        base: float = 180,
+        min_interval: float = 60,
+        max_interval: float = 600,
+        smoothing: float = 0.5,
+        high_churn: float = 0.4,
+        low_churn: float = 0.1,
+        low_budget: float = 0.5
+    ):
+        self.base = base
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.high_churn = high_churn
+        self.low_churn = low_churn
+        self.low_budget = low_budget
+
+        self.churn: Optional[float] = None
+        self.interval = base
+        self._target = base
+        self._previous: Dict[Hashable, frozenset] = {}
+        self.skipped = 0
+
+    def observe(self, tops: Dict[Hashable, Sequence[str]]) -> float:
+        """Record this tick's top contracts per channel; returns smoothed churn"""
+        # Churn is the share of each channel's top list that changed since the last tick
+        changes = []
+        for channel, contracts in tops.items():
+            current = frozenset(contracts)
+            previous = self._previous.get(channel)
+            if previous is None:
+                continue
+            union = current | previous
+            changes.append(len(current ^ previous) / len(union) if union else 0.0)
+        self._previous = {channel: frozenset(contracts) for channel, contracts in tops.items()}
+
+        if changes:
+            churn = sum(changes) / len(changes)
+            if self.churn is None:
+                self.churn = churn
+            else:
+                self.churn = self.smoothing * churn + (1 - self.smoothing) * self.churn
+        return self.churn or 0.0
+
+    def next_interval(self, budget: float = 1.0) -> float:
+        """Seconds until the next tick, given the scarcest provider budget (0-1)"""
+        # Churning boards shorten the interval step by step, static ones lengthen it
+        if self.churn is not None:
+            if self.churn >= self.high_churn:
+                self._target *= 0.75
+            elif self.churn <= self.low_churn:
+                self._target *= 1.25
+        self._target = min(max(self._target, self.min_interval), self.max_interval)
+
+        # A thin provider budget stretches whatever interval churn asks for
+        interval = self._target
+        if budget < self.low_budget:
+            interval *= self.low_budget / max(budget, 0.1)
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+        return self.interval
+
+    def stats(self) -> Dict:
+        return {
+            "interval": round(self.interval, 1),
+            "churn": None if self.churn is None else round(self.churn, 3),
+            "skipped": self.skipped
+        }
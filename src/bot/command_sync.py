@@ -0,0 +1,65 @@
+# bot/command_sync.py
+import hashlib
+import json
+import logging
+import discord
+from discord import app_commands
+from pathlib import Path
+from typing import Dict, List, Optional
+from src.bot.storage import write_json_atomic
+
+SYNC_PATH = Path(__file__).parent.parent / 'data/command_tree.json'
+
+def tree_fingerprint(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """Stable hash of the payload `tree.sync(guild=guild)` would upload"""
+    payload = sorted(
+        (command.to_dict() for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"])
+    )
+    raw = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(raw).hexdigest()
+
+class CommandSync:
+    """Syncs the application command tree only when it changed"""
+    def __init__(self, path: Path = SYNC_PATH):
+        self.path = Path(path)
+        # Last synced fingerprint per application and scope, kept across restarts
+        # because sync requests are slow and tightly rate limited
+        self._synced: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            logging.error(f"Command sync state load failed: {str(e)}")
+            return {}
+
+    async def sync(
+        self,
+        tree: app_commands.CommandTree,
+        application_id: Optional[int],
+        guilds: List[Optional[discord.abc.Snowflake]],
+        force: bool = False
+    ) -> List[str]:
+        """Sync each scope (None is global) whose fingerprint changed; returns the synced scopes"""
+        synced = []
+        try:
+            for guild in guilds:
+                scope = f"{application_id}:{guild.id if guild else 'global'}"
+                fingerprint = tree_fingerprint(tree, guild)
+                if not force and self._synced.get(scope) == fingerprint:
+                    continue
+                await tree.sync(guild=guild)
+                self._synced[scope] = fingerprint
+                synced.append(scope)
+        finally:
+            # Scopes synced before a failure are not uploaded again
+            if synced:
+                write_json_atomic(self.path, self._synced)
+        if synced:
+            logging.info(f"Synced application commands: {synced}")
+        else:
+            logging.info("Application commands unchanged; sync skipped")
+        return synced
@@ -1,8 +1,9 @@
 # src/bot/commands.py
 from discord import app_commands
+from discord.ext import commands
 import discord
 from src.app_config import settings
-from src.bot.filters import FilterSystem
+from src.bot.embeds import error_embed
 from src.bot.helpers import (
     safe_get,
     safe_number,
@@ -14,7 +15,11 @@ import logging
 class MemeCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.filter_system = FilterSystem()
+
+    @property
+    def filter_system(self):
+        """The Filters cog's FilterSystem, shared with the scan pipeline"""
+        return self.bot.get_cog("Filters").system
 
     @app_commands.command(name="addfilter", description="Add token to watchlist")
     @app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
@@ -49,19 +54,29 @@ class MemeCommands(commands.Cog):
         try:
             await interaction.response.defer()
             
-            data = await fetch_helius_assets(token_address)
-            if not data:
+            utils = self.bot.get_cog("Utils")
+            if not utils.validate_solana_address(token_address):
+                await interaction.followup.send(embed=error_embed("Invalid token address"))
+                return
+            metrics = await utils.get_metrics([token_address])
+            if token_address not in metrics:
                 await interaction.followup.send(embed=error_embed("No trading activity found"))
                 return
 
-            embed = create_meme_embed(data)
+            # A bare mint carries no metadata; the store has it for anything scanned
+            token = {"id": token_address}
+            coin_data = utils.format_coin_data(
+                token, metrics[token_address], utils.metadata.get(token_address)
+            )
+            coin_data["description"] = await utils.describe(token_address)
+            embed = self.bot.get_cog("Embeds").create_embed([coin_data])
             await interaction.followup.send(embed=embed)
         except Exception as e:
             logging.error(f"Search error: {e}", exc_info=True)
             await interaction.followup.send(embed=error_embed("Search failed"))
 
     @app_commands.command(name="set_liquidity", description="Set minimum liquidity threshold")
-    @app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
+    @app_commands.guild_only()
     @app_commands.default_permissions(administrator=True)
     async def set_liquidity(self, interaction: discord.Interaction, min_value: int):
         """Admin command with validation"""
@@ -70,7 +85,9 @@ class MemeCommands(commands.Cog):
                 await interaction.response.send_message("❌ Value must be positive!", ephemeral=True)
                 return
                 
-            self.filter_system.update_filter("min_liquidity", min_value)
+            self.filter_system.update_filter(
+                "min_liquidity", min_value, guild_id=str(interaction.guild_id)
+            )
             await interaction.response.send_message(
                 f"✅ Minimum liquidity set to **${min_value:,}**",
                 ephemeral=True
@@ -83,7 +100,7 @@ class MemeCommands(commands.Cog):
             )
 
     @app_commands.command(name="set_market_cap", description="Set market cap range")
-    @app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
+    @app_commands.guild_only()
     @app_commands.default_permissions(administrator=True)
     async def set_market_cap(self, interaction: discord.Interaction, 
                            min_value: int, max_value: int):
@@ -93,8 +110,10 @@ class MemeCommands(commands.Cog):
                 await interaction.response.send_message("❌ Min must be less than max!", ephemeral=True)
                 return
                 
-            self.filter_system.update_filter("min_market_cap", min_value)
-            self.filter_system.update_filter("max_market_cap", max_value)
+            self.filter_system.update_filters(
+                {"min_market_cap": min_value, "max_market_cap": max_value},
+                guild_id=str(interaction.guild_id)
+            )
             await interaction.response.send_message(
                 f"✅ Market cap range set to **${min_value:,}-${max_value:,}**",
                 ephemeral=True
@@ -107,7 +126,7 @@ class MemeCommands(commands.Cog):
             )
 
     @app_commands.command(name="set_volume", description="Set minimum 5-minute volume")
-    @app_commands.guilds(discord.Object(id=settings.TEST_GUILD_ID))
+    @app_commands.guild_only()
     @app_commands.default_permissions(administrator=True)
     async def set_volume(self, interaction: discord.Interaction, min_value: int):
         """Volume filter preservation"""
@@ -116,7 +135,9 @@ class MemeCommands(commands.Cog):
                 await interaction.response.send_message("❌ Value must be positive!", ephemeral=True)
                 return
                 
-            self.filter_system.update_filter("min_5m_volume", min_value)
+            self.filter_system.update_filter(
+                "min_5m_volume", min_value, guild_id=str(interaction.guild_id)
+            )
             await interaction.response.send_message(
                 f"✅ Minimum 5m volume set to **${min_value:,}**",
                 ephemeral=True
@@ -128,11 +149,31 @@ class MemeCommands(commands.Cog):
                 ephemeral=True
             )
 
+    @app_commands.command(name="set_channel", description="Publish this server's top coins here")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    async def set_channel(self, interaction: discord.Interaction):
+        """Route the guild's filter profile to the current channel"""
+        try:
+            self.filter_system.set_channel(str(interaction.guild_id), interaction.channel_id)
+            await interaction.response.send_message(
+                f"✅ Top coins for this server will be posted in <#{interaction.channel_id}>",
+                ephemeral=True
+            )
+        except Exception as e:
+            logging.error(f"Set channel error: {e}")
+            await interaction.response.send_message(
+                "❌ Failed to update publish channel", 
+                ephemeral=True
+            )
+
     @app_commands.command(name="filters", description="Show current filtering criteria")
     async def show_filters(self, interaction: discord.Interaction):
         """Preserved embed display with current filters"""
         try:
-            filters = self.filter_system.get_filters()
+            filters = self.filter_system.get_profile(
+                str(interaction.guild_id) if interaction.guild_id else None
+            )
             embed = discord.Embed(
                 title="🔍 Active Filters",
                 color=0x00ff00,
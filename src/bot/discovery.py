@@ -0,0 +1,140 @@
+# bot/discovery.py
+import aiohttp
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+def to_asset(event: Dict) -> Dict:
+    """Shape a new-token event like a Helius asset so the scan can use it"""
+    return {
+        "id": event["mint"],
+        "content": {
+            "json_uri": event.get("uri", ""),
+            "metadata": {
+                "name": event.get("name", "Unknown"),
+                "symbol": event.get("symbol", "?")
+            },
+            "files": []
+        },
+        "token_info": {}
+    }
+
+class StreamingDiscovery:
+    """Websocket subscription to new-mint events, kept in a bounded newest-first window"""
+    def __init__(
+        self,
+        url: str,
+        subscribe: Optional[Dict] = None,
+        max_tokens: int = 200,
+        stale_after: float = 120.0,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        parse: Callable[[Dict], Optional[Dict]] = None
+    ):
+        self.url = url
+        self.subscribe = subscribe or {"method": "subscribeNewToken"}
+        self.max_tokens = max_tokens
+        self.stale_after = stale_after
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.parse = parse or self._parse
+        # Survives reconnects; replayed mints are deduplicated
+        self._tokens: "OrderedDict[str, Dict]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._last_message = 0.0
+        self.connected = False
+        # Set on each new mint so the bot can rescore before the next interval;
+        # cleared by whoever consumes the window
+        self.arrived = asyncio.Event()
+
+        self.connects = 0
+        self.received = 0
+        self.duplicates = 0
+
+    @staticmethod
+    def _parse(message: Dict) -> Optional[Dict]:
+        # Subscription acks and other chatter carry no mint
+        if not isinstance(message, dict) or not message.get("mint"):
+            return None
+        return to_asset(message)
+
+    @property
+    def healthy(self) -> bool:
+        """False while disconnected or silent"""
+        return self.connected and time.monotonic() - self._last_message < self.stale_after
+
+    def start(self, session: aiohttp.ClientSession) -> None:
+        if self._task is None or self._task.done():
+            self._session = session
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def candidates(self) -> List[Dict]:
+        """Discovered assets, newest first"""
+        return list(reversed(self._tokens.values()))
+
+    def _handle(self, message: Dict) -> None:
+        asset = self.parse(message)
+        if asset is None:
+            return
+        mint = asset["id"]
+        if mint in self._tokens:
+            self.duplicates += 1
+            self._tokens.move_to_end(mint)
+        else:
+            self.received += 1
+            self.arrived.set()
+        self._tokens[mint] = asset
+        while len(self._tokens) > self.max_tokens:
+            self._tokens.popitem(last=False)
+
+    async def _run(self) -> None:
+        backoff = self.min_backoff
+        while True:
+            try:
+                async with self._session.ws_connect(self.url, heartbeat=30) as ws:
+                    await ws.send_json(self.subscribe)
+                    self.connected = True
+                    self.connects += 1
+                    self._last_message = time.monotonic()
+                    logging.info(f"Discovery stream connected to {self.url}")
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            self._last_message = time.monotonic()
+                            backoff = self.min_backoff
+                            try:
+                                self._handle(message.json())
+                            except ValueError:
+                                logging.debug("Discovery stream sent a non-JSON frame")
+                        elif message.type == aiohttp.WSMsgType.ERROR:
+                            break
+            except asyncio.CancelledError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logging.warning(f"Discovery stream error: {str(e)}")
+            finally:
+                self.connected = False
+
+            # Jittered exponential backoff; the subscription is resent on connect
+            delay = backoff * random.uniform(0.5, 1.0)
+            logging.info(f"Discovery stream reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def stats(self) -> Dict:
+        return {
+            "healthy": self.healthy,
+            "connects": self.connects,
+            "received": self.received,
+            "duplicates": self.duplicates,
+            "window": len(self._tokens)
+        }
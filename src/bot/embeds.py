@@ -1,7 +1,9 @@
 # src/bot/embeds.py
 import discord
 import logging
-from typing import List, Dict
+from discord.ext import commands
+from typing import List, Dict, Optional
+from src.app_config import settings
 from src.bot.helpers import (
     safe_get,
     safe_number,
@@ -12,12 +14,31 @@ from src.bot.helpers import (
     truncate
 )
 
-def create_embed(meme_coins: List[Dict]) -> discord.Embed:
+def format_interval(seconds: float) -> str:
+    """Whole minutes when exact, otherwise seconds: 60 -> '1m', 90 -> '90s'"""
+    seconds = int(seconds)
+    return f"{seconds // 60}m" if seconds % 60 == 0 else f"{seconds}s"
+
+def refresh_note(min_interval: Optional[float] = None, max_interval: Optional[float] = None) -> str:
+    """Describes the adaptive scan cadence shown in the embed header"""
+    # The range rather than the current interval, so the header (and the
+    # publisher's digest) stays the same while the cadence adapts
+    low = settings.SCAN_MIN_INTERVAL if min_interval is None else min_interval
+    high = settings.SCAN_MAX_INTERVAL if max_interval is None else max_interval
+    if low >= high:
+        return f"Updated every {format_interval(low)}"
+    return f"Updated every {format_interval(low)}-{format_interval(high)}, faster when the board is busy"
+
+def create_embed(
+    meme_coins: List[Dict],
+    min_interval: Optional[float] = None,
+    max_interval: Optional[float] = None
+) -> discord.Embed:
     """Generates rich embed for meme coin display with validation"""
     embed = discord.Embed(
         title="🚀 Top Trending Solana Meme Coins",
         color=0x5865F2,
-        description="**Real-time market data (Updated every 3 minutes)**\n\u200b"
+        description=f"**Real-time market data ({refresh_note(min_interval, max_interval)})**\n\u200b"
     )
     
     thumbnail_set = False
@@ -43,6 +64,10 @@ def create_embed(meme_coins: List[Dict]) -> discord.Embed:
     )
     return embed
 
+def error_embed(message: str) -> discord.Embed:
+    """Short red embed for command failures"""
+    return discord.Embed(description=f"❌ {message}", color=0xED4245)
+
 def format_coin_data(token: Dict) -> str:
     """Safely formats token data with fallback values"""
     return (
@@ -53,8 +78,6 @@ def format_coin_data(token: Dict) -> str:
         f"▸ **Links:** [Photon]({photon_url(token)}) | [DexScreener]({dexscreener_url(token)})\n"
         f"▸ **Description:** {truncate(safe_get(token, 'description', 'No description'), 150)}"
     )
-    except KeyError as e:
-        logging.error(f"Missing key in token data: {str(e)}")
 
 def photon_url(token: Dict) -> str:
     return f"https://photon-sol.tinyastro.io/en/lp/{token.get('contract', '')}"
@@ -65,4 +88,14 @@ def dexscreener_url(token: Dict) -> str:
 def set_thumbnail(embed: discord.Embed, token: Dict) -> None:
     """Sets thumbnail if available."""
     if url := token.get("image"):
-        embed.set_thumbnail(url=url)
\ No newline at end of file
+        embed.set_thumbnail(url=url)
+
+class Embeds(commands.Cog):
+    """Embed rendering used by the scan loop and commands"""
+    def __init__(self, bot):
+        self.bot = bot
+
+    create_embed = staticmethod(create_embed)
+
+async def setup(bot):
+    await bot.add_cog(Embeds(bot))
\ No newline at end of file
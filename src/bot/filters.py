@@ -1,19 +1,146 @@
 # bot/filters.py
+import asyncio
+import copy
 import json
 import logging
+import os
 import threading
+import numpy as np
+from discord.ext import commands
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional
+from src.bot.storage import wait_for_quiet, write_json_atomic
 
 FILTERS_PATH = Path(__file__).parent.parent / 'data/filters.json'
 LOCK = threading.Lock()
+FLUSH_DELAY = 1.0  # seconds of quiet before pending changes are written
+FLUSH_MAX_DELAY = 10.0  # ...but a steady stream of changes is written at least this often
+COMPACT_EVERY = 500  # journal entries before it is folded into filters.json
+THRESHOLD_KEYS = ("min_liquidity", "min_market_cap", "max_market_cap", "min_5m_volume")
+
+def metric_columns(rows: List[Dict]) -> Dict[str, np.ndarray]:
+    """Columnar view of candidate metrics (raw Birdeye metrics or coin data)"""
+    return {
+        "liquidity": np.fromiter(
+            (row.get("liquidity", 0) for row in rows), dtype=np.float64, count=len(rows)
+        ),
+        "market_cap": np.fromiter(
+            (row.get("market_cap", 0) for row in rows), dtype=np.float64, count=len(rows)
+        ),
+        "volume_5min": np.fromiter(
+            (row.get("volume_5min", row.get("volume_24h", 0) / 288) for row in rows),
+            dtype=np.float64,
+            count=len(rows)
+        )
+    }
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, without a full sort"""
+    if k <= 0 or not len(scores):
+        return np.empty(0, dtype=np.intp)
+    if len(scores) > k:
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+class CompiledProfiles:
+    """Every channel's thresholds compiled for one shared broadcast evaluation"""
+    def __init__(self, profiles: Dict[int, Dict[str, Any]]):
+        self.channels = list(profiles)
+        thresholds = np.array(
+            [[float(profiles[channel][key]) for key in THRESHOLD_KEYS] for channel in self.channels],
+            dtype=np.float64
+        ).reshape(len(self.channels), len(THRESHOLD_KEYS))
+        # Identical profiles are collapsed and evaluated once
+        self.unique, inverse = np.unique(thresholds, axis=0, return_inverse=True)
+        self.inverse = inverse.reshape(-1)
+
+    def _matrix(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Unique profiles x candidates boolean matrix"""
+        t = self.unique
+        return (
+            (columns["liquidity"][None, :] >= t[:, 0:1])
+            & (columns["market_cap"][None, :] >= t[:, 1:2])
+            & (columns["market_cap"][None, :] <= t[:, 2:3])
+            & (columns["volume_5min"][None, :] >= t[:, 3:4])
+        )
+
+    def any_mask(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Candidates that pass at least one profile"""
+        return self._matrix(columns).any(axis=0)
+
+    def top_k(self, columns: Dict[str, np.ndarray], k: int, score: str = "volume_5min") -> Dict[int, np.ndarray]:
+        """Best-first indices of each channel's top k passing candidates"""
+        scores = columns[score]
+        picks = []
+        for row in self._matrix(columns):
+            passing = np.flatnonzero(row)
+            picks.append(passing[top_k(scores[passing], k)])
+        return {channel: picks[self.inverse[i]] for i, channel in enumerate(self.channels)}
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+class FilterSnapshot:
+    """Immutable, versioned view of the filter configuration"""
+    __slots__ = ("version", "data")
+
+    def __init__(self, version: int, filters: Dict[str, Any]):
+        self.version = version
+        self.data = _freeze(filters)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable deep copy"""
+        return _thaw(self.data)
+
+def journal_path() -> Path:
+    return FILTERS_PATH.with_name(FILTERS_PATH.stem + '.journal')
+
+def apply_change(filters: Dict[str, Any], change: Dict[str, Any]) -> None:
+    """Replay one journal entry onto a filters dict (idempotent)"""
+    *parents, key = change["path"]
+    node = filters
+    for part in parents:
+        node = node.setdefault(part, {})
+    if change["op"] == "append":
+        items = node.setdefault(key, [])
+        if change["value"] not in items:
+            items.append(change["value"])
+    else:
+        node[key] = change["value"]
 
 class FilterSystem:
     """Thread-safe filter management system"""
+    # Readers never take LOCK: writers edit a private working copy under it
+    # and swap in a new immutable FilterSnapshot
     def __init__(self):
+        self._pending: List[Dict[str, Any]] = []
+        self._journal_size = 0
+        self._io_lock = threading.Lock()
+        self.on_change: Optional[Callable[[], None]] = None
         self._filters = self._load_filters()
         self._defaults = self._get_default_filters()
+        self._snapshot = FilterSnapshot(0, self._filters)
+        self._compiled_profiles = None
         
     def _load_filters(self) -> Dict[str, Any]:
         """Load filters with atomic read and validation"""
@@ -24,6 +151,7 @@ class FilterSystem:
                     
                 raw_data = FILTERS_PATH.read_text(encoding='utf-8')
                 filters = json.loads(raw_data)
+                self._replay_journal(filters)
                 return self._validate_filters(filters)
                 
             except json.JSONDecodeError:
@@ -31,22 +159,84 @@ class FilterSystem:
                 return self._reset_to_defaults()
             except Exception as e:
                 logging.critical(f"Filter load failure: {str(e)}")
-                return self._get_default_filters()
+                return self._validate_filters(self._get_default_filters())
 
     def _validate_filters(self, filters: Dict) -> Dict:
         """Ensure all required filter keys exist"""
-        required_keys = self._get_default_filters().keys()
-        return {
+        validated = {
             key: filters.get(key, default)
             for key, default in self._get_default_filters().items()
         }
 
+        profiles = {}
+        for guild_id, profile in filters.get("profiles", {}).items():
+            clean = {key: profile.get(key, validated[key]) for key in THRESHOLD_KEYS}
+            clean["channel_id"] = profile.get("channel_id")
+            profiles[str(guild_id)] = clean
+        validated["profiles"] = profiles
+
+        # Older files kept guild watchlists as top-level lists
+        watchlists = dict(filters.get("watchlists", {}))
+        for key, value in filters.items():
+            if isinstance(value, list):
+                watchlists.setdefault(key, value)
+        validated["watchlists"] = watchlists
+        return validated
+
     def _reset_to_defaults(self) -> Dict:
         """Reset filters and return defaults"""
-        defaults = self._get_default_filters()
+        defaults = self._validate_filters(self._get_default_filters())
         self._save_filters(defaults)
         return defaults
 
+    def _replay_journal(self, filters: Dict[str, Any]) -> None:
+        """Apply journaled changes made since the last snapshot"""
+        path = journal_path()
+        if not path.exists():
+            return
+        for line in path.read_text(encoding='utf-8').splitlines():
+            try:
+                apply_change(filters, json.loads(line))
+                self._journal_size += 1
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logging.warning("Skipping corrupt filter journal entry")
+
+    def _record(self, op: str, path: List[str], value: Any) -> None:
+        """Queue a change for the write-behind flush (call with LOCK held)"""
+        self._pending.append({"op": op, "path": path, "value": copy.deepcopy(value)})
+        if self.on_change:
+            self.on_change()
+
+    def flush(self) -> int:
+        """Write queued changes to disk; blocking, so run it off the event loop"""
+        with self._io_lock:
+            with LOCK:
+                pending, self._pending = self._pending, []
+                snapshot = self._snapshot
+            if not pending:
+                return 0
+
+            # Changes are appended to the journal, which is periodically compacted
+            # into a fresh filters.json, so a change costs O(change) on disk
+            compact = self._journal_size + len(pending) >= COMPACT_EVERY
+            try:
+                if compact:
+                    self._save_filters(snapshot.to_dict())
+                    journal_path().write_text('', encoding='utf-8')
+                    self._journal_size = 0
+                else:
+                    with journal_path().open('a', encoding='utf-8') as journal:
+                        journal.writelines(json.dumps(change) + '\n' for change in pending)
+                        journal.flush()
+                        os.fsync(journal.fileno())
+                    self._journal_size += len(pending)
+            except Exception as e:
+                logging.error(f"Filter flush failed: {str(e)}")
+                with LOCK:
+                    self._pending = pending + self._pending
+                raise
+            return len(pending)
+
     def _create_initial_filters(self):
         """Initialize filters file with defaults"""
         FILTERS_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -55,36 +245,99 @@ class FilterSystem:
     def _save_filters(self, filters: Dict) -> None:
         """Atomic filter persistence"""
         try:
-            with NamedTemporaryFile(
-                mode='w',
-                encoding='utf-8',
-                dir=FILTERS_PATH.parent,
-                delete=False
-            ) as tmp:
-                json.dump(filters, tmp, indent=2)
-                
-            Path(tmp.name).replace(FILTERS_PATH)
+            write_json_atomic(FILTERS_PATH, filters)
         except Exception as e:
             logging.error(f"Filter save failed: {str(e)}")
             raise RuntimeError(f"Critical filter save error: {str(e)}") from e
 
+    @property
+    def version(self) -> int:
+        """Bumped by every change; compare to detect stale compiled filters"""
+        return self._snapshot.version
+
+    def get_snapshot(self) -> FilterSnapshot:
+        """Current immutable configuration (lock-free)"""
+        return self._snapshot
+
     def get_filters(self) -> Dict[str, Any]:
         """Get current filter values"""
-        with LOCK:
-            return self._filters.copy()
+        return self._snapshot.to_dict()
+
+    def get_profile(self, guild_id: Optional[str] = None) -> Dict[str, Any]:
+        """Thresholds for a guild, falling back to the global values"""
+        snapshot = self._snapshot
+        profile = {key: snapshot[key] for key in THRESHOLD_KEYS}
+        profile["channel_id"] = None
+        if guild_id is not None:
+            profile.update(snapshot["profiles"].get(str(guild_id), {}))
+        return profile
 
-    def update_filter(self, key: str, value: Any) -> None:
+    def compile_profiles(self, default_channel_id: int, default_guild_id: Optional[int] = None) -> CompiledProfiles:
+        """Compile every publishable profile, keyed by channel"""
+        snapshot = self._snapshot
+        key = (snapshot.version, default_channel_id, default_guild_id)
+        cached = self._compiled_profiles
+        if cached is None or cached[0] != key:
+            profiles = {default_channel_id: {name: snapshot[name] for name in THRESHOLD_KEYS}}
+            for guild_id, profile in snapshot["profiles"].items():
+                channel_id = profile.get("channel_id")
+                # The default guild's profile without a channel overrides the globals
+                if channel_id is None and str(guild_id) == str(default_guild_id):
+                    channel_id = default_channel_id
+                if channel_id is not None:
+                    profiles[channel_id] = profile
+            cached = self._compiled_profiles = (key, CompiledProfiles(profiles))
+        return cached[1]
+
+    def update_filter(self, key: str, value: Any, guild_id: Optional[str] = None) -> None:
         """Thread-safe filter update"""
+        self.update_filters({key: value}, guild_id)
+
+    def update_filters(self, updates: Dict[str, Any], guild_id: Optional[str] = None) -> None:
+        """Apply several threshold changes at once, globally or for one guild"""
         with LOCK:
             try:
-                self._filters[key] = self._validate_value(key, value)
-                self._save_filters(self._filters)
+                if guild_id is None:
+                    target = self._filters
+                else:
+                    target = self._filters["profiles"].get(str(guild_id))
+                    if target is None:
+                        target = {key: self._filters[key] for key in THRESHOLD_KEYS}
+                        target["channel_id"] = None
+                merged = {**target}
+                for key, value in updates.items():
+                    self._validate_value(key, value)
+                    merged[key] = value
+                self._validate_range(merged)
+
+                target.update(updates)
+                if guild_id is None:
+                    for key, value in updates.items():
+                        self._record("set", [key], value)
+                else:
+                    self._filters["profiles"][str(guild_id)] = target
+                    self._record("set", ["profiles", str(guild_id)], target)
+                self._publish()
             except ValueError as e:
                 logging.error(f"Invalid filter value: {str(e)}")
                 raise
 
+    def set_channel(self, guild_id: str, channel_id: Optional[int]) -> None:
+        """Choose where a guild's top coins are published"""
+        with LOCK:
+            profile = self._filters["profiles"].setdefault(
+                str(guild_id), {key: self._filters[key] for key in THRESHOLD_KEYS}
+            )
+            profile["channel_id"] = channel_id
+            self._record("set", ["profiles", str(guild_id)], profile)
+            self._publish()
+
+    def _publish(self) -> None:
+        """Swap in a new snapshot of the working copy (call with LOCK held)"""
+        self._snapshot = FilterSnapshot(self._snapshot.version + 1, self._filters)
+
     def _validate_value(self, key: str, value: Any) -> Any:
-        """Type and range validation"""
+        """Type validation"""
         defaults = self._get_default_filters()
         
         if key not in defaults:
@@ -93,15 +346,13 @@ class FilterSystem:
         if not isinstance(value, type(defaults[key])):
             raise TypeError(f"Invalid type for {key} - expected {type(defaults[key])}")
             
-        # Special validation for ranges
-        if key == "min_market_cap" and value >= self._filters["max_market_cap"]:
-            raise ValueError("Min market cap must be less than max")
-            
-        if key == "max_market_cap" and value <= self._filters["min_market_cap"]:
-            raise ValueError("Max market cap must be greater than min")
-            
         return value
 
+    def _validate_range(self, values: Dict[str, Any]) -> None:
+        """Special validation for ranges"""
+        if values["min_market_cap"] >= values["max_market_cap"]:
+            raise ValueError("Min market cap must be less than max")
+
     def _get_default_filters(self) -> Dict[str, int]:
         """Original default values preserved"""
         return {
@@ -114,7 +365,66 @@ class FilterSystem:
     def add_filter(self, guild_id: str, token_address: str) -> None:
         """Original filter addition logic preserved"""
         with LOCK:
-            guild_filters = self._filters.setdefault(guild_id, [])
+            guild_filters = self._filters["watchlists"].setdefault(str(guild_id), [])
             if token_address not in guild_filters:
                 guild_filters.append(token_address)
-                self._save_filters(self._filters)
\ No newline at end of file
+                self._record("append", ["watchlists", str(guild_id)], token_address)
+                self._publish()
+
+class Filters(commands.Cog):
+    """Shares one FilterSystem between the scan pipeline and commands"""
+    def __init__(self, bot):
+        self.bot = bot
+        # On a hot reload the instance being replaced left its FilterSystem here,
+        # so snapshot versions keep counting instead of restarting at 0
+        state = bot.handoffs.get(self.qualified_name)
+        self.system = state["system"] if state else FilterSystem()
+        self._dirty = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self.system.on_change = self._dirty.set
+
+    def handoff(self) -> Dict:
+        """Release the FilterSystem to the instance replacing this one"""
+        return {"system": self.system}
+
+    def adopt(self, state: Dict) -> None:
+        self.system = state["system"]
+        self.system.on_change = self._dirty.set
+
+    async def cog_load(self):
+        self.bot.handoffs.pop(self.qualified_name, None)
+        self._writer = asyncio.create_task(self._write_behind())
+
+    async def cog_unload(self):
+        if self._writer:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        await asyncio.to_thread(self.system.flush)
+
+    async def _write_behind(self):
+        """Debounced flush of queued filter changes in a worker thread"""
+        while True:
+            await self._dirty.wait()
+            await wait_for_quiet(self._dirty, FLUSH_DELAY, FLUSH_MAX_DELAY)
+            try:
+                await asyncio.to_thread(self.system.flush)
+            except Exception:
+                await asyncio.sleep(FLUSH_DELAY)
+                self._dirty.set()
+
+    @property
+    def version(self) -> int:
+        return self.system.version
+
+    def get_snapshot(self) -> FilterSnapshot:
+        return self.system.get_snapshot()
+
+    def get_filters(self) -> Dict[str, Any]:
+        return self.system.get_filters()
+
+    def compile_profiles(self, default_channel_id: int, default_guild_id: Optional[int] = None) -> CompiledProfiles:
+        return self.system.compile_profiles(default_channel_id, default_guild_id)
+
+async def setup(bot):
+    await bot.add_cog(Filters(bot))
\ No newline at end of file
@@ -0,0 +1,81 @@
+# bot/http_pool.py
+import aiohttp
+import logging
+from typing import Dict, Optional
+
+class ConnectionStats:
+    """Connection counters collected through aiohttp request tracing"""
+    def __init__(self):
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_lookups = 0
+        self.dns_cache_hits = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "dns_lookups": self.dns_lookups,
+            "dns_cache_hits": self.dns_cache_hits
+        }
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Hook the counters into a session's request lifecycle"""
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._count("requests"))
+        trace.on_connection_create_end.append(self._count("connections_created"))
+        trace.on_connection_reuseconn.append(self._count("connections_reused"))
+        trace.on_dns_resolvehost_end.append(self._count("dns_lookups"))
+        trace.on_dns_cache_hit.append(self._count("dns_cache_hits"))
+        return trace
+
+    def _count(self, field: str):
+        async def handler(session, context, params):
+            setattr(self, field, getattr(self, field) + 1)
+        return handler
+
+class HTTPPool:
+    """Long-lived keep-alive session shared by every provider call"""
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30.0
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.stats = ConnectionStats()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            raise RuntimeError("HTTP pool is not started")
+        return self._session
+
+    async def start(self) -> aiohttp.ClientSession:
+        """Open the pooled session (idempotent)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[self.stats.trace_config()]
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close pooled connections (idempotent)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logging.info(f"HTTP pool closed: {self.stats.as_dict()}")
+        self._session = None
@@ -0,0 +1,133 @@
+# bot/logs.py
+import atexit
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+LOG_PATH = Path(__file__).parent.parent / 'data/bot.log'
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[QueueHandler] = None
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "where": f"{record.module}:{record.lineno}"
+        }
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class DebugRateLimit(logging.Filter):
+    """Caps low-level records to `burst` per call site per `window` seconds"""
+    def __init__(self, burst: int = 20, window: float = 60.0, level: int = logging.DEBUG):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.level = level
+        self.dropped = 0
+        # Call site -> [window start, records passed, records suppressed]
+        self._sites: Dict[Tuple[str, int], List] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        key = (record.pathname, record.lineno)
+        site = self._sites.get(key)
+        if site is None or record.created - site[0] >= self.window:
+            # The first record of a new window reports what was muted in the last
+            if site and site[2]:
+                record.suppressed = site[2]
+            self._sites[key] = [record.created, 1, 0]
+            return True
+        if site[1] < self.burst:
+            site[1] += 1
+            return True
+        site[2] += 1
+        self.dropped += 1
+        return False
+
+class DeferredHandler(QueueHandler):
+    """Hands records to the listener thread with message and traceback resolved"""
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        # Unlike the stock QueueHandler, keep the traceback out of the message
+        # so the JSON formatter stores it as its own field
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = message
+        record.message = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+def setup_logging(
+    level: Union[int, str] = logging.INFO,
+    path: Path = LOG_PATH,
+    max_bytes: int = 10 * 1024 * 1024,
+    backups: int = 5,
+    debug_burst: int = 20,
+    debug_window: float = 60.0,
+    console: bool = True
+) -> QueueListener:
+    """Route the root logger through a queue to a background writer thread"""
+    global _listener, _handler
+    if _listener is not None:
+        return _listener
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+    handlers = [file_handler]
+    if console:
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handlers.append(stream)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _handler = DeferredHandler(records)
+    _handler.addFilter(DebugRateLimit(debug_burst, debug_window))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(_handler)
+    root.setLevel(level)
+
+    # Callers only pay for filtering and enqueueing; formatting and I/O happen here
+    _listener = QueueListener(records, *handlers)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _listener, _handler
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,124 @@
+# bot/metadata_store.py
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+METADATA_PATH = Path(__file__).parent.parent / 'data/metadata.db'
+FIELDS = ("name", "symbol", "image", "description")
+
+class MetadataStore:
+    """SQLite-backed store for slow-changing token metadata keyed by mint"""
+    def __init__(self, path: Path = METADATA_PATH, max_age: float = 7 * 86400):
+        self.path = Path(path)
+        self.max_age = max_age
+        # Every row is loaded on open, so a cold process starts warm
+        self._rows: Dict[str, Dict[str, str]] = {}
+        # Staged writes, flushed in one transaction per tick off the event loop
+        self._dirty: Dict[str, float] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._last_expiry = 0.0
+
+    def open(self) -> None:
+        """Open the database in WAL mode, expire old rows and warm the cache"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS token_metadata ("
+            "mint TEXT PRIMARY KEY, name TEXT, symbol TEXT, image TEXT, "
+            "description TEXT, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_metadata_age ON token_metadata(updated_at)"
+        )
+        self.expire()
+
+        rows = self._conn.execute(f"SELECT mint, {', '.join(FIELDS)} FROM token_metadata")
+        for mint, *values in rows:
+            self._rows[mint] = {
+                field: value for field, value in zip(FIELDS, values) if value is not None
+            }
+        logging.info(f"Metadata store warmed with {len(self._rows)} tokens")
+
+    def get(self, mint: str) -> Optional[Dict[str, str]]:
+        return self._rows.get(mint)
+
+    def get_many(self, mints: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        return {mint: self._rows[mint] for mint in mints if mint in self._rows}
+
+    def stage(self, mint: str, **fields: str) -> None:
+        """Merge fields into the in-memory row; persisted on the next flush"""
+        values = {key: value for key, value in fields.items() if key in FIELDS and value}
+        if not values:
+            return
+        row = self._rows.setdefault(mint, {})
+        if all(row.get(key) == value for key, value in values.items()):
+            return
+        row.update(values)
+        self._dirty[mint] = time.time()
+
+    async def flush(self) -> int:
+        """Write staged rows in a single transaction off the event loop"""
+        if not self._dirty or self._conn is None:
+            return 0
+        dirty, self._dirty = self._dirty, {}
+        batch = [
+            (mint, *(self._rows[mint].get(field) for field in FIELDS), updated_at)
+            for mint, updated_at in dirty.items()
+        ]
+        try:
+            expired = await asyncio.to_thread(self._write, batch)
+        except Exception:
+            # Keep the batch for the next flush; rows staged meanwhile are newer
+            for mint, updated_at in dirty.items():
+                self._dirty.setdefault(mint, updated_at)
+            raise
+        self._forget(expired)
+        return len(batch)
+
+    def _write(self, batch: list) -> List[str]:
+        """Runs in a worker thread; returns expired mints for the loop to forget"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO token_metadata "
+                f"(mint, {', '.join(FIELDS)}, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                batch
+            )
+        if time.time() - self._last_expiry > 3600:
+            return self._delete_expired()
+        return []
+
+    def expire(self) -> int:
+        """Delete rows not refreshed within max_age"""
+        expired = self._delete_expired()
+        self._forget(expired)
+        return len(expired)
+
+    def _delete_expired(self) -> List[str]:
+        cutoff = time.time() - self.max_age
+        with self._lock, self._conn:
+            expired = [
+                mint for (mint,) in self._conn.execute(
+                    "SELECT mint FROM token_metadata WHERE updated_at < ?", (cutoff,)
+                )
+            ]
+            self._conn.execute("DELETE FROM token_metadata WHERE updated_at < ?", (cutoff,))
+        self._last_expiry = time.time()
+        return expired
+
+    def _forget(self, mints: List[str]) -> None:
+        # A mint restaged since the delete keeps its row; the next flush writes it back
+        for mint in mints:
+            if mint not in self._dirty:
+                self._rows.pop(mint, None)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
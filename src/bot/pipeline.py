@@ -0,0 +1,34 @@
+# bot/pipeline.py
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional
+
+
+async def fan_out(
+    keys: Iterable[Hashable],
+    worker: Callable[[Hashable], Awaitable[Any]],
+    deadline: Optional[float] = None
+) -> Dict[Hashable, Any]:
+    """Run worker(key) concurrently and keep whatever finishes before the deadline"""
+    # `deadline` is an absolute event loop time; late and failed keys are left out
+    loop = asyncio.get_running_loop()
+    tasks = {asyncio.ensure_future(worker(key)): key for key in keys}
+    if not tasks:
+        return {}
+
+    timeout = None if deadline is None else max(deadline - loop.time(), 0)
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logging.warning(f"Tick deadline hit: {len(pending)}/{len(tasks)} fetches dropped")
+
+    results = {}
+    for task in done:
+        if task.exception() is not None:
+            logging.warning(f"Fetch failed for {tasks[task]}: {task.exception()}")
+            continue
+        results[tasks[task]] = task.result()
+    return results
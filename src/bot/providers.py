@@ -0,0 +1,59 @@
+# bot/providers.py
+# Process-wide limiters and breakers. They live outside the reloadable
+# bot.utils extension, so /reload keeps spent quota, adaptive rates and
+# open breakers instead of starting fresh.
+from src.app_config import settings
+from src.bot.ratelimit import RateLimiter
+from src.bot.resilience import CircuitBreaker
+from src.bot.telemetry import REGISTRY, Counter, Gauge
+
+HELIUS_RL = RateLimiter(120, settings.HELIUS_CONCURRENCY)  # Helius 120 RPM limit
+BIRDEYE_RL = RateLimiter(60, settings.BIRDEYE_CONCURRENCY)  # BirdEye 60 RPM limit
+JUPITER_RL = RateLimiter(600, settings.JUPITER_CONCURRENCY)  # Jupiter 600 RPM limit
+
+def _breaker(name: str) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        failure_ratio=settings.BREAKER_FAILURE_RATIO,
+        window=settings.BREAKER_WINDOW,
+        min_calls=settings.BREAKER_MIN_CALLS,
+        reset_timeout=settings.BREAKER_RESET_SECONDS
+    )
+
+HELIUS_CB = _breaker("Helius")
+BIRDEYE_CB = _breaker("Birdeye")
+JUPITER_CB = _breaker("Jupiter")
+PUMPFUN_CB = _breaker("pump.fun")
+
+LIMITERS = {"Helius": HELIUS_RL, "Birdeye": BIRDEYE_RL, "Jupiter": JUPITER_RL}
+BREAKERS = (HELIUS_CB, BIRDEYE_CB, JUPITER_CB, PUMPFUN_CB)
+
+def apply_settings() -> None:
+    """Push reloaded breaker thresholds into the live breakers"""
+    # Concurrency caps and the breaker window size apply on restart
+    for breaker in BREAKERS:
+        breaker.failure_ratio = settings.BREAKER_FAILURE_RATIO
+        breaker.min_calls = settings.BREAKER_MIN_CALLS
+        breaker.reset_timeout = settings.BREAKER_RESET_SECONDS
+
+def collect_provider_metrics():
+    """Scrape-time view of limiter and breaker state"""
+    label = ("provider",)
+    waited = Counter("ratelimit_wait_seconds_total", "Time spent waiting for a token", label)
+    waits = Counter("ratelimit_waits_total", "Calls that had to wait for a token", label)
+    calls = Counter("ratelimit_calls_total", "Calls through the limiter", label)
+    rate = Gauge("ratelimit_rate_per_minute", "Current adaptive request rate", label)
+    for provider, limiter in LIMITERS.items():
+        waited.inc(limiter.total_wait, provider=provider)
+        waits.inc(limiter.waits, provider=provider)
+        calls.inc(limiter.calls, provider=provider)
+        rate.set(limiter.rate * 60, provider=provider)
+
+    state = Gauge("provider_circuit_open", "1 while the breaker is open or probing", label)
+    rejected = Counter("provider_circuit_rejected_total", "Calls failed fast by the breaker", label)
+    for breaker in BREAKERS:
+        state.set(int(breaker.state != breaker.CLOSED), provider=breaker.name)
+        rejected.inc(breaker.rejected, provider=breaker.name)
+    return [waited, waits, calls, rate, state, rejected]
+
+REGISTRY.collector("providers", collect_provider_metrics)
@@ -0,0 +1,240 @@
+# bot/publisher.py
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import discord
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from src.bot.ratelimit import RateLimiter
+from src.bot.storage import wait_for_quiet, write_json_atomic
+from src.bot.telemetry import PUBLISH_LATENCY
+from src.bot.tracing import attach, current_trace, span
+
+MESSAGES_PATH = Path(__file__).parent.parent / 'data/messages.json'
+FLUSH_DELAY = 1.0  # seconds of quiet before changed handles are written
+FLUSH_MAX_DELAY = 10.0  # ...but a steady stream of publishes is saved at least this often
+
+def render_digest(content: Optional[str], embed: Optional[discord.Embed]) -> str:
+    """Stable hash of everything a message shows"""
+    rendered = {"content": content, "embed": embed.to_dict() if embed else None}
+    raw = json.dumps(rendered, sort_keys=True, default=str).encode()
+    return hashlib.sha256(raw).hexdigest()
+
+class EmbedPublisher:
+    """Keeps one bot-owned message per channel up to date"""
+    def __init__(self, path: Path = MESSAGES_PATH):
+        self.path = Path(path)
+        # Message ID and rendered digest per channel, so a restart needs neither
+        # a history lookup nor an identical edit
+        self._handles: Dict[str, Dict] = self._load()
+        # Publishes only mark the handles dirty; one write-behind task saves them,
+        # so concurrent publishes never race and a tick costs a single write
+        self._dirty = False
+        self._wake = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._writing = False
+        self._closing = False
+        self.edits = 0
+        self.sends = 0
+        self.skipped = 0
+        self.saves = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            logging.error(f"Message handle load failed: {str(e)}")
+            return {}
+
+    def _save(self, handles: Dict[str, Dict]) -> None:
+        write_json_atomic(self.path, handles)
+
+    def start(self) -> None:
+        """Start the write-behind task (idempotent)"""
+        self._closing = False
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_behind())
+
+    async def close(self) -> None:
+        """Stop the writer and persist anything still pending"""
+        self._closing = True
+        if self._writer:
+            # A write in progress is allowed to finish rather than being abandoned
+            if not self._writing:
+                self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        await self._write()
+
+    async def _write(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await asyncio.to_thread(self._save, dict(self._handles))
+            self.saves += 1
+        except Exception as e:
+            self._dirty = True
+            self._wake.set()
+            logging.error(f"Message handle save failed: {str(e)}")
+
+    async def _write_behind(self) -> None:
+        """The only caller of _save while running, so writes never overlap"""
+        while not self._closing:
+            await self._wake.wait()
+            await wait_for_quiet(self._wake, FLUSH_DELAY, FLUSH_MAX_DELAY)
+            self._writing = True
+            try:
+                await self._write()
+            finally:
+                self._writing = False
+
+    async def publish(
+        self,
+        channel: discord.abc.Messageable,
+        content: Optional[str] = None,
+        embed: Optional[discord.Embed] = None
+    ) -> str:
+        """Edit the owned message, send a new one, or skip; returns which"""
+        key = str(channel.id)
+        digest = render_digest(content, embed)
+        handle = self._handles.get(key)
+
+        if handle and handle["digest"] == digest:
+            self.skipped += 1
+            return "skipped"
+
+        action = "sent"
+        message_id = None
+        if handle:
+            try:
+                await channel.get_partial_message(handle["message_id"]).edit(content=content, embed=embed)
+                message_id = handle["message_id"]
+                action = "edited"
+            except discord.NotFound:
+                logging.info(f"Owned message in {key} was deleted; sending a new one")
+
+        if message_id is None:
+            message = await channel.send(content=content, embed=embed)
+            message_id = message.id
+
+        if action == "edited":
+            self.edits += 1
+        else:
+            self.sends += 1
+        self._handles[key] = {"message_id": message_id, "digest": digest}
+        self._dirty = True
+        self._wake.set()
+        return action
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "edits": self.edits,
+            "sends": self.sends,
+            "skipped": self.skipped,
+            "saves": self.saves
+        }
+
+class PublishScheduler:
+    """Fans publish jobs out to many channels without blocking the scan"""
+    def __init__(self, publisher: EmbedPublisher, concurrency: int = 8, per_second: float = 40):
+        self.publisher = publisher
+        self.concurrency = concurrency
+        # Channels publish concurrently under one global token bucket
+        self._limiter = RateLimiter(int(per_second * 60), max_concurrency=concurrency, burst=concurrency)
+        self._queue: "asyncio.Queue[int]" = asyncio.Queue()
+        # At most one queued job per channel; a newer update replaces it
+        self._pending: Dict[int, tuple] = {}
+        # Discord buckets message routes per channel, so one request in flight each
+        self._active: Set[int] = set()
+        self._workers: List[asyncio.Task] = []
+        self.submitted = 0
+        self.superseded = 0
+        self.failed = 0
+
+    def submit(
+        self,
+        channel: discord.abc.Messageable,
+        content: Optional[str] = None,
+        embed: Optional[discord.Embed] = None
+    ) -> None:
+        """Queue the latest content for a channel (returns immediately)"""
+        self.submitted += 1
+        # The Discord call is recorded as a "publish" span of the submitting tick
+        trace = current_trace()
+        if trace:
+            trace.hold()
+        if channel.id in self._pending:
+            self.superseded += 1
+            self._release(self._pending[channel.id])
+        elif channel.id not in self._active:
+            self._queue.put_nowait(channel.id)
+        self._pending[channel.id] = (channel, content, embed, trace, time.monotonic())
+
+    @staticmethod
+    def _release(job: tuple) -> None:
+        trace = job[3]
+        if trace:
+            trace.release()
+
+    async def start(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+            ]
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for job in self._pending.values():
+            self._release(job)
+        self._pending.clear()
+
+    async def join(self) -> None:
+        """Wait until every queued job has been published"""
+        await self._queue.join()
+
+    async def _worker(self) -> None:
+        while True:
+            channel_id = await self._queue.get()
+            job = None
+            try:
+                job = self._pending.pop(channel_id, None)
+                if job is None:
+                    continue
+                self._active.add(channel_id)
+                channel, content, embed, trace, queued_at = job
+                with attach(trace), span("publish", channel=channel_id) as attrs:
+                    async with self._limiter:
+                        started = time.monotonic()
+                        action = await self.publisher.publish(channel, content=content, embed=embed)
+                    attrs.update(action=action, queued=round(started - queued_at, 4))
+                PUBLISH_LATENCY.observe(time.monotonic() - started, action=action)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"Publish to {channel_id} failed: {str(e)}")
+            finally:
+                if job:
+                    self._release(job)
+                self._active.discard(channel_id)
+                # An update that arrived mid-flight waited for this one to finish
+                if channel_id in self._pending:
+                    self._queue.put_nowait(channel_id)
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self._pending),
+            "submitted": self.submitted,
+            "superseded": self.superseded,
+            "failed": self.failed,
+            **self.publisher.stats()
+        }
\ No newline at end of file
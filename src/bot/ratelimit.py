@@ -0,0 +1,137 @@
+# bot/ratelimit.py
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+class RateLimiter:
+    """Async token-bucket rate limiter that adapts to provider feedback"""
+    def __init__(
+        self,
+        calls_per_minute: int,
+        max_concurrency: Optional[int] = None,
+        burst: Optional[int] = None
+    ):
+        self.calls_per_minute = calls_per_minute
+        self.max_rate = calls_per_minute / 60.0
+        self.min_rate = self.max_rate / 20
+        self.rate = self.max_rate
+        self.capacity = burst or max(1, calls_per_minute // 10)
+        self.semaphore = asyncio.Semaphore(max_concurrency or calls_per_minute)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+        self.calls = 0
+        self.waits = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def __aenter__(self):
+        # Reserved synchronously and slept on alone, so a throttled caller blocks nobody else
+        wait = self._reserve()
+        self.calls += 1
+        if wait > 0:
+            self.waits += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
+        return await self.semaphore.acquire()
+
+    async def __aexit__(self, *args):
+        self.semaphore.release()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it"""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        debt_wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(debt_wait, self._blocked_until - now)
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """Adjust the rate from a provider response"""
+        now = time.monotonic()
+        self._refill(now)
+
+        if status == 429:
+            self.throttled += 1
+            retry_after = _parse_retry_after(headers.get("Retry-After"))
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self._blocked_until = max(self._blocked_until, now + pause)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            logging.warning(f"Provider throttled us; backing off {pause:.1f}s")
+            return
+
+        remaining = _header_number(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            if reset > 1e9:  # epoch timestamp rather than seconds
+                reset -= time.time()
+            reset = max(reset, 0.0)
+            if remaining <= 0:
+                self._blocked_until = max(self._blocked_until, now + reset)
+            elif reset > 0:
+                self.rate = min(self.max_rate, max(self.min_rate, remaining / reset))
+            return
+
+        # Additive recovery towards the configured ceiling
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def remaining_fraction(self) -> float:
+        """Share of the burst budget currently available (0.0 - 1.0)"""
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return 0.0
+        self._refill(now)
+        return max(self._tokens, 0.0) / self.capacity
+
+    def headroom(self) -> float:
+        """Share of the configured rate the provider currently allows (0.0 - 1.0)"""
+        # Unlike the burst budget this does not dip after every busy tick
+        if time.monotonic() < self._blocked_until:
+            return 0.0
+        return self.rate / self.max_rate
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "waits": self.waits,
+            "throttled": self.throttled,
+            "total_wait": round(self.total_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "avg_wait": round(self.total_wait / self.waits, 3) if self.waits else 0.0,
+            "rate_per_minute": round(self.rate * 60, 1)
+        }
+
+def _header_number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,142 @@
+# bot/resilience.py
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+class LatencyTracker:
+    """Rolling window of successful call latencies"""
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+class CircuitBreaker:
+    """Per-provider breaker over a rolling window of call outcomes"""
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.latency = LatencyTracker()
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_at: Optional[float] = None
+
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        # Open until reset_timeout passes, then half-open for a single probe
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_at = None
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (claims the probe when half-open)"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        # A probe whose caller vanished without reporting is written off
+        if state == self.HALF_OPEN and (
+            self._probe_at is None or now - self._probe_at >= self.reset_timeout
+        ):
+            self._probe_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        if latency is not None:
+            self.latency.observe(latency)
+        # The probe's success closes the breaker
+        if self._state == self.HALF_OPEN:
+            self._outcomes.clear()
+            self._state = self.CLOSED
+            logging.info(f"{self.name} circuit closed")
+        elif self._state == self.CLOSED:
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        if self._state == self.HALF_OPEN:
+            self._trip()
+        elif self._state == self.CLOSED:
+            self._outcomes.append(False)
+            # Opens once min_calls outcomes hold at least failure_ratio failures
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_ratio
+            ):
+                self._trip()
+
+    def _trip(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        logging.warning(f"{self.name} circuit open for {self.reset_timeout:.0f}s")
+
+    def hedge_delay(self, percentile: float = 95, floor: float = 0.25, default: float = 2.0) -> float:
+        """How long to wait before sending a backup request"""
+        if len(self.latency) < self.min_calls:
+            return default
+        return max(floor, self.latency.percentile(percentile))
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "p95": self.latency.percentile(95)
+        }
+
+async def hedged(call: Callable[[], Awaitable[T]], delay: float, hedges: int = 1) -> T:
+    """Run `call()`, adding a backup copy whenever it is slower than `delay`"""
+    # The first success wins and the rest are cancelled; if all fail, the last error is raised
+    pending = {asyncio.ensure_future(call())}
+    launched = 1
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            timeout = delay if launched <= hedges else None
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+            # An attempt that failed early starts its backup straight away
+            if launched <= hedges and (not done or not pending):
+                pending.add(asyncio.ensure_future(call()))
+                launched += 1
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,72 @@
+# bot/scan_state.py
+import hashlib
+import json
+import time
+from typing import Dict, Hashable, List, Optional
+
+class TokenState:
+    """What the previous ticks learned about one mint"""
+    __slots__ = ("fingerprint", "refreshed_at", "coin")
+
+    def __init__(self, fingerprint: str, refreshed_at: float, coin: Optional[Dict]):
+        self.fingerprint = fingerprint
+        self.refreshed_at = refreshed_at
+        self.coin = coin
+
+class ScanState:
+    """Scan results carried between ticks, keyed by mint"""
+    def __init__(self, refresh_interval: float = 300):
+        self.refresh_interval = refresh_interval
+        self._tokens: Dict[str, TokenState] = {}
+        self._filters_version: Optional[Hashable] = None
+
+    @staticmethod
+    def fingerprint(token: Dict) -> str:
+        """Cheap digest of the discovery fields that feed scoring"""
+        content = token.get("content", {})
+        token_info = token.get("token_info", {})
+        inputs = (
+            content.get("metadata", {}).get("name"),
+            content.get("metadata", {}).get("symbol"),
+            [file.get("uri") for file in content.get("files", [])],
+            token_info.get("supply"),
+            token_info.get("price_info", {}).get("price_per_token")
+        )
+        raw = json.dumps(inputs, default=str).encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def track_filters(self, version: Hashable) -> None:
+        """Force a full rescore when the filter configuration version changes"""
+        if version != self._filters_version:
+            self._filters_version = version
+            self._tokens.clear()
+
+    def dirty(self, candidates: Dict[str, Dict], now: Optional[float] = None) -> List[str]:
+        """Mints that need work this tick; drops mints no longer discovered"""
+        now = time.monotonic() if now is None else now
+        for mint in set(self._tokens) - set(candidates):
+            del self._tokens[mint]
+
+        # New, changed and overdue tokens; a filter change already cleared everything
+        dirty = []
+        for mint, token in candidates.items():
+            state = self._tokens.get(mint)
+            if (
+                state is None
+                or now - state.refreshed_at >= self.refresh_interval
+                or state.fingerprint != self.fingerprint(token)
+            ):
+                dirty.append(mint)
+        return dirty
+
+    def record(self, mint: str, token: Dict, coin: Optional[Dict], now: Optional[float] = None) -> None:
+        """Store the outcome for a mint; `coin` is None when it failed the filters"""
+        now = time.monotonic() if now is None else now
+        self._tokens[mint] = TokenState(self.fingerprint(token), now, coin)
+
+    def passing(self) -> List[Dict]:
+        """Formatted coin data for every tracked mint that passed the filters"""
+        return [state.coin for state in self._tokens.values() if state.coin is not None]
+
+    def __len__(self) -> int:
+        return len(self._tokens)
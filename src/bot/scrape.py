@@ -0,0 +1,44 @@
+# bot/scrape.py
+import html
+import re
+from typing import Optional
+
+META_TAG = re.compile(rb"<meta\b[^>]*>", re.IGNORECASE)
+ATTRIBUTE = re.compile(
+    rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE
+)
+HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+
+async def read_head(response, max_bytes: int = 65536, chunk_size: int = 8192) -> bytes:
+    """Read a streamed HTML body only up to </head>, never past max_bytes"""
+    buffer = bytearray()
+    async for chunk in response.content.iter_chunked(chunk_size):
+        # Re-scan a little of the previous chunk in case the tag was split
+        start = max(len(buffer) - 8, 0)
+        buffer += chunk
+        match = HEAD_END.search(buffer, start)
+        if match:
+            return bytes(buffer[:match.end()])
+        if len(buffer) >= max_bytes:
+            return bytes(buffer[:max_bytes])
+    return bytes(buffer)
+
+def extract_meta_description(head: bytes, encoding: str = "utf-8") -> Optional[str]:
+    """Content of <meta name="description"> without building a DOM; CPU-bound, run it in a thread"""
+    for tag in META_TAG.finditer(head):
+        attributes = {
+            match.group(1).lower(): next(value for value in match.groups()[1:] if value is not None)
+            for match in ATTRIBUTE.finditer(tag.group(0))
+        }
+        if attributes.get(b"name", b"").lower() == b"description" and b"content" in attributes:
+            return html.unescape(attributes[b"content"].decode(encoding, "replace")).strip()
+
+    if b"description" not in head.lower():
+        return None
+
+    # Markup too irregular for the tag scanner; the head is already bounded
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(head.decode(encoding, "replace"), "html.parser")
+    meta = soup.find("meta", {"name": "description"})
+    return meta["content"].strip() if meta and meta.get("content") else None
@@ -0,0 +1,89 @@
+# bot/singleflight.py
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List
+
+_MISSING = object()
+
+class SingleFlight:
+    """Collapses concurrent calls for the same key into one upstream request"""
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._batches: set = set()
+        self.leaders = 0
+        # Callers served without a request of their own
+        self.saved = 0
+        # Keys answered by someone else's request
+        self.shared_keys = 0
+
+    def _start(self, key: Hashable, call: Awaitable) -> asyncio.Future:
+        flight = asyncio.ensure_future(call)
+        self._flights[key] = flight
+
+        def forget(_):
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            # Every waiter may have given up; don't warn about an unread error
+            if not flight.cancelled():
+                flight.exception()
+
+        flight.add_done_callback(forget)
+        return flight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn()` unless a call for `key` is already in flight"""
+        flight = self._flights.get(key)
+        if flight is None:
+            self.leaders += 1
+            flight = self._start(key, fn())
+        else:
+            self.saved += 1
+            self.shared_keys += 1
+        # Shielded, so one caller timing out never cancels the others' request
+        return await asyncio.shield(flight)
+
+    async def do_many(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]
+    ) -> Dict[Hashable, Any]:
+        """Batch variant for providers that take many keys per request"""
+        keys = list(dict.fromkeys(keys))
+        # Keys already in flight join their request; the rest share one loader call
+        flights = {key: self._flights[key] for key in keys if key in self._flights}
+        self.shared_keys += len(flights)
+
+        fresh = [key for key in keys if key not in flights]
+        if not fresh:
+            self.saved += 1
+        else:
+            self.leaders += 1
+            batch = asyncio.ensure_future(loader(fresh))
+            self._batches.add(batch)
+            batch.add_done_callback(self._batches.discard)
+            for key in fresh:
+                flights[key] = self._start(key, self._pick(batch, key))
+
+        values = await asyncio.gather(*(asyncio.shield(flight) for flight in flights.values()))
+        return {
+            key: value for key, value in zip(flights, values) if value is not _MISSING
+        }
+
+    @staticmethod
+    async def _pick(batch: asyncio.Future, key: Hashable) -> Any:
+        return (await asyncio.shield(batch)).get(key, _MISSING)
+
+    async def close(self) -> None:
+        """Cancel requests still in flight, e.g. ones every caller gave up on"""
+        flights = [*self._flights.values(), *self._batches]
+        for flight in flights:
+            flight.cancel()
+        await asyncio.gather(*flights, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._flights),
+            "upstream_calls": self.leaders,
+            "saved_calls": self.saved,
+            "shared_keys": self.shared_keys
+        }
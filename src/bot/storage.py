@@ -0,0 +1,41 @@
+# bot/storage.py
+import asyncio
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+def write_json_atomic(path: Path, data: Any, indent: int = 2) -> None:
+    """Write JSON to a sibling temp file and rename it over `path`"""
+    # Readers see the old file or the new one, never a partial write
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(
+        mode='w',
+        encoding='utf-8',
+        dir=path.parent,
+        suffix='.tmp',
+        delete=False
+    ) as tmp:
+        try:
+            json.dump(data, tmp, indent=indent)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    Path(tmp.name).replace(path)
+
+async def wait_for_quiet(changed: asyncio.Event, quiet: float, ceiling: float) -> None:
+    """Return once `changed` stayed unset for `quiet` seconds, or after `ceiling` seconds"""
+    loop = asyncio.get_running_loop()
+    give_up = loop.time() + ceiling
+    while True:
+        changed.clear()
+        remaining = give_up - loop.time()
+        if remaining <= 0:
+            return
+        try:
+            await asyncio.wait_for(changed.wait(), min(quiet, remaining))
+        except asyncio.TimeoutError:
+            return
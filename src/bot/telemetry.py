@@ -0,0 +1,188 @@
+# bot/telemetry.py
+import bisect
+import logging
+import time
+from aiohttp import web
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TICK_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 90.0, 120.0)
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, key)} {_number(value)}")
+        return lines
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            # Per-bucket counts (last slot is +Inf), then sum
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else _number(bound)
+                labels = _labels(self.label_names, key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Registry:
+    """Metrics rendered in the Prometheus text exposition format"""
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        # Called at scrape time for values other components already keep,
+        # so their hot paths stay untouched
+        self._collectors: Dict[str, Callable[[], Iterable[Metric]]] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labels))
+
+    def histogram(
+        self, name: str, help: str, labels: Sequence[str] = (), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def collector(self, name: str, collect: Callable[[], Iterable[Metric]]) -> None:
+        """Add (or replace) a scrape-time collector"""
+        self._collectors[name] = collect
+
+    def render(self) -> str:
+        metrics = list(self._metrics)
+        for name, collect in list(self._collectors.items()):
+            try:
+                metrics.extend(collect())
+            except Exception as e:
+                logging.warning(f"Metrics collector {name} failed: {str(e)}")
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+REGISTRY = Registry()
+
+PROVIDER_LATENCY = REGISTRY.histogram(
+    "provider_request_seconds", "Provider request latency per attempt", ("provider", "outcome")
+)
+TICK_DURATION = REGISTRY.histogram(
+    "scan_tick_seconds", "Duration of a full scan tick", buckets=TICK_BUCKETS
+)
+TOKENS_SCANNED = REGISTRY.gauge("scan_tokens_scanned", "Candidates discovered in the last tick")
+TOKENS_PASSED = REGISTRY.gauge("scan_tokens_passed", "Tokens passing any profile in the last tick")
+TICKS = REGISTRY.counter("scan_ticks_total", "Scan ticks by outcome", ("outcome",))
+PUBLISH_LATENCY = REGISTRY.histogram(
+    "discord_publish_seconds", "Discord publish latency per channel update", ("action",)
+)
+
+class TelemetryServer:
+    """Embedded HTTP server for /health and /metrics"""
+    def __init__(
+        self,
+        health: Callable[[], Dict],
+        registry: Registry = REGISTRY,
+        host: str = "0.0.0.0",
+        port: int = 8080
+    ):
+        self.health = health
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.started = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        if self._runner:
+            return
+        app = web.Application()
+        # Liveness is 200 while the loop serves; readiness is 503 until health() says ready
+        app.router.add_get("/health", self.liveness)
+        app.router.add_get("/health/ready", self.readiness)
+        app.router.add_get("/metrics", self.metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # Port 0 asks the OS for a free port; report the real one
+        self.port = site._server.sockets[0].getsockname()[1]
+        logging.info(f"Telemetry listening on {self.host}:{self.port}")
+
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _status(self) -> Dict:
+        return {"uptime": round(time.monotonic() - self.started, 1), **self.health()}
+
+    async def liveness(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok", **self._status()})
+
+    async def readiness(self, request: web.Request) -> web.Response:
+        status = self._status()
+        ready = bool(status.get("ready"))
+        return web.json_response(
+            {"status": "ready" if ready else "starting", **status},
+            status=200 if ready else 503
+        )
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
@@ -0,0 +1,205 @@
+# bot/tracing.py
+import asyncio
+import contextvars
+import cProfile
+import io
+import json
+import logging
+import pstats
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Union
+
+TRACES_DIR = Path(__file__).parent.parent / 'data'
+
+_current: contextvars.ContextVar = contextvars.ContextVar("tick_trace", default=None)
+
+class TickTrace:
+    """Spans recorded during one scan tick"""
+    __slots__ = ("tick", "started_at", "duration", "total", "spans", "_origin", "_holds", "_on_done")
+
+    def __init__(self, tick: int):
+        self.tick = tick
+        self.started_at = time.time()
+        # The scan itself, and until the last handed-off work (publish jobs) finished
+        self.duration: Optional[float] = None
+        self.total: Optional[float] = None
+        self.spans: List[Dict] = []
+        self._origin = time.perf_counter()
+        self._holds = 0
+        self._on_done: Optional[Callable[["TickTrace"], None]] = None
+
+    def hold(self) -> None:
+        """Keep the trace open for work that outlives the tick"""
+        self._holds += 1
+
+    def release(self) -> None:
+        self._holds -= 1
+        if self._holds == 0 and self._on_done:
+            self._done()
+
+    def _close(self, on_done: Callable[["TickTrace"], None]) -> None:
+        self._on_done = on_done
+        if self._holds == 0:
+            self._done()
+
+    def _done(self) -> None:
+        on_done, self._on_done = self._on_done, None
+        self.total = time.perf_counter() - self._origin
+        on_done(self)
+
+    def stages(self) -> Dict[str, float]:
+        """Seconds spent per stage name (repeated spans add up)"""
+        totals: Dict[str, float] = defaultdict(float)
+        for recorded in self.spans:
+            totals[recorded["name"]] += recorded["duration"]
+        return {name: round(seconds, 4) for name, seconds in totals.items()}
+
+    def summary(self) -> Dict:
+        return {
+            "tick": self.tick,
+            "started_at": self.started_at,
+            "duration": round(self.duration or 0.0, 4),
+            "total": round(self.total or self.duration or 0.0, 4),
+            "stages": self.stages()
+        }
+
+    def to_dict(self) -> Dict:
+        return {**self.summary(), "spans": self.spans}
+
+def current_trace() -> Optional[TickTrace]:
+    return _current.get()
+
+@contextmanager
+def attach(trace: Optional[TickTrace]) -> Iterator[None]:
+    """Make `trace` current in a task that does work on behalf of a tick"""
+    token = _current.set(trace)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Dict]:
+    """Time a stage of the current tick; a no-op outside a traced tick"""
+    # Yields the attributes, so results known only at the end can be added
+    trace = _current.get()
+    if trace is None:
+        yield attrs
+        return
+    started = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        ended = time.perf_counter()
+        trace.spans.append({
+            "name": name,
+            "offset": round(started - trace._origin, 4),
+            "duration": round(ended - started, 4),
+            **attrs
+        })
+
+class Tracer:
+    """Ring buffer of recent tick traces plus on-demand profiling"""
+    def __init__(self, capacity: int = 50, budget: float = 90.0, path: Path = TRACES_DIR):
+        self.budget = budget
+        self.path = Path(path)
+        self.recent: Deque[Dict] = deque(maxlen=capacity)
+        self.slow: Deque[TickTrace] = deque(maxlen=capacity)
+        self._ticks = 0
+        self._profile_remaining = 0
+        self._profiler: Optional[cProfile.Profile] = None
+        self._profiled: List[TickTrace] = []
+
+    def request_profile(self, ticks: int) -> None:
+        """cProfile the next `ticks` ticks, then write a report to data/"""
+        self._profile_remaining = ticks
+        self._profiler = cProfile.Profile()
+        self._profiled = []
+
+    @property
+    def profiling(self) -> bool:
+        return self._profile_remaining > 0
+
+    @contextmanager
+    def tick(self) -> Iterator[TickTrace]:
+        self._ticks += 1
+        trace = TickTrace(self._ticks)
+        token = _current.set(trace)
+        profiler = self._profiler if self.profiling else None
+        if profiler:
+            profiler.enable()
+        try:
+            yield trace
+        finally:
+            if profiler:
+                profiler.disable()
+            _current.reset(token)
+            trace.duration = time.perf_counter() - trace._origin
+            if profiler:
+                self._profiled_tick(trace, profiler)
+            trace._close(self._finish)
+
+    def _finish(self, trace: TickTrace) -> None:
+        self.recent.append(trace.summary())
+        # Ticks over budget keep their full span list and are logged to disk
+        if trace.duration > self.budget:
+            self.slow.append(trace)
+            logging.warning(
+                f"Tick {trace.tick} took {trace.duration:.1f}s (budget {self.budget:.0f}s): "
+                f"{trace.stages()}"
+            )
+            self._write("slow_ticks.jsonl", json.dumps(trace.to_dict()) + "\n", append=True)
+
+    def _profiled_tick(self, trace: TickTrace, profiler: cProfile.Profile) -> None:
+        self._profiled.append(trace)
+        self._profile_remaining -= 1
+        if self.profiling:
+            return
+        # Summaries are taken now; pstats sorting and formatting run in the executor
+        summaries = [profiled.summary() for profiled in self._profiled]
+        name = f"profile-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        self._write(name, lambda: self.profile_report(profiler, summaries))
+        logging.info(f"Profile of {len(summaries)} ticks written to {self.path / name}")
+        self._profiler = None
+        self._profiled = []
+
+    @staticmethod
+    def profile_report(profiler: cProfile.Profile, summaries: List[Dict], limit: int = 40) -> str:
+        """Render tick summaries and the profiler's hottest functions (slow; keep off the loop)"""
+        stages: Dict[str, float] = defaultdict(float)
+        for summary in summaries:
+            for name, seconds in summary["stages"].items():
+                stages[name] += seconds
+        out = io.StringIO()
+        out.write(f"Profiled ticks: {[summary['tick'] for summary in summaries]}\n")
+        out.write(f"Total duration: {sum(summary['duration'] for summary in summaries):.3f}s\n\n")
+        out.write("Hottest stages (seconds):\n")
+        for name, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+            out.write(f"  {name:<12} {seconds:.3f}\n")
+        out.write("\n")
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+    def _write(self, name: str, text: Union[str, Callable[[], str]], append: bool = False) -> None:
+        """Write a report without blocking the event loop; a callable is rendered there too"""
+        def write():
+            body = text() if callable(text) else text
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.path / name, "a" if append else "w", encoding="utf-8") as handle:
+                handle.write(body)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            write()
+            return
+
+        def report(done):
+            if done.exception():
+                logging.error(f"Trace write failed: {str(done.exception())}")
+
+        loop.run_in_executor(None, write).add_done_callback(report)
@@ -1,7 +1,32 @@
 # bot/utils.py
 import aiohttp
+import asyncio
 import logging
+import time
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Dict, List, Optional
+from discord.ext import commands
 from src.app_config import settings
+from src.bot.cache import LRUCache, MetricsCache
+from src.bot.http_pool import HTTPPool
+from src.bot.metadata_store import MetadataStore
+from src.bot.pipeline import fan_out
+from src.bot.providers import (
+    BIRDEYE_CB,
+    BIRDEYE_RL,
+    BREAKERS,
+    HELIUS_CB,
+    HELIUS_RL,
+    JUPITER_CB,
+    JUPITER_RL,
+    LIMITERS,
+    PUMPFUN_CB
+)
+from src.bot.ratelimit import RateLimiter
+from src.bot.resilience import CircuitBreaker, hedged
+from src.bot.scrape import extract_meta_description, read_head
+from src.bot.singleflight import SingleFlight
+from src.bot.telemetry import PROVIDER_LATENCY, REGISTRY, Counter, Gauge
 from src.bot.helpers import (
     photon_url,
     dexscreener_url,
@@ -11,142 +36,563 @@ from src.bot.helpers import (
     safe_float,
     trend_emoji
 )
-from solders.pubkey import Pubkey
-
-class RateLimiter:
-    """Async rate limiter for API calls"""
-    def __init__(self, calls_per_minute: int):
-        self.calls_per_minute = calls_per_minute
-        self.semaphore = asyncio.Semaphore(calls_per_minute)
-        self.lock = asyncio.Lock()
-        self.last_reset = time.monotonic()
-        self.call_count = 0
-
-    async def __aenter__(self):
-        async with self.lock:
-            elapsed = time.monotonic() - self.last_reset
-            if elapsed > 60:
-                self.last_reset = time.monotonic()
-                self.call_count = 0
-                
-            if self.call_count >= self.calls_per_minute:
-                sleep_time = 60 - elapsed
-                logging.warning(f"Rate limit hit. Sleeping {sleep_time:.1f}s")
-                await asyncio.sleep(sleep_time)
-                self.last_reset = time.monotonic()
-                self.call_count = 0
-                
-            self.call_count += 1
-        return await self.semaphore.acquire()
-
-    async def __aexit__(self, *args):
-        self.semaphore.release()
-
-HELIUS_RL = RateLimiter(120)  # Helius 120 RPM limit
-BIRDEYE_RL = RateLimiter(60)   # BirdEye 60 RPM limit
+
+def _metric_ttls() -> Dict[str, float]:
+    return {
+        "price": settings.PRICE_TTL,
+        "liquidity": settings.LIQUIDITY_TTL,
+        "market_cap": settings.MARKET_CAP_TTL,
+        "volume_24h": settings.VOLUME_TTL
+    }
+
+BIRDEYE_FIELDS = ("liquidity", "volume_24h", "market_cap")
+
+DESCRIPTION_UNAVAILABLE = "Description unavailable"
+DESCRIPTIONS = LRUCache(settings.DESCRIPTION_CACHE_SIZE)
+
+# Largest number of mints each provider accepts per request
+BIRDEYE_BATCH_LIMIT = 20
+JUPITER_BATCH_LIMIT = 100
 
 async def fetch_async(
     url: str, 
     method: str = "GET",
     headers: Optional[Dict] = None,
-    json: Optional[Dict] = None
+    json: Optional[Dict] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    limiter: Optional[RateLimiter] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    hedge: bool = False
 ) -> Optional[Dict]:
     """Generic async HTTP client with retry logic"""
-    async with aiohttp.ClientSession() as session:
-        for attempt in range(3):
+    # Callers pass the pooled session; without one a throwaway session is opened
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await fetch_async(url, method, headers, json, session, limiter, breaker, hedge)
+
+    provider = breaker.name if breaker else "other"
+
+    async def request():
+        async with limiter or nullcontext():
+            started = time.monotonic()
             try:
                 async with session.request(
-                    method, url, headers=headers, json=json, timeout=20
+                    method, url, headers=headers, json=json, timeout=settings.PROVIDER_TIMEOUT
                 ) as response:
+                    if limiter:
+                        limiter.observe(response.status, response.headers)
+                    if response.status == 429:
+                        PROVIDER_LATENCY.observe(
+                            time.monotonic() - started, provider=provider, outcome="throttled"
+                        )
+                        return None, True
                     response.raise_for_status()
-                    return await response.json()
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logging.warning(f"Request failed (attempt {attempt+1}/3): {str(e)}")
-                await asyncio.sleep(2 ** attempt)
-        return None
+                    data = await response.json()
+            except aiohttp.ClientResponseError as e:
+                PROVIDER_LATENCY.observe(time.monotonic() - started, provider=provider, outcome="error")
+                # Only server-side failures say anything about provider health
+                if breaker and e.status >= 500:
+                    breaker.record_failure()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                PROVIDER_LATENCY.observe(time.monotonic() - started, provider=provider, outcome="error")
+                if breaker:
+                    breaker.record_failure()
+                raise
+            latency = time.monotonic() - started
+            PROVIDER_LATENCY.observe(latency, provider=provider, outcome="ok")
+            if breaker:
+                breaker.record_success(latency)
+            return data, False
+
+    for attempt in range(3):
+        # Fail fast with None while the breaker is open
+        if breaker and not breaker.allow():
+            logging.debug(f"{breaker.name} circuit open; failing fast")
+            return None
+        try:
+            # Backup request once the first is slower than the observed p95; idempotent reads only
+            if hedge and breaker and breaker.state == CircuitBreaker.CLOSED:
+                delay = breaker.hedge_delay(settings.HEDGE_PERCENTILE, settings.HEDGE_MIN_DELAY)
+                data, throttled = await hedged(request, delay)
+            else:
+                data, throttled = await request()
+            if throttled:
+                # The limiter now holds callers until Retry-After passes
+                logging.warning(f"Rate limited (attempt {attempt+1}/3)")
+                continue
+            return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning(f"Request failed (attempt {attempt+1}/3): {str(e)}")
+            await asyncio.sleep(2 ** attempt)
+    return None
 
 def validate_solana_address(address: str) -> bool:
     """Validate Solana address format"""
+    # Imported on first use to keep solders off the startup path
+    from solders.pubkey import Pubkey
     try:
         Pubkey.from_string(address)
         return True
     except ValueError:
         return False
 
-async def fetch_jupiter_price(mint: str) -> float:
+def chunked(items: List[str], size: int) -> List[tuple]:
+    """Split items into tuples of at most `size`"""
+    return [tuple(items[i:i + size]) for i in range(0, len(items), size)]
+
+async def fetch_jupiter_price(
+    mint: str,
+    session: Optional[aiohttp.ClientSession] = None
+) -> float:
     """Get current price from Jupiter API"""
     if not validate_solana_address(mint):
         return 0.0
     
-    async with HELIUS_RL:
-        url = f"https://price.jup.ag/v4/price?ids={mint}"
-        data = await fetch_async(url)
-        return float(data["data"][mint]["price"]) if data else 0.0
+    prices = await fetch_jupiter_prices([mint], session=session)
+    return prices.get(mint, 0.0)
+
+async def fetch_jupiter_prices(
+    mints: List[str],
+    session: Optional[aiohttp.ClientSession] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, float]:
+    """Get current prices for many mints, JUPITER_BATCH_LIMIT ids per request"""
+    entries = await fetch_jupiter_price_entries(mints, session, deadline)
+    return {mint: entry["price"] for mint, entry in entries.items() if "price" in entry}
+
+async def fetch_jupiter_price_entries(
+    mints: List[str],
+    session: Optional[aiohttp.ClientSession] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Dict[str, float]]:
+    """{mint: {"price": ...}} for every mint Jupiter answered for, {} when it has no price"""
+    async def fetch_chunk(chunk: tuple) -> Dict[str, Dict[str, float]]:
+        url = f"{settings.JUPITER_PRICE_URL}/v4/price?ids={','.join(chunk)}"
+        data = await fetch_async(
+            url, session=session, limiter=JUPITER_RL,
+            breaker=JUPITER_CB, hedge=settings.HEDGE_REQUESTS
+        )
+        if data is None:
+            return {}
+        entries = data.get("data") or {}
+        return {
+            mint: {"price": float(entries[mint].get("price", 0))} if entries.get(mint) else {}
+            for mint in chunk
+        }
+
+    chunks = await fan_out(chunked(list(mints), JUPITER_BATCH_LIMIT), fetch_chunk, deadline)
+    return {mint: entry for chunk in chunks.values() for mint, entry in chunk.items()}
+
+def _parse_birdeye_metrics(data: Optional[Dict]) -> Dict[str, float]:
+    """Normalize a legacy /public/token payload"""
+    data = data or {}
+    return {
+        "liquidity": float(data.get("liquidity") or 0),
+        "volume_24h": float(data.get("volume24h") or 0),
+        "market_cap": float(data.get("marketCap") or 0)
+    }
 
-async def fetch_birdeye_metrics(mint: str) -> Dict[str, float]:
+def _parse_market_data(entry: Dict) -> Dict[str, float]:
+    """Liquidity and market cap from a v3 market-data entry (it carries no volume)"""
+    return {
+        "liquidity": float(entry.get("liquidity") or 0),
+        "market_cap": float(entry.get("market_cap") or 0)
+    }
+
+def _parse_trade_data(entry: Dict) -> Dict[str, float]:
+    """24h USD volume from a v3 trade-data entry"""
+    return {"volume_24h": float(entry.get("volume_24h_usd") or 0)}
+
+async def fetch_birdeye_metrics(
+    mint: str,
+    session: Optional[aiohttp.ClientSession] = None
+) -> Dict[str, float]:
     """Get token metrics from Birdeye"""
     if not validate_solana_address(mint):
         return {"liquidity": 0, "volume_24h": 0, "market_cap": 0}
     
-    async with BIRDEYE_RL:
-        url = f"https://public-api.birdeye.so/public/token?address={mint}"
-        headers = {"X-API-KEY": settings.BIRDEYE_API_KEY}
-        data = await fetch_async(url, headers=headers)
-        
-        return {
-            "liquidity": float(data.get("liquidity", 0)),
-            "volume_24h": float(data.get("volume24h", 0)),
-            "market_cap": float(data.get("marketCap", 0))
-        }
+    url = f"{settings.BIRDEYE_API_URL}/public/token?address={mint}"
+    headers = {"X-API-KEY": settings.BIRDEYE_API_KEY}
+    data = await fetch_async(
+        url, headers=headers, session=session, limiter=BIRDEYE_RL,
+        breaker=BIRDEYE_CB, hedge=settings.HEDGE_REQUESTS
+    )
+    return _parse_birdeye_metrics(data)
+
+async def fetch_birdeye_metrics_batch(
+    mints: List[str],
+    session: Optional[aiohttp.ClientSession] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Dict[str, float]]:
+    """Get metrics for many mints, BIRDEYE_BATCH_LIMIT addresses per request"""
+    # Liquidity and market cap come from market-data, 24h volume from trade-data
+    headers = {"X-API-KEY": settings.BIRDEYE_API_KEY}
+
+    async def fetch_endpoint(endpoint: str, chunk: tuple) -> Optional[Dict[str, Dict]]:
+        url = (
+            f"{settings.BIRDEYE_API_URL}/defi/v3/token/{endpoint}/multiple"
+            f"?list_address={','.join(chunk)}"
+        )
+        data = await fetch_async(
+            url, headers=headers, session=session, limiter=BIRDEYE_RL,
+            breaker=BIRDEYE_CB, hedge=settings.HEDGE_REQUESTS
+        )
+        return None if data is None else data.get("data") or {}
+
+    async def fetch_chunk(chunk: tuple) -> Dict[str, Dict[str, float]]:
+        market, trade = await asyncio.gather(
+            fetch_endpoint("market-data", chunk),
+            fetch_endpoint("trade-data", chunk)
+        )
+        # A failed chunk is left out and retried; an answered one returns every
+        # mint, so the cache also remembers the ones Birdeye has no data on
+        if market is None or trade is None:
+            return {}
+        metrics: Dict[str, Dict[str, float]] = {mint: {} for mint in chunk}
+        for entries, parse in ((market, _parse_market_data), (trade, _parse_trade_data)):
+            for mint, entry in entries.items():
+                if entry and mint in metrics:
+                    metrics[mint].update(parse(entry))
+        return metrics
+
+    valid = [mint for mint in mints if validate_solana_address(mint)]
+    chunks = await fan_out(chunked(valid, BIRDEYE_BATCH_LIMIT), fetch_chunk, deadline)
+    return {mint: metrics for chunk in chunks.values() for mint, metrics in chunk.items()}
 
-async def fetch_helius_assets() -> List[Dict]:
-    """Fetch trending tokens from Helius DAS"""
-    async with HELIUS_RL:
-        url = f"https://mainnet.helius-rpc.com/?api-key={settings.HELIUS_API_KEY}"
+async def fetch_helius_assets(
+    session: Optional[aiohttp.ClientSession] = None
+) -> List[Dict]:
+    """Fetch trending tokens from Helius DAS (first page only)"""
+    return [token async for token in iter_helius_assets(session, max_pages=1)]
+
+async def iter_helius_assets(
+    session: Optional[aiohttp.ClientSession] = None,
+    page_size: Optional[int] = None,
+    max_pages: Optional[int] = None
+) -> AsyncIterator[Dict]:
+    """Yield Helius DAS assets page by page; stops fetching when the consumer breaks out"""
+    url = f"{settings.HELIUS_RPC_URL}/?api-key={settings.HELIUS_API_KEY}"
+    page_size = page_size or settings.HELIUS_PAGE_SIZE
+    max_pages = max_pages or settings.HELIUS_MAX_PAGES
+    cursor = None
+
+    for page in range(1, max_pages + 1):
+        params = {
+            "owner": None,
+            "compressed": False,
+            "limit": page_size
+        }
+        # Follow the response cursor when Helius returns one, page numbers otherwise
+        if cursor:
+            params["cursor"] = cursor
+        else:
+            params["page"] = page
         payload = {
             "jsonrpc": "2.0",
             "id": "meme-scanner",
             "method": "searchAssets",
-            "params": {
-                "owner": None,
-                "compressed": False,
-                "page": 1,
-                "limit": 50
-            }
+            "params": params
         }
-        data = await fetch_async(url, method="POST", json=payload)
-        return data.get("result", {}).get("items", [])
+        data = await fetch_async(
+            url, method="POST", json=payload, session=session,
+            limiter=HELIUS_RL, breaker=HELIUS_CB
+        )
+        result = (data or {}).get("result", {})
+        items = result.get("items", [])
+        for item in items:
+            yield item
+
+        cursor = result.get("cursor")
+        if len(items) < page_size:
+            return
 
-async def fetch_pumpfun_description(mint: str) -> str:
-    """Scrape pump.fun token description"""
+async def fetch_pumpfun_description(
+    mint: str,
+    session: Optional[aiohttp.ClientSession] = None
+) -> str:
+    """Scrape pump.fun token description, cached by mint"""
     if not validate_solana_address(mint):
         return "Invalid address"
+    cached = DESCRIPTIONS.get(mint)
+    if cached is not None:
+        return cached
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await fetch_pumpfun_description(mint, session)
+    if not PUMPFUN_CB.allow():
+        return DESCRIPTION_UNAVAILABLE
     
     try:
-        url = f"https://pump.fun/{mint}"
-        async with aiohttp.ClientSession() as session:
+        url = f"{settings.PUMPFUN_URL}/{mint}"
+        started = time.monotonic()
+        try:
             async with session.get(url, timeout=15) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-                meta = soup.find("meta", {"name": "description"})
-                return meta["content"].strip() if meta else "No description available"
+                response.raise_for_status()
+                # Only the document head is read, under a hard byte cap
+                head = await read_head(response, settings.PUMPFUN_MAX_BYTES)
+                encoding = response.charset or "utf-8"
+        except aiohttp.ClientResponseError as e:
+            PROVIDER_LATENCY.observe(time.monotonic() - started, provider="pump.fun", outcome="error")
+            if e.status >= 500:
+                PUMPFUN_CB.record_failure()
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            PROVIDER_LATENCY.observe(time.monotonic() - started, provider="pump.fun", outcome="error")
+            PUMPFUN_CB.record_failure()
+            raise
+        latency = time.monotonic() - started
+        PROVIDER_LATENCY.observe(latency, provider="pump.fun", outcome="ok")
+        PUMPFUN_CB.record_success(latency)
+        description = await asyncio.to_thread(extract_meta_description, head, encoding)
+        description = description or "No description available"
+        DESCRIPTIONS.set(mint, description)
+        return description
     except Exception as e:
         logging.error(f"Pump.fun scrape failed: {str(e)}")
-        return "Description unavailable"
+        return DESCRIPTION_UNAVAILABLE
+
+def extract_metadata(token: Dict) -> Dict[str, str]:
+    """Pull name, symbol and image out of a Helius asset"""
+    content = token.get("content", {})
+    return {
+        "name": content.get("metadata", {}).get("name", "Unknown"),
+        "symbol": content.get("metadata", {}).get("symbol", "?"),
+        "image": next(iter(content.get("files", [])), {}).get("uri", "")
+    }
 
 def format_coin_data(
     token: Dict, 
-    metrics: Dict
+    metrics: Dict,
+    metadata: Optional[Dict] = None
 ) -> Dict[str, Any]:
     """Structure normalized coin data"""
+    metadata = metadata or extract_metadata(token)
     return {
-        "name": token.get("content", {}).get("metadata", {}).get("name", "Unknown"),
-        "symbol": token.get("content", {}).get("metadata", {}).get("symbol", "?"),
+        "name": metadata.get("name", "Unknown"),
+        "symbol": metadata.get("symbol", "?"),
         "price": metrics.get("price", 0),
         "liquidity": metrics.get("liquidity", 0),
         "market_cap": metrics.get("market_cap", 0),
         "volume_5min": metrics.get("volume_24h", 0) / 288,
         "contract": token.get("id", ""),
-        "image": next(iter(token.get("content", {}).get("files", [])), {}).get("uri", ""),
-        "description": metrics.get("description", "")
-    }
\ No newline at end of file
+        "image": metadata.get("image", ""),
+        "description": metadata.get("description") or metrics.get("description", "")
+    }
+
+class Utils(commands.Cog):
+    """Provider layer bound to the bot's pooled HTTP session"""
+    def __init__(self, bot):
+        self.bot = bot
+        self.pool = HTTPPool(
+            limit=settings.HTTP_POOL_SIZE,
+            limit_per_host=settings.HTTP_POOL_PER_HOST
+        )
+        self.cache = MetricsCache(
+            ttls=_metric_ttls(),
+            max_size=settings.METRICS_CACHE_SIZE,
+            max_stale=settings.METRICS_MAX_STALE,
+            negative_ttl=settings.METRICS_NEGATIVE_TTL
+        )
+        self.metadata = MetadataStore(max_age=settings.METADATA_MAX_AGE_DAYS * 86400)
+        # Concurrent callers (scan, slash commands, background refreshes) share requests
+        self.flights = {
+            name: SingleFlight(name) for name in ("birdeye", "jupiter", "pumpfun")
+        }
+        self._handed_off = False
+        # On a hot reload the instance being replaced left its live state here.
+        # It is only taken in cog_load, so an instance that fails to load
+        # leaves it for the rollback instance.
+        state = bot.handoffs.get(self.qualified_name)
+        self._adopted = state is not None
+        if state is not None:
+            self.adopt(state)
+
+    def handoff(self) -> Dict:
+        """Release long-lived state to the instance replacing this one"""
+        self._handed_off = True
+        return {
+            "pool": self.pool,
+            "cache": self.cache,
+            "metadata": self.metadata,
+            "flights": self.flights,
+            "descriptions": DESCRIPTIONS.items()
+        }
+
+    def adopt(self, state: Dict) -> None:
+        """Take over the pooled session, caches and metadata store of a previous instance"""
+        self.pool = state["pool"]
+        self.cache = state["cache"]
+        self.metadata = state["metadata"]
+        self.flights = state["flights"]
+        # TTLs are plain values, so reloaded settings apply to the kept entries
+        self.cache.ttls = _metric_ttls()
+        self.cache.negative_ttl = settings.METRICS_NEGATIVE_TTL
+        for mint, description in state["descriptions"]:
+            DESCRIPTIONS.set(mint, description)
+        self._handed_off = False
+
+    async def cog_load(self):
+        self.bot.handoffs.pop(self.qualified_name, None)
+        # Registered by name, so a reloaded instance replaces its predecessor's collector
+        REGISTRY.collector("utils", self.collect_metrics)
+        await self.pool.start()
+        if not self._adopted:
+            await asyncio.to_thread(self.metadata.open)
+
+    async def cog_unload(self):
+        if self._handed_off:
+            # The replacement owns the pool and stores now; just persist staged rows
+            await self.metadata.flush()
+            return
+        await self.cache.close()
+        for flight in self.flights.values():
+            await flight.close()
+        await self.metadata.flush()
+        self.metadata.close()
+        await self.pool.close()
+
+    def token_metadata(self, token: Dict) -> Dict[str, str]:
+        """Name, symbol and image for an asset, read from the metadata store first"""
+        mint = token.get("id", "")
+        stored = self.metadata.get(mint)
+        if stored and stored.get("name"):
+            return stored
+        extracted = extract_metadata(token)
+        self.metadata.stage(mint, **extracted)
+        return {**(stored or {}), **extracted}
+
+    async def describe(self, mint: str) -> str:
+        """pump.fun description, scraped only when the store has none"""
+        stored = self.metadata.get(mint) or {}
+        if stored.get("description"):
+            return stored["description"]
+        description = await self.fetch_pumpfun_description(mint)
+        if description != DESCRIPTION_UNAVAILABLE:
+            self.metadata.stage(mint, description=description)
+        return description
+
+    async def get_metrics(
+        self, mints: List[str], deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """Cached Birdeye metrics merged with Jupiter prices, keyed by mint"""
+        async def load_metrics(missing, deadline):
+            return await self.fetch_birdeye_metrics_batch(missing, deadline)
+
+        async def load_prices(missing, deadline):
+            return await self.fetch_jupiter_price_entries(missing, deadline)
+
+        metrics, prices = await asyncio.gather(
+            self.cache.get_many(mints, BIRDEYE_FIELDS, load_metrics, deadline),
+            self.cache.get_many(mints, ("price",), load_prices, deadline)
+        )
+        return {
+            mint: {**values, "price": prices.get(mint, {}).get("price", 0.0)}
+            for mint, values in metrics.items()
+        }
+
+    def metrics_answered(self, mints: List[str]) -> List[str]:
+        """Mints Birdeye has answered for, including those it has no data on"""
+        return self.cache.answered(mints, BIRDEYE_FIELDS)
+
+    def flight_stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: flight.stats() for name, flight in self.flights.items()}
+
+    def collect_metrics(self):
+        """Scrape-time view of the HTTP pool, metrics cache and single-flight counters"""
+        connections = self.pool.stats
+        http = [
+            Counter("http_requests_total", "Requests sent through the pooled session"),
+            Counter("http_connections_created_total", "New connections opened by the pool"),
+            Counter("http_connections_reused_total", "Requests served on a kept-alive connection"),
+            Counter("http_dns_lookups_total", "DNS resolutions performed"),
+            Counter("http_dns_cache_hits_total", "DNS lookups answered from the resolver cache")
+        ]
+        for metric, value in zip(http, (
+            connections.requests,
+            connections.connections_created,
+            connections.connections_reused,
+            connections.dns_lookups,
+            connections.dns_cache_hits
+        )):
+            metric.inc(value)
+
+        cache = self.cache.stats()
+        entries = Gauge("metrics_cache_entries", "Mints held in the metrics cache")
+        entries.set(cache["size"])
+        lookups = Counter("metrics_cache_lookups_total", "Metrics cache lookups by result", ("result",))
+        for result, field in (
+            ("hit", "hits"), ("stale", "stale_hits"), ("empty", "negative_hits"), ("miss", "misses")
+        ):
+            lookups.inc(cache[field], result=result)
+        refreshes = Counter("metrics_cache_refreshes_total", "Background refreshes of stale entries")
+        refreshes.inc(cache["refreshes"])
+        evictions = Counter("metrics_cache_evictions_total", "Entries evicted to stay under the size cap")
+        evictions.inc(cache["evictions"])
+
+        label = ("provider",)
+        upstream = Counter("singleflight_upstream_calls_total", "Requests actually sent upstream", label)
+        saved = Counter("singleflight_saved_calls_total", "Requests answered by joining one in flight", label)
+        in_flight = Gauge("singleflight_in_flight", "Requests currently in flight", label)
+        for name, flight in self.flights.items():
+            stats = flight.stats()
+            upstream.inc(stats["upstream_calls"], provider=name)
+            saved.inc(stats["saved_calls"], provider=name)
+            in_flight.set(stats["in_flight"], provider=name)
+        return [*http, entries, lookups, refreshes, evictions, upstream, saved, in_flight]
+
+    def provider_budget(self) -> float:
+        """Headroom left on the scarcest provider quota (0.0 - 1.0)"""
+        return min(limiter.headroom() for limiter in LIMITERS.values())
+
+    def breaker_stats(self) -> Dict[str, Dict]:
+        return {
+            breaker.name: breaker.stats()
+            for breaker in BREAKERS
+        }
+
+    validate_solana_address = staticmethod(validate_solana_address)
+    format_coin_data = staticmethod(format_coin_data)
+
+    async def fetch_helius_assets(self) -> List[Dict]:
+        return await fetch_helius_assets(session=self.pool.session)
+
+    def iter_helius_assets(self, max_pages: Optional[int] = None) -> AsyncIterator[Dict]:
+        return iter_helius_assets(self.pool.session, max_pages=max_pages)
+
+    async def fetch_birdeye_metrics(self, mint: str) -> Dict[str, float]:
+        return await self.flights["birdeye"].do(
+            ("token", mint), lambda: fetch_birdeye_metrics(mint, session=self.pool.session)
+        )
+
+    async def fetch_birdeye_metrics_batch(
+        self, mints: List[str], deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, float]]:
+        return await self.flights["birdeye"].do_many(
+            mints, lambda keys: fetch_birdeye_metrics_batch(keys, self.pool.session, deadline)
+        )
+
+    async def fetch_jupiter_price(self, mint: str) -> float:
+        prices = await self.fetch_jupiter_prices([mint])
+        return prices.get(mint, 0.0)
+
+    async def fetch_jupiter_prices(
+        self, mints: List[str], deadline: Optional[float] = None
+    ) -> Dict[str, float]:
+        entries = await self.fetch_jupiter_price_entries(mints, deadline)
+        return {mint: entry["price"] for mint, entry in entries.items() if "price" in entry}
+
+    async def fetch_jupiter_price_entries(
+        self, mints: List[str], deadline: Optional[float] = None
+    ) -> Dict[str, Dict[str, float]]:
+        return await self.flights["jupiter"].do_many(
+            mints, lambda keys: fetch_jupiter_price_entries(keys, self.pool.session, deadline)
+        )
+
+    async def fetch_pumpfun_description(self, mint: str) -> str:
+        return await self.flights["pumpfun"].do(
+            mint, lambda: fetch_pumpfun_description(mint, session=self.pool.session)
+        )
+
+async def setup(bot):
+    await bot.add_cog(Utils(bot))
\ No newline at end of file
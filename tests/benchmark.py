@@ -0,0 +1,219 @@
+"""End-to-end scan benchmark against the offline provider simulator
+
+Drives MemeBot.process_coins and the embed publishing path tick by tick and
+reports tick latency percentiles, provider requests per tick and throughput.
+Nothing leaves the machine: providers are simulated and Discord channels are
+stand-ins with a fixed API latency.
+
+    python -m tests.benchmark --ticks 20 --tokens 1000 --latency 0.05 --rate-limit 0.02
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.simulator import PROVIDERS, Faults, ProviderSimulator
+
+# Required settings for an offline run; real values in the environment win
+OFFLINE_ENV = {
+    "DISCORD_TOKEN": "offline-benchmark",
+    "HELIUS_API_KEY": "simulated",
+    "BIRDEYE_API_KEY": "simulated",
+    "DISCORD_CHANNEL_ID": "1",
+    "TEST_GUILD_ID": "1",
+    "DISCOVERY_WS_URL": "",
+}
+
+class StandInMessage:
+    def __init__(self, channel, message_id: int):
+        self.channel = channel
+        self.id = message_id
+
+    async def edit(self, content=None, embed=None):
+        await asyncio.sleep(self.channel.latency)
+        self.channel.edits += 1
+
+class StandInChannel:
+    """Just enough of a text channel for EmbedPublisher"""
+    def __init__(self, channel_id: int, latency: float = 0.05):
+        self.id = channel_id
+        self.latency = latency
+        self.sends = 0
+        self.edits = 0
+
+    async def send(self, content=None, embed=None):
+        await asyncio.sleep(self.latency)
+        self.sends += 1
+        return StandInMessage(self, self.id * 1000 + self.sends)
+
+    def get_partial_message(self, message_id: int):
+        return StandInMessage(self, message_id)
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+async def run_benchmark(
+    ticks: int = 10,
+    tokens: int = 500,
+    faults: Optional[Faults] = None,
+    churn: float = 0.2,
+    candidates: int = 200,
+    profiles: int = 1,
+    publish_latency: float = 0.05,
+    hedge: bool = False
+) -> Dict:
+    """Run `ticks` scans against a fresh simulator and return the report"""
+    simulator = ProviderSimulator(tokens, faults)
+    await simulator.start()
+    for name, value in OFFLINE_ENV.items():
+        os.environ.setdefault(name, value)
+
+    # Imported late so the offline environment is in place for settings
+    from src.app_config import settings
+    import src.bot.filters as filters_module
+    from src.bot.bot import MemeBot
+    from src.bot.embeds import Embeds
+    from src.bot.filters import Filters
+    from src.bot.metadata_store import MetadataStore
+    from src.bot.publisher import EmbedPublisher, PublishScheduler
+    from src.bot.utils import Utils
+
+    for name, value in simulator.environ().items():
+        setattr(settings, name, value)
+    settings.SCAN_MAX_CANDIDATES = candidates
+    settings.HEDGE_REQUESTS = hedge
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        filters_module.FILTERS_PATH = tmp / "filters.json"
+
+        bot = MemeBot()
+        bot.discovery = None
+        bot.publisher = EmbedPublisher(tmp / "messages.json")
+        bot.scheduler = PublishScheduler(
+            bot.publisher, settings.PUBLISH_CONCURRENCY, settings.PUBLISH_RATE
+        )
+        utils = Utils(bot)
+        utils.metadata = MetadataStore(tmp / "metadata.db", max_age=86400)
+        await bot.add_cog(utils)
+        await bot.add_cog(Filters(bot))
+        await bot.add_cog(Embeds(bot))
+        bot.publisher.start()
+        await bot.scheduler.start()
+
+        # Extra guilds publish to their own channels with stricter thresholds
+        system = bot.get_cog("Filters").system
+        for guild in range(2, profiles + 1):
+            system.update_filter("min_liquidity", 80000 * guild, guild_id=str(guild))
+            system.set_channel(str(guild), guild)
+        channels: Dict[int, StandInChannel] = {}
+
+        latencies, requests, scanned = [], [], 0
+        started = time.perf_counter()
+        try:
+            for _ in range(ticks):
+                simulator.advance(churn)
+                before = dict(simulator.requests)
+                tick_started = time.perf_counter()
+
+                results = await bot.process_coins()
+                for channel_id, coins in results.items():
+                    channel = channels.setdefault(
+                        channel_id, StandInChannel(channel_id, publish_latency)
+                    )
+                    if coins:
+                        await bot.update_embed(channel, coins)
+                    else:
+                        await bot.handle_no_coins(channel)
+                await bot.scheduler.join()
+
+                latencies.append(time.perf_counter() - tick_started)
+                requests.append({
+                    provider: simulator.requests[provider] - before.get(provider, 0)
+                    for provider in PROVIDERS
+                })
+                scanned += len(bot.scan_state)
+        finally:
+            elapsed = time.perf_counter() - started
+            # The bot never logged in, so unwind what close() would without the gateway
+            await bot.scheduler.close()
+            await bot.publisher.close()
+            for cog in ("Embeds", "Filters", "Utils"):
+                await bot.remove_cog(cog)
+            await simulator.close()
+
+    return {
+        "ticks": ticks,
+        "tick_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 1),
+            "p90": round(percentile(latencies, 90) * 1000, 1),
+            "p99": round(percentile(latencies, 99) * 1000, 1),
+            "max": round(max(latencies) * 1000, 1),
+            "mean": round(statistics.mean(latencies) * 1000, 1)
+        },
+        "requests_per_tick": {
+            provider: round(statistics.mean(tick[provider] for tick in requests), 2)
+            for provider in PROVIDERS
+        },
+        "throttled": dict(simulator.throttled),
+        "errors": dict(simulator.errors),
+        "tokens_per_second": round(scanned / elapsed, 1),
+        "ticks_per_minute": round(ticks / elapsed * 60, 1),
+        "publish": bot.scheduler.stats()
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument("--tokens", type=int, default=500, help="simulated token universe")
+    parser.add_argument("--candidates", type=int, default=200, help="SCAN_MAX_CANDIDATES")
+    parser.add_argument("--profiles", type=int, default=1, help="guild profiles to publish")
+    parser.add_argument("--churn", type=float, default=0.2, help="share of tokens moving per tick")
+    parser.add_argument("--latency", type=float, default=0.02, help="provider latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="provider jitter (s)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 responses")
+    parser.add_argument("--publish-latency", type=float, default=0.05, help="Discord latency (s)")
+    parser.add_argument("--hedge", action="store_true", help="enable hedged provider reads")
+    parser.add_argument("--json", action="store_true", help="print the raw report")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(
+        ticks=args.ticks,
+        tokens=args.tokens,
+        faults=Faults(args.latency, args.jitter, args.rate_limit, args.error_rate),
+        churn=args.churn,
+        candidates=args.candidates,
+        profiles=args.profiles,
+        publish_latency=args.publish_latency,
+        hedge=args.hedge
+    ))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    tick = report["tick_ms"]
+    print(f"Ticks: {report['ticks']} ({report['ticks_per_minute']}/min)")
+    print(f"Tick latency ms: p50 {tick['p50']} | p90 {tick['p90']} | p99 {tick['p99']} | max {tick['max']}")
+    print("Requests per tick: " + " | ".join(
+        f"{provider} {count}" for provider, count in report["requests_per_tick"].items()
+    ))
+    print(f"Throttled: {report['throttled']} | Errors: {report['errors']}")
+    print(f"Throughput: {report['tokens_per_second']} tokens/s")
+    print(f"Publish: {report['publish']}")
+
+if __name__ == "__main__":
+    # Only warnings; the bot's queued file logging is set up by its own entry point
+    logging.basicConfig(level=logging.WARNING)
+    main()
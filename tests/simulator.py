@@ -0,0 +1,231 @@
+"""Offline stand-in for the Helius, Birdeye, Jupiter and pump.fun endpoints
+
+One aiohttp server answers for every provider under its own prefix, so the
+bot can be pointed at it through the *_URL settings:
+
+    HELIUS_RPC_URL    -> {base}/helius
+    BIRDEYE_API_URL   -> {base}/birdeye
+    JUPITER_PRICE_URL -> {base}/jupiter
+    PUMPFUN_URL       -> {base}/pumpfun
+
+Latency, jitter, 429s and 5xx errors are configured per provider.
+"""
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+from aiohttp import web
+from solders.pubkey import Pubkey
+
+PROVIDERS = ("helius", "birdeye", "jupiter", "pumpfun")
+BIRDEYE_MULTIPLE_LIMIT = 20  # addresses per v3 */multiple request
+
+@dataclass
+class Faults:
+    latency: float = 0.02  # seconds before every response
+    jitter: float = 0.01  # +/- uniform noise on latency
+    rate_limit: float = 0.0  # share of requests answered with 429
+    error_rate: float = 0.0  # share of requests answered with 503
+    retry_after: float = 1.0  # Retry-After sent with each 429
+
+class ProviderSimulator:
+    """Serves a generated token universe with configurable misbehaviour"""
+    def __init__(self, tokens: int = 500, faults: Optional[Faults] = None, seed: int = 7):
+        self.random = random.Random(seed)
+        self.faults = {provider: replace(faults or Faults()) for provider in PROVIDERS}
+        self.tokens: List[Dict] = [self._token(i) for i in range(tokens)]
+        self.by_mint = {token["mint"]: token for token in self.tokens}
+        self.requests: Counter = Counter()
+        self.throttled: Counter = Counter()
+        self.errors: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    def _token(self, index: int) -> Dict:
+        rand = self.random
+        market_cap = rand.lognormvariate(13, 1.5)
+        return {
+            "mint": str(Pubkey(rand.randbytes(32))),
+            "name": f"Sim Token {index}",
+            "symbol": f"SIM{index}",
+            "supply": rand.randint(10**8, 10**10),
+            "price": market_cap / 10**9,
+            "market_cap": market_cap,
+            "liquidity": market_cap * rand.uniform(0.05, 0.6),
+            "volume_24h": market_cap * rand.uniform(0.1, 300),
+        }
+
+    def configure(self, provider: str, **faults) -> None:
+        self.faults[provider] = replace(self.faults[provider], **faults)
+
+    def advance(self, share: float = 0.2) -> None:
+        """Move prices and volumes of a random share of tokens"""
+        for token in self.random.sample(self.tokens, int(len(self.tokens) * share)):
+            factor = self.random.uniform(0.7, 1.4)
+            for field in ("price", "market_cap", "volume_24h"):
+                token[field] *= factor
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        app = web.Application()
+        app.router.add_post("/helius/", self.helius)
+        app.router.add_get("/birdeye/public/token", self.birdeye_token)
+        app.router.add_get("/birdeye/defi/v3/token/market-data/multiple", self.birdeye_market_data)
+        app.router.add_get("/birdeye/defi/v3/token/trade-data/multiple", self.birdeye_trade_data)
+        app.router.add_get("/jupiter/v4/price", self.jupiter_price)
+        app.router.add_get("/pumpfun/{mint}", self.pumpfun_page)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def environ(self) -> Dict[str, str]:
+        """Settings overrides that route every provider here"""
+        return {
+            "HELIUS_RPC_URL": f"{self.base_url}/helius",
+            "BIRDEYE_API_URL": f"{self.base_url}/birdeye",
+            "JUPITER_PRICE_URL": f"{self.base_url}/jupiter",
+            "PUMPFUN_URL": f"{self.base_url}/pumpfun",
+        }
+
+    async def _misbehave(self, provider: str) -> Optional[web.Response]:
+        """Apply latency and maybe fail; returns the failure response if any"""
+        faults = self.faults[provider]
+        self.requests[provider] += 1
+        delay = faults.latency + self.random.uniform(-faults.jitter, faults.jitter)
+        await asyncio.sleep(max(delay, 0.0))
+        roll = self.random.random()
+        if roll < faults.rate_limit:
+            self.throttled[provider] += 1
+            return web.json_response(
+                {"error": "Too many requests"},
+                status=429,
+                headers={"Retry-After": str(faults.retry_after)}
+            )
+        if roll < faults.rate_limit + faults.error_rate:
+            self.errors[provider] += 1
+            return web.json_response({"error": "Service unavailable"}, status=503)
+        return None
+
+    async def helius(self, request: web.Request) -> web.Response:
+        failure = await self._misbehave("helius")
+        if failure is not None:
+            return failure
+        params = (await request.json()).get("params", {})
+        limit = params.get("limit", 100)
+        start = int(params.get("cursor") or (params.get("page", 1) - 1) * limit)
+        items = [
+            {
+                "id": token["mint"],
+                "content": {
+                    "metadata": {"name": token["name"], "symbol": token["symbol"]},
+                    "files": [{"uri": f"https://example.invalid/{token['symbol']}.png"}]
+                },
+                "token_info": {
+                    "supply": token["supply"],
+                    "price_info": {"price_per_token": round(token["price"], 12)}
+                }
+            }
+            for token in self.tokens[start:start + limit]
+        ]
+        cursor = str(start + limit) if start + limit < len(self.tokens) else None
+        return web.json_response({"jsonrpc": "2.0", "result": {"items": items, "cursor": cursor}})
+
+    @staticmethod
+    def _market_data(token: Dict) -> Dict:
+        """Entry of /defi/v3/token/market-data/multiple (no volume)"""
+        return {
+            "address": token["mint"],
+            "price": token["price"],
+            "liquidity": token["liquidity"],
+            "total_supply": token["supply"],
+            "circulating_supply": token["supply"],
+            "fdv": token["market_cap"],
+            "market_cap": token["market_cap"],
+        }
+
+    @staticmethod
+    def _trade_data(token: Dict) -> Dict:
+        """Entry of /defi/v3/token/trade-data/multiple"""
+        return {
+            "address": token["mint"],
+            "price": token["price"],
+            "volume_24h": token["volume_24h"] / token["price"],
+            "volume_24h_usd": token["volume_24h"],
+            "trade_24h": int(token["volume_24h"] // 500),
+        }
+
+    async def birdeye_token(self, request: web.Request) -> web.Response:
+        """Legacy single-token route"""
+        failure = await self._misbehave("birdeye")
+        if failure is not None:
+            return failure
+        token = self.by_mint.get(request.query.get("address", ""))
+        if token is None:
+            return web.json_response({"success": False}, status=404)
+        return web.json_response({
+            "success": True,
+            "liquidity": token["liquidity"],
+            "volume24h": token["volume_24h"],
+            "marketCap": token["market_cap"],
+        })
+
+    async def _birdeye_multiple(self, request: web.Request, entry) -> web.Response:
+        failure = await self._misbehave("birdeye")
+        if failure is not None:
+            return failure
+        mints = request.query.get("list_address", "").split(",")
+        if len(mints) > BIRDEYE_MULTIPLE_LIMIT:
+            return web.json_response(
+                {"success": False, "message": "list_address exceeds limit"}, status=400
+            )
+        data = {mint: entry(self.by_mint[mint]) for mint in mints if mint in self.by_mint}
+        return web.json_response({"success": True, "data": data})
+
+    async def birdeye_market_data(self, request: web.Request) -> web.Response:
+        return await self._birdeye_multiple(request, self._market_data)
+
+    async def birdeye_trade_data(self, request: web.Request) -> web.Response:
+        return await self._birdeye_multiple(request, self._trade_data)
+
+    async def jupiter_price(self, request: web.Request) -> web.Response:
+        failure = await self._misbehave("jupiter")
+        if failure is not None:
+            return failure
+        mints = request.query.get("ids", "").split(",")
+        data = {
+            mint: {"id": mint, "price": self.by_mint[mint]["price"]}
+            for mint in mints if mint in self.by_mint
+        }
+        return web.json_response({"data": data})
+
+    async def pumpfun_page(self, request: web.Request) -> web.StreamResponse:
+        failure = await self._misbehave("pumpfun")
+        if failure is not None:
+            return failure
+        token = self.by_mint.get(request.match_info["mint"])
+        if token is None:
+            return web.Response(status=404, text="Not found")
+        response = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+        await response.prepare(request)
+        await response.write(
+            f'<html><head><title>{token["name"]}</title>'
+            f'<meta name="description" content="{token["name"]} is a simulated meme coin">'
+            f'</head><body>'.encode()
+        )
+        # pump.fun pages are large; the scraper should hang up long before the end
+        try:
+            for _ in range(32):
+                await response.write(b"<div>" + b"x" * 8192 + b"</div>")
+            await response.write(b"</body></html>")
+        except ConnectionResetError:
+            pass
+        return response
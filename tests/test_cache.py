@@ -0,0 +1,83 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+from src.bot.cache import LRUCache, MetricsCache
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.evictions, 1)
+
+class TestMetricsCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    async def loader(self, mints, deadline):
+        self.calls.append(list(mints))
+        return {mint: {"price": len(self.calls), "liquidity": len(self.calls)} for mint in mints}
+
+    async def test_hit_after_miss(self):
+        cache = MetricsCache({"price": 30, "liquidity": 300})
+        first = await cache.get_many(["m1"], ("price",), self.loader)
+        second = await cache.get_many(["m1"], ("price",), self.loader)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    async def test_per_field_ttl(self):
+        """An expired price goes stale while liquidity stays fresh."""
+        cache = MetricsCache({"price": 30, "liquidity": 300})
+        await cache.get_many(["m1"], ("price", "liquidity"), self.loader)
+
+        later = time.monotonic() + 60
+        with patch("src.bot.cache.time.monotonic", return_value=later):
+            await cache.get_many(["m1"], ("liquidity",), self.loader)
+            self.assertEqual(cache.stats()["hits"], 1)
+            result = await cache.get_many(["m1"], ("price",), self.loader)
+
+        # Stale value served immediately, refresh lands in the background
+        self.assertEqual(result, {"m1": {"price": 1}})
+        self.assertEqual(cache.stats()["stale_hits"], 1)
+        await asyncio.sleep(0)
+        self.assertEqual(self.calls, [["m1"], ["m1"]])
+        self.assertEqual(cache.stats()["refreshes"], 1)
+
+    async def test_too_stale_is_a_miss(self):
+        cache = MetricsCache({"price": 30}, max_stale=60)
+        await cache.get_many(["m1"], ("price",), self.loader)
+        with patch("src.bot.cache.time.monotonic", return_value=time.monotonic() + 120):
+            result = await cache.get_many(["m1"], ("price",), self.loader)
+        self.assertEqual(result, {"m1": {"price": 2}})
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    async def test_no_data_is_cached_briefly(self):
+        async def loader(mints, deadline):
+            self.calls.append(list(mints))
+            # Answered for both, but only m1 has a price; m3 was never reached
+            return {"m1": {"price": 1.0}, "m2": {}}
+
+        cache = MetricsCache({"price": 30}, negative_ttl=60)
+        first = await cache.get_many(["m1", "m2", "m3"], ("price",), loader)
+        second = await cache.get_many(["m1", "m2", "m3"], ("price",), loader)
+        self.assertEqual(first, second)
+        self.assertEqual(first, {"m1": {"price": 1.0}})
+        self.assertEqual(self.calls, [["m1", "m2", "m3"], ["m3"]])
+        self.assertEqual(cache.stats()["negative_hits"], 1)
+        self.assertEqual(cache.answered(["m1", "m2", "m3"], ("price",)), ["m1", "m2"])
+
+        with patch("src.bot.cache.time.monotonic", return_value=time.monotonic() + 61):
+            await cache.get_many(["m2"], ("price",), loader)
+        self.assertEqual(self.calls[-1], ["m2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from src.bot.cadence import AdaptiveCadence
+
+class TestAdaptiveCadence(unittest.TestCase):
+
+    def cadence(self):
+        return AdaptiveCadence(base=180, min_interval=60, max_interval=600, smoothing=1.0)
+
+    def test_first_tick_keeps_base(self):
+        cadence = self.cadence()
+        self.assertEqual(cadence.observe({1: ["a", "b"]}), 0.0)
+        self.assertEqual(cadence.next_interval(), 180)
+
+    def test_churn_shortens_and_quiet_lengthens(self):
+        cadence = self.cadence()
+        cadence.observe({1: ["a", "b"]})
+        cadence.observe({1: ["c", "d"]})
+        self.assertEqual(cadence.churn, 1.0)
+        self.assertEqual(cadence.next_interval(), 135)
+        for _ in range(10):
+            cadence.next_interval()
+        self.assertEqual(cadence.interval, 60)
+
+        cadence.observe({1: ["c", "d"]})
+        self.assertEqual(cadence.churn, 0.0)
+        self.assertEqual(cadence.next_interval(), 75)
+
+    def test_low_budget_stretches_interval(self):
+        cadence = self.cadence()
+        self.assertEqual(cadence.next_interval(budget=0.25), 360)
+        self.assertEqual(cadence.next_interval(budget=0.0), 600)
+        self.assertEqual(cadence.next_interval(budget=1.0), 180)
+
+if __name__ == "__main__":
+    unittest.main()
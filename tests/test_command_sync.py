@@ -0,0 +1,68 @@
+import tempfile
+import unittest
+import discord
+from discord import app_commands
+from pathlib import Path
+from src.bot.command_sync import CommandSync, tree_fingerprint
+
+class RecordingTree(app_commands.CommandTree):
+    """Records sync scopes instead of calling the Discord API"""
+    def __init__(self, client):
+        super().__init__(client)
+        self.synced = []
+
+    async def sync(self, *, guild=None):
+        self.synced.append(guild.id if guild else None)
+        return []
+
+def build_tree(description="Show the board"):
+    tree = RecordingTree(discord.Client(intents=discord.Intents.none()))
+
+    @tree.command(name="board", description=description)
+    async def board(interaction: discord.Interaction):
+        pass
+
+    guild = discord.Object(id=42)
+    tree.copy_global_to(guild=guild)
+    return tree, guild
+
+class TestCommandSync(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "command_tree.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fingerprint_tracks_definition(self):
+        tree, guild = build_tree()
+        same, _ = build_tree()
+        changed, _ = build_tree("Show the leaderboard")
+        self.assertEqual(tree_fingerprint(tree, guild), tree_fingerprint(same, guild))
+        self.assertNotEqual(tree_fingerprint(tree, guild), tree_fingerprint(changed, guild))
+
+    async def test_unchanged_tree_skips_sync_across_restarts(self):
+        tree, guild = build_tree()
+        synced = await CommandSync(self.path).sync(tree, 1, [guild, None])
+        self.assertEqual(synced, ["1:42", "1:global"])
+        self.assertEqual(tree.synced, [42, None])
+
+        tree, guild = build_tree()
+        self.assertEqual(await CommandSync(self.path).sync(tree, 1, [guild, None]), [])
+        self.assertEqual(tree.synced, [])
+
+        self.assertEqual(
+            await CommandSync(self.path).sync(tree, 1, [guild, None], force=True),
+            ["1:42", "1:global"]
+        )
+
+    async def test_changed_command_resyncs(self):
+        tree, guild = build_tree()
+        await CommandSync(self.path).sync(tree, 1, [guild, None])
+        tree, guild = build_tree("Show the leaderboard")
+        await CommandSync(self.path).sync(tree, 1, [guild, None])
+        self.assertEqual(tree.synced, [42, None])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from solders.pubkey import Pubkey
+from tests.benchmark import OFFLINE_ENV
+
+for name, value in OFFLINE_ENV.items():
+    os.environ.setdefault(name, value)
+
+from src.bot.commands import MemeCommands
+from src.bot.embeds import Embeds
+from src.bot.utils import format_coin_data, validate_solana_address
+
+MINT = str(Pubkey.default())
+
+class TestMemeSearch(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.utils = MagicMock()
+        self.utils.validate_solana_address = validate_solana_address
+        self.utils.format_coin_data = format_coin_data
+        self.utils.get_metrics = AsyncMock(return_value={})
+        self.utils.describe = AsyncMock(return_value="A dog with a hat")
+        self.utils.metadata.get.return_value = {"name": "Dogwifhat", "symbol": "WIF"}
+        bot = MagicMock()
+        bot.get_cog.side_effect = {"Utils": self.utils, "Embeds": Embeds(bot)}.get
+        self.cog = MemeCommands(bot)
+        self.interaction = MagicMock()
+        self.interaction.response.defer = AsyncMock()
+        self.interaction.followup.send = AsyncMock()
+
+    async def search(self, address):
+        await MemeCommands.meme_search.callback(self.cog, self.interaction, address)
+        return self.interaction.followup.send.await_args.kwargs["embed"]
+
+    async def test_invalid_address_is_rejected(self):
+        embed = await self.search("not-a-mint")
+        self.assertIn("Invalid token address", embed.description)
+        self.utils.get_metrics.assert_not_awaited()
+
+    async def test_no_data_reports_instead_of_raising(self):
+        embed = await self.search(MINT)
+        self.assertIn("No trading activity found", embed.description)
+
+    async def test_embed_uses_stored_metadata(self):
+        self.utils.get_metrics.return_value = {
+            MINT: {"price": 1.5, "liquidity": 1e5, "market_cap": 1e6, "volume_24h": 2880}
+        }
+        embed = await self.search(MINT)
+        self.assertEqual(embed.fields[0].name, "1. Dogwifhat (WIF)")
+        self.assertIn("A dog with a hat", embed.fields[0].value)
+
+if __name__ == "__main__":
+    unittest.main()
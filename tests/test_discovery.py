@@ -0,0 +1,188 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+import aiohttp
+from aiohttp import web
+from solders.pubkey import Pubkey
+from tests.benchmark import OFFLINE_ENV
+from tests.simulator import Faults, ProviderSimulator
+
+for name, value in OFFLINE_ENV.items():
+    os.environ.setdefault(name, value)
+
+from src.app_config import settings
+import src.bot.filters as filters_module
+from src.bot.bot import MemeBot
+from src.bot.discovery import StreamingDiscovery
+from src.bot.filters import Filters
+from src.bot.metadata_store import MetadataStore
+from src.bot.utils import Utils
+
+class TestStreamingDiscovery(unittest.IsolatedAsyncioTestCase):
+    """Runs against a local stand-in for the new-token websocket feed."""
+
+    async def asyncSetUp(self):
+        self.subscriptions = []
+        self.batches = [
+            [{"message": "Successfully subscribed"}, {"mint": "A", "name": "Alpha"}, {"mint": "B"}],
+            [{"mint": "B"}, {"mint": "C", "symbol": "CC"}]
+        ]
+        app = web.Application()
+        app.router.add_get("/ws", self.feed)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/ws"
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.runner.cleanup()
+
+    async def feed(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.subscriptions.append(await ws.receive_json())
+        batch = self.batches.pop(0) if self.batches else []
+        for event in batch:
+            await ws.send_json(event)
+        if self.batches:
+            await ws.close()  # drop the connection to force a reconnect
+        else:
+            async for _ in ws:  # stay connected until the client leaves
+                pass
+        return ws
+
+    async def wait_for(self, predicate, timeout=2.0):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            self.assertLess(asyncio.get_running_loop().time(), deadline)
+            await asyncio.sleep(0.01)
+
+    async def test_reconnects_resubscribes_and_deduplicates(self):
+        discovery = StreamingDiscovery(self.url, min_backoff=0.01, max_backoff=0.05)
+        discovery.start(self.session)
+        await self.wait_for(lambda: discovery.received == 3)
+        await self.wait_for(lambda: discovery.healthy)
+
+        self.assertEqual(self.subscriptions, [{"method": "subscribeNewToken"}] * 2)
+        self.assertEqual([asset["id"] for asset in discovery.candidates()], ["C", "B", "A"])
+        self.assertEqual(discovery.candidates()[2]["content"]["metadata"]["name"], "Alpha")
+        self.assertEqual(discovery.stats()["duplicates"], 1)
+        self.assertEqual(discovery.connects, 2)
+
+        await discovery.close()
+        self.assertFalse(discovery.healthy)
+
+    async def test_window_is_bounded(self):
+        discovery = StreamingDiscovery(self.url, max_tokens=2)
+        for mint in ("A", "B", "C"):
+            discovery._handle({"mint": mint})
+        self.assertEqual([asset["id"] for asset in discovery.candidates()], ["C", "B"])
+
+    async def test_arrived_is_set_for_new_mints_only(self):
+        discovery = StreamingDiscovery(self.url)
+        discovery._handle({"mint": "A"})
+        self.assertTrue(discovery.arrived.is_set())
+        discovery.arrived.clear()
+        discovery._handle({"mint": "A"})
+        discovery._handle({"message": "Successfully subscribed"})
+        self.assertFalse(discovery.arrived.is_set())
+
+    async def test_unreachable_stream_is_unhealthy(self):
+        discovery = StreamingDiscovery("http://127.0.0.1:9/ws", min_backoff=0.01)
+        discovery.start(self.session)
+        await asyncio.sleep(0.1)
+        self.assertFalse(discovery.healthy)
+        await discovery.close()
+
+class TestStreamedCandidates(unittest.IsolatedAsyncioTestCase):
+    """Streamed mints join the polled candidates of a scan against the simulator"""
+
+    async def asyncSetUp(self):
+        self.simulator = ProviderSimulator(tokens=100, faults=Faults(latency=0, jitter=0))
+        await self.simulator.start()
+        overrides = dict(self.simulator.environ(), SCAN_MAX_CANDIDATES=20, DISCOVERY_RESCORE_DELAY=0)
+        self.saved = {name: getattr(settings, name) for name in overrides}
+        for name, value in overrides.items():
+            setattr(settings, name, value)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filters_path = filters_module.FILTERS_PATH
+        filters_module.FILTERS_PATH = Path(self.tmp.name) / "filters.json"
+
+        self.bot = MemeBot()
+        self.bot.discovery = StreamingDiscovery("ws://unused")
+        utils = Utils(self.bot)
+        utils.metadata = MetadataStore(Path(self.tmp.name) / "metadata.db")
+        await self.bot.add_cog(utils)
+        await self.bot.add_cog(Filters(self.bot))
+
+    async def asyncTearDown(self):
+        for cog in ("Filters", "Utils"):
+            await self.bot.remove_cog(cog)
+        await self.simulator.close()
+        filters_module.FILTERS_PATH = self.filters_path
+        for name, value in self.saved.items():
+            setattr(settings, name, value)
+        self.tmp.cleanup()
+
+    def stream(self, token):
+        self.bot.discovery._handle({"mint": token["mint"], "name": token["name"]})
+
+    async def test_streamed_mints_merge_with_polled(self):
+        late = self.simulator.tokens[-1]
+        self.stream(late)
+        await self.bot.process_coins()
+
+        self.assertGreater(self.simulator.requests["helius"], 0)
+        self.assertEqual(len(self.bot.scan_state), 20)
+        self.assertIn(late["mint"], self.bot.scan_state._tokens)
+        self.assertFalse(self.bot.discovery.arrived.is_set())
+
+    async def test_mints_without_data_are_not_refetched(self):
+        unknown = str(Pubkey.new_unique())
+        self.bot.discovery._handle({"mint": unknown})
+        await self.bot.process_coins()
+        birdeye = self.simulator.requests["birdeye"]
+        self.assertIn(unknown, self.bot.scan_state._tokens)
+
+        await self.bot.process_coins()
+        self.assertEqual(self.simulator.requests["birdeye"], birdeye)
+
+    async def test_rescore_reuses_the_last_poll(self):
+        await self.bot.process_coins()
+        polled = set(self.bot.scan_state._tokens)
+        helius = self.simulator.requests["helius"]
+
+        late = self.simulator.tokens[-1]
+        self.stream(late)
+        await self.bot.process_coins(poll=False)
+
+        self.assertEqual(self.simulator.requests["helius"], helius)
+        self.assertIn(late["mint"], self.bot.scan_state._tokens)
+        # The newest mint displaces the last polled one, the rest are kept
+        self.assertEqual(len(polled & set(self.bot.scan_state._tokens)), 19)
+
+    async def test_arrivals_trigger_a_rescore(self):
+        def rescored(poll=True):
+            self.bot.discovery.arrived.clear()
+        self.bot.run_tick = AsyncMock(side_effect=rescored)
+        watcher = asyncio.create_task(self.bot.watch_arrivals())
+        try:
+            self.stream(self.simulator.tokens[-1])
+            for _ in range(50):
+                if self.bot.run_tick.await_count:
+                    break
+                await asyncio.sleep(0.01)
+            self.bot.run_tick.assert_awaited_once_with(poll=False)
+        finally:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+
+if __name__ == "__main__":
+    unittest.main()
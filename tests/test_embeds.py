@@ -0,0 +1,26 @@
+import os
+import unittest
+from tests.benchmark import OFFLINE_ENV
+
+for name, value in OFFLINE_ENV.items():
+    os.environ.setdefault(name, value)
+
+from src.bot.embeds import create_embed, format_interval, refresh_note
+
+class TestEmbedHeader(unittest.TestCase):
+
+    def test_format_interval(self):
+        self.assertEqual(format_interval(60), "1m")
+        self.assertEqual(format_interval(600), "10m")
+        self.assertEqual(format_interval(90), "90s")
+
+    def test_header_shows_adaptive_range(self):
+        embed = create_embed([], 60, 600)
+        self.assertIn("Updated every 1m-10m", embed.description)
+        self.assertNotIn("3 minutes", embed.description)
+
+    def test_fixed_cadence(self):
+        self.assertEqual(refresh_note(120, 120), "Updated every 2m")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+from src.bot.filters import FilterSystem, apply_change, journal_path, metric_columns, top_k
+
+class FilterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch("src.bot.filters.FILTERS_PATH", Path(self.tmp.name) / "filters.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.system = FilterSystem()
+
+class TestVectorizedFilters(FilterTestCase):
+
+    def rows(self):
+        return [
+            {"liquidity": 90000, "market_cap": 200000, "volume_24h": 288 * 200000},
+            {"liquidity": 1000, "market_cap": 200000, "volume_24h": 288 * 900000},
+            {"liquidity": 90000, "market_cap": 99000000, "volume_24h": 288 * 900000},
+            {"liquidity": 90000, "market_cap": 500000, "volume_24h": 288 * 400000},
+            {"liquidity": 90000, "market_cap": 500000, "volume_5min": 300000},
+        ]
+
+    def test_mask_matches_thresholds(self):
+        mask = self.system.compile_profiles(111).any_mask(metric_columns(self.rows()))
+        self.assertEqual(mask.tolist(), [True, False, False, True, True])
+
+    def test_top_k_returns_best_first(self):
+        picks = self.system.compile_profiles(111).top_k(metric_columns(self.rows()), 2)
+        self.assertEqual(picks[111].tolist(), [3, 4])
+
+    def test_update_recompiles(self):
+        self.system.update_filter("min_liquidity", 100000)
+        mask = self.system.compile_profiles(111).any_mask(metric_columns(self.rows()[:1]))
+        self.assertFalse(mask[0])
+
+    def test_top_k_edge_cases(self):
+        self.assertEqual(top_k(np.array([1.0, 3.0]), 5).tolist(), [1, 0])
+        self.assertEqual(len(top_k(np.array([]), 5)), 0)
+
+class TestFilterSnapshots(FilterTestCase):
+
+    def test_snapshot_is_immutable_and_versioned(self):
+        snapshot = self.system.get_snapshot()
+        with self.assertRaises(TypeError):
+            snapshot.data["min_liquidity"] = 1
+
+        self.system.update_filter("min_liquidity", 1000)
+        self.assertEqual(self.system.version, snapshot.version + 1)
+        self.assertEqual(snapshot["min_liquidity"], 80000)
+        self.assertEqual(self.system.get_snapshot()["min_liquidity"], 1000)
+
+    def test_compiled_profiles_follow_version(self):
+        compiled = self.system.compile_profiles(111)
+        self.assertIs(self.system.compile_profiles(111), compiled)
+        self.system.update_filter("min_liquidity", 1000)
+        self.assertIsNot(self.system.compile_profiles(111), compiled)
+        self.assertEqual(self.system.compile_profiles(111).unique[0, 0], 1000)
+
+class TestGuildProfiles(FilterTestCase):
+
+    def columns(self):
+        return metric_columns([
+            {"liquidity": 90000, "market_cap": 200000, "volume_5min": 200000},
+            {"liquidity": 20000, "market_cap": 200000, "volume_5min": 900000},
+            {"liquidity": 90000, "market_cap": 300000, "volume_5min": 400000},
+        ])
+
+    def test_each_channel_gets_its_own_top_k(self):
+        self.system.update_filter("min_liquidity", 10000, guild_id="2")
+        self.system.set_channel("2", 222)
+        self.system.set_channel("3", 333)
+        profiles = self.system.compile_profiles(111)
+
+        picks = profiles.top_k(self.columns(), 2)
+        self.assertEqual(picks[111].tolist(), [2, 0])
+        self.assertEqual(picks[222].tolist(), [1, 2])
+        self.assertEqual(picks[333].tolist(), [2, 0])
+        self.assertEqual(len(profiles.unique), 2)
+        self.assertEqual(profiles.any_mask(self.columns()).tolist(), [True, True, True])
+
+    def test_home_guild_profile_overrides_default_channel(self):
+        self.system.update_filter("min_5m_volume", 300000, guild_id="1")
+        picks = self.system.compile_profiles(111, default_guild_id=1).top_k(self.columns(), 5)
+        self.assertEqual(picks, {111: picks[111]})
+        self.assertEqual(picks[111].tolist(), [2])
+
+    def test_profile_range_is_validated(self):
+        with self.assertRaises(ValueError):
+            self.system.update_filters({"min_market_cap": 5, "max_market_cap": 1}, guild_id="2")
+        self.assertEqual(self.system.get_filters()["profiles"], {})
+
+    def test_legacy_watchlists_are_kept(self):
+        self.system._save_filters({"min_liquidity": 1, "42": ["mint"]})
+        reloaded = FilterSystem()
+        self.assertEqual(reloaded.get_filters()["watchlists"], {"42": ["mint"]})
+        self.assertEqual(reloaded.get_profile("42")["min_liquidity"], 1)
+
+class TestFilterJournal(FilterTestCase):
+
+    def test_changes_wait_for_flush(self):
+        """Updates never touch disk until the write-behind flush runs."""
+        snapshot = journal_path().parent / "filters.json"
+        before = snapshot.read_text()
+        self.system.update_filter("min_liquidity", 1000)
+        self.system.add_filter("42", "mint")
+        self.assertEqual(snapshot.read_text(), before)
+        self.assertFalse(journal_path().exists())
+
+        self.assertEqual(self.system.flush(), 2)
+        self.assertEqual(snapshot.read_text(), before)
+        self.assertEqual(len(journal_path().read_text().splitlines()), 2)
+
+        reloaded = FilterSystem()
+        self.assertEqual(reloaded.get_filters()["min_liquidity"], 1000)
+        self.assertEqual(reloaded.get_filters()["watchlists"], {"42": ["mint"]})
+
+    def test_journal_is_compacted(self):
+        with patch("src.bot.filters.COMPACT_EVERY", 3):
+            for value in (1, 2, 3):
+                self.system.update_filter("min_liquidity", value)
+                self.system.flush()
+        self.assertEqual(journal_path().read_text(), "")
+        self.assertEqual(FilterSystem().get_filters()["min_liquidity"], 3)
+
+    def test_replay_is_idempotent(self):
+        filters = {}
+        change = {"op": "append", "path": ["watchlists", "1"], "value": "mint"}
+        apply_change(filters, change)
+        apply_change(filters, change)
+        self.assertEqual(filters, {"watchlists": {"1": ["mint"]}})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from aiohttp import web
+from src.bot.http_pool import HTTPPool
+
+async def ping(request):
+    return web.json_response({"ok": True})
+
+class TestHTTPPool(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        app = web.Application()
+        app.router.add_get("/ping", ping)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/ping"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_connections_are_reused(self):
+        """Sequential requests should share one keep-alive connection."""
+        pool = HTTPPool(limit_per_host=2)
+        session = await pool.start()
+        for _ in range(5):
+            async with session.get(self.url) as response:
+                self.assertEqual(await response.json(), {"ok": True})
+        await pool.close()
+
+        self.assertEqual(pool.stats.requests, 5)
+        self.assertEqual(pool.stats.connections_created, 1)
+        self.assertEqual(pool.stats.connections_reused, 4)
+
+    async def test_close_is_idempotent(self):
+        """close() may run from both cog unload and bot shutdown."""
+        pool = HTTPPool()
+        await pool.start()
+        await pool.close()
+        await pool.close()
+        with self.assertRaises(RuntimeError):
+            pool.session
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from src.bot.logs import DebugRateLimit, setup_logging, stop_logging
+
+def record(level=logging.DEBUG, lineno=10, created=0.0, msg="GET /token"):
+    entry = logging.LogRecord("bot", level, "utils.py", lineno, msg, None, None)
+    entry.created = created
+    return entry
+
+class TestDebugRateLimit(unittest.TestCase):
+
+    def test_burst_per_call_site(self):
+        limit = DebugRateLimit(burst=2, window=60)
+        passed = [limit.filter(record(created=i)) for i in range(5)]
+        self.assertEqual(passed, [True, True, False, False, False])
+        self.assertTrue(limit.filter(record(lineno=11, created=5)))
+        self.assertTrue(limit.filter(record(logging.INFO, created=5)))
+        self.assertEqual(limit.dropped, 3)
+
+    def test_next_window_reports_suppressed(self):
+        limit = DebugRateLimit(burst=1, window=60)
+        for i in range(4):
+            limit.filter(record(created=i))
+        late = record(created=61)
+        self.assertTrue(limit.filter(late))
+        self.assertEqual(late.suppressed, 3)
+
+class TestQueuedLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = logging.getLogger()
+        self.saved = (list(self.root.handlers), self.root.level)
+
+    def tearDown(self):
+        stop_logging()
+        handlers, level = self.saved
+        for handler in handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(level)
+        self.tmp.cleanup()
+
+    def test_writes_json_lines_from_listener(self):
+        path = Path(self.tmp.name) / "bot.log"
+        setup_logging(logging.DEBUG, path=path, debug_burst=3, console=False)
+        log = logging.getLogger("bot.test")
+        for i in range(10):
+            log.debug("fetched %s", i)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("tick failed")
+        stop_logging()
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([line["message"] for line in lines[:3]], ["fetched 0", "fetched 1", "fetched 2"])
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[-1]["level"], "ERROR")
+        self.assertIn("ValueError: boom", lines[-1]["exc"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from src.bot.metadata_store import MetadataStore
+
+class TestMetadataStore(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "metadata.db"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_restart_starts_warm(self):
+        """Flushed rows are available to a fresh process without refetching."""
+        store = MetadataStore(self.path)
+        store.open()
+        store.stage("mint1", name="Dog", symbol="DOG", image="https://img")
+        store.stage("mint1", description="much wow")
+        self.assertEqual(await store.flush(), 1)
+        store.close()
+
+        reopened = MetadataStore(self.path)
+        reopened.open()
+        self.assertEqual(reopened.get("mint1"), {
+            "name": "Dog", "symbol": "DOG", "image": "https://img", "description": "much wow"
+        })
+        reopened.close()
+
+    async def test_unchanged_rows_are_not_rewritten(self):
+        store = MetadataStore(self.path)
+        store.open()
+        store.stage("mint1", name="Dog")
+        await store.flush()
+        store.stage("mint1", name="Dog")
+        self.assertEqual(await store.flush(), 0)
+        store.close()
+
+    async def test_old_rows_expire(self):
+        store = MetadataStore(self.path, max_age=60)
+        store.open()
+        store.stage("old", name="Old")
+        store.stage("new", name="New")
+        store._dirty["old"] = time.time() - 120
+        await store.flush()
+
+        self.assertEqual(store.expire(), 1)
+        self.assertIsNone(store.get("old"))
+        self.assertIsNotNone(store.get("new"))
+        store.close()
+
+    async def test_failed_write_keeps_the_batch(self):
+        store = MetadataStore(self.path)
+        store.open()
+        store.stage("mint1", name="Dog")
+        with patch.object(store, "_write", side_effect=sqlite3.OperationalError("disk I/O error")):
+            with self.assertRaises(sqlite3.OperationalError):
+                await store.flush()
+        self.assertEqual(await store.flush(), 1)
+        store.close()
+
+    async def test_restaged_row_survives_expiry(self):
+        store = MetadataStore(self.path, max_age=60)
+        store.open()
+        store.stage("old", name="Old")
+        store._dirty["old"] = time.time() - 120
+        store._last_expiry = 0.0
+        write = store._write
+
+        def restage_during_write(batch):
+            expired = write(batch)
+            # The loop restages the mint while the worker is expiring it
+            store.stage("old", description="Back again")
+            return expired
+
+        with patch.object(store, "_write", side_effect=restage_during_write):
+            await store.flush()
+        self.assertEqual(store.get("old"), {"name": "Old", "description": "Back again"})
+        self.assertEqual(await store.flush(), 1)
+        store.close()
+
+if __name__ == "__main__":
+    unittest.main()
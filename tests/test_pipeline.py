@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+from src.bot.pipeline import fan_out
+
+class TestFanOut(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_concurrently(self):
+        """Tick time should track the slowest fetch, not the sum."""
+        async def worker(key):
+            await asyncio.sleep(0.05)
+            return key * 2
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await fan_out(range(20), worker)
+        self.assertLess(loop.time() - started, 0.5)
+        self.assertEqual(results, {key: key * 2 for key in range(20)})
+
+    async def test_deadline_returns_partial_results(self):
+        """Fetches still pending at the deadline are dropped."""
+        async def worker(key):
+            await asyncio.sleep(0 if key == "fast" else 5)
+            return key
+
+        deadline = asyncio.get_running_loop().time() + 0.1
+        results = await fan_out(["fast", "slow"], worker, deadline=deadline)
+        self.assertEqual(results, {"fast": "fast"})
+
+    async def test_failures_are_skipped(self):
+        """One failing fetch must not sink the tick."""
+        async def worker(key):
+            if key == "bad":
+                raise ValueError("boom")
+            return key
+
+        results = await fan_out(["good", "bad"], worker)
+        self.assertEqual(results, {"good": "good"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import unittest
+from contextlib import aclosing
+from unittest.mock import patch
+import aiohttp
+from solders.pubkey import Pubkey
+from tests.benchmark import OFFLINE_ENV
+from tests.simulator import Faults, ProviderSimulator
+
+for name, value in OFFLINE_ENV.items():
+    os.environ.setdefault(name, value)
+
+from src.app_config import settings
+from src.bot import utils
+
+class TestProviderBatches(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.simulator = ProviderSimulator(tokens=150, faults=Faults(latency=0, jitter=0))
+        await self.simulator.start()
+        self.saved = {name: getattr(settings, name) for name in self.simulator.environ()}
+        for name, value in self.simulator.environ().items():
+            setattr(settings, name, value)
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.simulator.close()
+        for name, value in self.saved.items():
+            setattr(settings, name, value)
+
+    def test_chunked(self):
+        chunks = utils.chunked([str(i) for i in range(45)], utils.BIRDEYE_BATCH_LIMIT)
+        self.assertEqual([len(chunk) for chunk in chunks], [20, 20, 5])
+        self.assertEqual(chunks[2], ("40", "41", "42", "43", "44"))
+        self.assertEqual(utils.chunked([], 20), [])
+
+    async def test_birdeye_batch_merges_market_and_trade_data(self):
+        tokens = self.simulator.tokens[:45]
+        unknown = str(Pubkey.default())
+        mints = [token["mint"] for token in tokens] + [unknown, "not-an-address"]
+
+        metrics = await utils.fetch_birdeye_metrics_batch(mints, session=self.session)
+
+        # Three chunks of at most 20, each asked of market-data and trade-data
+        self.assertEqual(self.simulator.requests["birdeye"], 6)
+        self.assertEqual(set(metrics), {token["mint"] for token in tokens} | {unknown})
+        # Answered without data, so the cache can remember there is none
+        self.assertEqual(metrics[unknown], {})
+        for token in tokens:
+            self.assertEqual(metrics[token["mint"]], {
+                "liquidity": token["liquidity"],
+                "market_cap": token["market_cap"],
+                "volume_24h": token["volume_24h"]
+            })
+
+    async def test_jupiter_prices_chunk_by_hundred(self):
+        tokens = self.simulator.tokens[:150]
+        prices = await utils.fetch_jupiter_prices(
+            [token["mint"] for token in tokens], session=self.session
+        )
+        self.assertEqual(self.simulator.requests["jupiter"], 2)
+        self.assertEqual(prices, {token["mint"]: token["price"] for token in tokens})
+
+class TestHeliusPaging(unittest.IsolatedAsyncioTestCase):
+
+    def pages(self, *sizes, cursors=()):
+        """Stand-in for fetch_async serving pages of the given sizes"""
+        self.requests = []
+        cursors = list(cursors)
+
+        async def fetch(url, method="GET", json=None, **kwargs):
+            self.requests.append(dict(json["params"]))
+            size = sizes[len(self.requests) - 1]
+            cursor = cursors[len(self.requests) - 1] if cursors else None
+            items = [{"id": f"{len(self.requests)}-{i}"} for i in range(size)]
+            return {"result": {"items": items, "cursor": cursor}}
+        return patch.object(utils, "fetch_async", fetch)
+
+    async def collect(self, **kwargs):
+        return [asset async for asset in utils.iter_helius_assets(**kwargs)]
+
+    async def test_page_numbers_until_short_page(self):
+        with self.pages(20, 20, 5, 20):
+            assets = await self.collect(page_size=20, max_pages=10)
+        self.assertEqual(len(assets), 45)
+        self.assertEqual([params.get("page") for params in self.requests], [1, 2, 3])
+        self.assertTrue(all("cursor" not in params for params in self.requests))
+
+    async def test_follows_cursor_once_returned(self):
+        with self.pages(20, 20, 20, 3, cursors=("c1", "c2", None, None)):
+            assets = await self.collect(page_size=20, max_pages=10)
+        self.assertEqual(len(assets), 63)
+        self.assertEqual(self.requests[0].get("page"), 1)
+        self.assertEqual([params.get("cursor") for params in self.requests[1:3]], ["c1", "c2"])
+        self.assertNotIn("page", self.requests[1])
+        # No cursor on the third response falls back to page numbers
+        self.assertEqual(self.requests[3].get("page"), 4)
+
+    async def test_stops_at_max_pages(self):
+        with self.pages(*[20] * 10):
+            assets = await self.collect(page_size=20, max_pages=3)
+        self.assertEqual((len(assets), len(self.requests)), (60, 3))
+
+    async def test_break_stops_further_fetches(self):
+        with self.pages(*[20] * 10):
+            seen = 0
+            async with aclosing(utils.iter_helius_assets(page_size=20, max_pages=10)) as assets:
+                async for _ in assets:
+                    seen += 1
+                    if seen == 25:
+                        break
+        # The second page was being consumed; the third is never requested
+        self.assertEqual(len(self.requests), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import discord
+from src.bot.publisher import EmbedPublisher, PublishScheduler
+from src.bot.tracing import Tracer
+
+def fake_channel(channel_id=1):
+    channel = MagicMock()
+    channel.id = channel_id
+    channel.send = AsyncMock(return_value=MagicMock(id=555))
+    channel.get_partial_message.return_value.edit = AsyncMock()
+    return channel
+
+class TestEmbedPublisher(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "messages.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_send_then_edit_then_skip(self):
+        publisher = EmbedPublisher(self.path)
+        channel = fake_channel()
+
+        self.assertEqual(await publisher.publish(channel, embed=discord.Embed(title="a")), "sent")
+        self.assertEqual(await publisher.publish(channel, embed=discord.Embed(title="b")), "edited")
+        self.assertEqual(await publisher.publish(channel, embed=discord.Embed(title="b")), "skipped")
+
+        channel.send.assert_awaited_once()
+        channel.get_partial_message.assert_called_with(555)
+        self.assertEqual(publisher.stats(), {"edits": 1, "sends": 1, "skipped": 1, "saves": 0})
+
+    async def test_handle_survives_restart(self):
+        channel = fake_channel()
+        publisher = EmbedPublisher(self.path)
+        await publisher.publish(channel, embed=discord.Embed(title="a"))
+        await publisher.close()
+
+        restarted = EmbedPublisher(self.path)
+        self.assertEqual(await restarted.publish(channel, embed=discord.Embed(title="a")), "skipped")
+        self.assertEqual(await restarted.publish(channel, embed=discord.Embed(title="b")), "edited")
+        channel.send.assert_awaited_once()
+
+    async def test_deleted_message_is_replaced(self):
+        publisher = EmbedPublisher(self.path)
+        channel = fake_channel()
+        await publisher.publish(channel, embed=discord.Embed(title="a"))
+
+        channel.get_partial_message.return_value.edit.side_effect = discord.NotFound(
+            MagicMock(status=404), "Unknown Message"
+        )
+        self.assertEqual(await publisher.publish(channel, embed=discord.Embed(title="b")), "sent")
+        self.assertEqual(channel.send.await_count, 2)
+
+    async def test_concurrent_publishes_share_one_write(self):
+        publisher = EmbedPublisher(self.path)
+        publisher.start()
+        channels = [fake_channel(channel_id) for channel_id in range(50)]
+        for index, channel in enumerate(channels):
+            channel.send.return_value = MagicMock(id=1000 + index)
+        await asyncio.gather(*(
+            publisher.publish(channel, embed=discord.Embed(title="a")) for channel in channels
+        ))
+        self.assertFalse(self.path.exists())
+        await publisher.close()
+
+        self.assertEqual(publisher.saves, 1)
+        restarted = EmbedPublisher(self.path)
+        for channel in channels:
+            self.assertEqual(
+                await restarted.publish(channel, embed=discord.Embed(title="a")), "skipped"
+            )
+
+    async def test_publishes_inside_the_quiet_period_share_one_write(self):
+        publisher = EmbedPublisher(self.path)
+        with patch("src.bot.publisher.FLUSH_DELAY", 0.05):
+            publisher.start()
+            for index in range(5):
+                await publisher.publish(fake_channel(index), embed=discord.Embed(title="a"))
+                await asyncio.sleep(0.03)
+            self.assertEqual(publisher.saves, 0)
+            await asyncio.sleep(0.1)
+            self.assertEqual(publisher.saves, 1)
+            await publisher.close()
+        self.assertEqual(publisher.saves, 1)
+
+class SlowPublisher:
+    """Records publishes and how many channels were in flight at once"""
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.published = []
+        self.in_flight = set()
+        self.overlap = False
+
+    async def publish(self, channel, content=None, embed=None):
+        self.overlap |= channel.id in self.in_flight
+        self.in_flight.add(channel.id)
+        await asyncio.sleep(self.delay)
+        self.in_flight.discard(channel.id)
+        self.published.append((channel.id, content))
+        return "edited"
+
+    def stats(self):
+        return {}
+
+class TestPublishScheduler(unittest.IsolatedAsyncioTestCase):
+
+    async def test_superseded_updates_are_merged(self):
+        publisher = SlowPublisher()
+        scheduler = PublishScheduler(publisher, concurrency=2)
+        channel = fake_channel(1)
+        for content in ("a", "b", "c"):
+            scheduler.submit(channel, content=content)
+        await scheduler.start()
+        await scheduler.join()
+        await scheduler.close()
+
+        self.assertEqual(publisher.published, [(1, "c")])
+        self.assertEqual(scheduler.stats()["superseded"], 2)
+
+    async def test_channels_publish_concurrently_but_never_overlap(self):
+        publisher = SlowPublisher()
+        scheduler = PublishScheduler(publisher, concurrency=10, per_second=1000)
+        await scheduler.start()
+
+        started = time.monotonic()
+        for channel_id in range(10):
+            scheduler.submit(fake_channel(channel_id), content="x")
+        await asyncio.sleep(0.01)
+        scheduler.submit(fake_channel(0), content="y")  # arrives mid-flight
+        await scheduler.join()
+        await scheduler.close()
+
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(len(publisher.published), 11)
+        self.assertEqual(publisher.published[-1], (0, "y"))
+        self.assertFalse(publisher.overlap)
+
+    async def test_jobs_are_traced_on_the_submitting_tick(self):
+        publisher = SlowPublisher()
+        scheduler = PublishScheduler(publisher, concurrency=2, per_second=1000)
+        await scheduler.start()
+        with tempfile.TemporaryDirectory() as tmp:
+            tracer = Tracer(path=Path(tmp))
+            with tracer.tick() as trace:
+                for channel_id in range(3):
+                    scheduler.submit(fake_channel(channel_id), content="x")
+                scheduler.submit(fake_channel(0), content="y")
+            # The tick is only summarised once its publish jobs ran
+            self.assertEqual(len(tracer.recent), 0)
+            await scheduler.join()
+            await scheduler.close()
+
+        spans = [recorded for recorded in trace.spans if recorded["name"] == "publish"]
+        self.assertEqual(sorted(recorded["channel"] for recorded in spans), [0, 1, 2])
+        self.assertTrue(all(recorded["action"] == "edited" for recorded in spans))
+        self.assertGreaterEqual(trace.stages()["publish"], 0.1)
+        self.assertEqual(len(tracer.recent), 1)
+        self.assertGreater(tracer.recent[0]["total"], tracer.recent[0]["duration"])
+
+if __name__ == "__main__":
+    unittest.main()
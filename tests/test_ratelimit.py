@@ -0,0 +1,47 @@
+import asyncio
+import time
+import unittest
+from src.bot.ratelimit import RateLimiter
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst_then_spaced(self):
+        """Calls beyond the burst are spaced at the refill rate."""
+        limiter = RateLimiter(600, burst=2)  # 10 tokens per second
+        waits = [limiter._reserve() for _ in range(4)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.1, places=2)
+        self.assertAlmostEqual(waits[3], 0.2, places=2)
+
+    async def test_waiters_do_not_serialize(self):
+        """A throttled caller must not hold up everyone queued behind it."""
+        limiter = RateLimiter(600, burst=1)
+
+        async def call():
+            async with limiter:
+                pass
+
+        started = time.monotonic()
+        await asyncio.gather(*(call() for _ in range(4)))
+        self.assertLess(time.monotonic() - started, 0.45)
+        self.assertEqual(limiter.stats()["waits"], 3)
+
+    async def test_retry_after_blocks_and_slows(self):
+        """A 429 with Retry-After holds new callers and halves the rate."""
+        limiter = RateLimiter(600, burst=5)
+        limiter.observe(429, {"Retry-After": "2"})
+        self.assertGreaterEqual(limiter._reserve(), 1.9)
+        self.assertEqual(limiter.stats()["rate_per_minute"], 300)
+        self.assertEqual(limiter.remaining_fraction(), 0.0)
+
+    async def test_rate_limit_headers(self):
+        """Remaining/reset headers set the rate directly."""
+        limiter = RateLimiter(600)
+        limiter.observe(200, {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1"})
+        self.assertEqual(limiter.stats()["rate_per_minute"], 180)
+
+        limiter.observe(200, {})
+        self.assertEqual(limiter.stats()["rate_per_minute"], 210)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import os
+import sys
+import tempfile
+import unittest
+from functools import partial
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from discord.ext import commands
+from tests.benchmark import OFFLINE_ENV, PROJECT_ROOT
+
+for name, value in OFFLINE_ENV.items():
+    os.environ.setdefault(name, value)
+
+from src.app_config import settings
+from src.bot import providers
+from src.bot.bot import EXTENSIONS, MemeBot, reload_settings
+from src.bot.filters import FilterSystem
+from src.bot.metadata_store import MetadataStore
+from src.bot.telemetry import REGISTRY
+from src.bot.utils import DESCRIPTIONS, Utils
+
+class TestSettingsReload(unittest.TestCase):
+
+    def tearDown(self):
+        os.environ.pop("SCAN_REFRESH_SECONDS", None)
+        reload_settings()
+
+    def test_picks_up_changed_environment(self):
+        os.environ["SCAN_REFRESH_SECONDS"] = "123"
+        reload_settings()
+        self.assertEqual(settings.SCAN_REFRESH_SECONDS, 123)
+
+    def test_failed_validation_keeps_previous_values(self):
+        before = settings.SCAN_REFRESH_SECONDS
+        os.environ["SCAN_REFRESH_SECONDS"] = "not a number"
+        with self.assertRaises(ValueError):
+            reload_settings()
+        self.assertEqual(settings.SCAN_REFRESH_SECONDS, before)
+
+class TestUtilsHandoff(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.bot = MemeBot()
+
+    async def asyncTearDown(self):
+        utils = self.bot.get_cog("Utils")
+        if utils:
+            await self.bot.remove_cog("Utils")
+        self.tmp.cleanup()
+
+    async def add_utils(self) -> Utils:
+        utils = Utils(self.bot)
+        if not utils._adopted:
+            utils.metadata = MetadataStore(Path(self.tmp.name) / "metadata.db")
+        await self.bot.add_cog(utils)
+        return utils
+
+    async def test_replacement_keeps_pool_and_stores(self):
+        old = await self.add_utils()
+        session = old.pool.session
+        old.metadata.stage("mint", name="Kept")
+        DESCRIPTIONS.set("mint", "A kept description")
+
+        self.bot.handoffs["Utils"] = old.handoff()
+        await self.bot.remove_cog("Utils")
+        self.assertFalse(session.closed)
+
+        new = await self.add_utils()
+        self.assertEqual(self.bot.handoffs, {})
+        self.assertIs(new.pool.session, session)
+        self.assertIs(new.metadata, old.metadata)
+        self.assertEqual(new.metadata.get("mint")["name"], "Kept")
+        self.assertEqual(DESCRIPTIONS.get("mint"), "A kept description")
+
+        await self.bot.remove_cog("Utils")
+        self.assertTrue(session.closed)
+
+    async def test_pool_cache_and_flight_counters_are_scraped(self):
+        old = await self.add_utils()
+        old.pool.stats.connections_reused = 7
+        old.cache.hits = 3
+        old.flights["birdeye"].saved = 2
+
+        self.bot.handoffs["Utils"] = old.handoff()
+        await self.bot.remove_cog("Utils")
+        await self.add_utils()
+
+        text = REGISTRY.render()
+        self.assertIn("http_connections_reused_total 7", text)
+        self.assertIn('metrics_cache_lookups_total{result="hit"} 3', text)
+        self.assertIn('singleflight_saved_calls_total{provider="birdeye"} 2', text)
+
+class TestBotReload(unittest.IsolatedAsyncioTestCase):
+    """MemeBot.reload() over the real extensions, loaded as the bot loads them"""
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # Extensions are imported as bot.*, which resolves against src/
+        sys.path.insert(0, str(PROJECT_ROOT / "src"))
+        self.filters_path = Path(self.tmp.name) / "filters.json"
+        self.patches = [
+            patch("src.bot.metadata_store.MetadataStore", partial(MetadataStore, Path(self.tmp.name) / "metadata.db")),
+            patch("src.bot.filters.FILTERS_PATH", self.filters_path)
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.bot = MemeBot()
+        self.bot.sync_commands = AsyncMock(return_value=[])
+        # bot.filters is a fresh module per load, so its own FILTERS_PATH can't be
+        # patched; it adopts a FilterSystem backed by the temp file instead
+        self.bot.handoffs["Filters"] = {"system": FilterSystem()}
+        for extension in EXTENSIONS:
+            await self.bot.load_extension(extension)
+
+    async def asyncTearDown(self):
+        for extension in EXTENSIONS:
+            await self.bot.unload_extension(extension)
+        for patcher in self.patches:
+            patcher.stop()
+        sys.path.remove(str(PROJECT_ROOT / "src"))
+        for name in EXTENSIONS:
+            sys.modules.pop(name, None)
+        self.tmp.cleanup()
+        reload_settings()
+
+    async def test_reload_swaps_cogs_and_keeps_live_state(self):
+        old = self.bot.get_cog("Utils")
+        session = old.pool.session
+        limiter = sys.modules["bot.utils"].BIRDEYE_RL
+        os.environ["SCAN_REFRESH_SECONDS"] = "321"
+        try:
+            self.assertEqual(await self.bot.reload(), list(EXTENSIONS))
+        finally:
+            os.environ.pop("SCAN_REFRESH_SECONDS")
+
+        new = self.bot.get_cog("Utils")
+        self.assertIsNot(new, old)
+        self.assertIsNot(type(new), type(old))
+        self.assertIs(new.pool.session, session)
+        self.assertFalse(session.closed)
+        self.assertIs(new.metadata, old.metadata)
+        self.assertEqual(self.bot.handoffs, {})
+        self.assertEqual(self.bot.scan_state.refresh_interval, 321)
+        # Limiters and breakers are the same objects, so quota and trips carry over
+        self.assertIs(sys.modules["bot.utils"].BIRDEYE_RL, limiter)
+        self.assertIs(sys.modules["bot.utils"].BIRDEYE_RL, providers.BIRDEYE_RL)
+        self.assertIs(sys.modules["bot.utils"].PUMPFUN_CB, providers.PUMPFUN_CB)
+        self.bot.sync_commands.assert_awaited_once()
+
+    async def test_filters_keep_their_system_and_version(self):
+        old = self.bot.get_cog("Filters")
+        system = old.system
+        system.update_filter("min_liquidity", 12345)
+        version = old.version
+
+        await self.bot.reload()
+
+        new = self.bot.get_cog("Filters")
+        self.assertIsNot(type(new), type(old))
+        self.assertIs(new.system, system)
+        self.assertEqual(new.version, version)
+        # The old writer flushed on unload; the new one hears later changes
+        self.assertEqual(FilterSystem().get_filters()["min_liquidity"], 12345)
+        new._dirty.clear()
+        system.update_filter("min_liquidity", 54321)
+        self.assertEqual(new.version, version + 1)
+        self.assertTrue(new._dirty.is_set())
+
+    async def test_failed_load_rolls_back_to_the_live_state(self):
+        old = self.bot.get_cog("Utils")
+        session = old.pool.session
+        add_cog = self.bot.add_cog
+        failed = []
+
+        async def failing_add_cog(cog, **kwargs):
+            if cog.qualified_name == "Utils" and not failed:
+                failed.append(cog)
+                raise RuntimeError("broken extension")
+            return await add_cog(cog, **kwargs)
+
+        with patch.object(self.bot, "add_cog", failing_add_cog):
+            with self.assertRaises(commands.ExtensionFailed):
+                await self.bot.reload()
+
+        restored = self.bot.get_cog("Utils")
+        self.assertIs(type(restored), type(old))
+        self.assertIs(restored.pool.session, session)
+        self.assertFalse(session.closed)
+        self.assertIs(restored.metadata, old.metadata)
+        self.assertEqual(self.bot.handoffs, {})
+        self.assertFalse(self.bot._reloading)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from src.bot.resilience import CircuitBreaker, LatencyTracker, hedged
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_on_error_rate_then_probes(self):
+        breaker = CircuitBreaker("test", failure_ratio=0.5, min_calls=4, reset_timeout=30)
+        clock = [1000.0]
+        with patch("src.bot.resilience.time.monotonic", lambda: clock[0]):
+            for ok in (True, False, True, False):
+                self.assertTrue(breaker.allow())
+                breaker.record_success() if ok else breaker.record_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+            self.assertFalse(breaker.allow())
+
+            clock[0] += 30
+            self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+            self.assertTrue(breaker.allow())
+            self.assertFalse(breaker.allow())  # only one probe at a time
+            breaker.record_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+            clock[0] += 30
+            self.assertTrue(breaker.allow())
+            breaker.record_success()
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.stats()["trips"], 2)
+
+    def test_hedge_delay_follows_p95(self):
+        breaker = CircuitBreaker("test", min_calls=5)
+        self.assertEqual(breaker.hedge_delay(default=2.0), 2.0)
+        for ms in range(1, 101):
+            breaker.record_success(ms / 100)
+        self.assertAlmostEqual(breaker.hedge_delay(), 0.96)
+        self.assertIsNone(LatencyTracker().percentile(95))
+
+class TestHedged(unittest.IsolatedAsyncioTestCase):
+
+    async def test_backup_wins_when_first_is_slow(self):
+        delays = [1.0, 0.01]
+        started = []
+
+        async def call():
+            delay = delays[len(started)]
+            started.append(delay)
+            await asyncio.sleep(delay)
+            return delay
+
+        self.assertEqual(await asyncio.wait_for(hedged(call, 0.02), 0.5), 0.01)
+        self.assertEqual(started, [1.0, 0.01])
+
+    async def test_fast_call_is_not_hedged(self):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "ok"
+
+        self.assertEqual(await hedged(call, 0.05), "ok")
+        self.assertEqual(len(calls), 1)
+
+    async def test_all_failures_raise(self):
+        async def call():
+            raise ConnectionError("down")
+
+        with self.assertRaises(ConnectionError):
+            await hedged(call, 0.01)
+
+if __name__ == "__main__":
+    unittest.main()
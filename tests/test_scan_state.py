@@ -0,0 +1,38 @@
+import unittest
+from src.bot.scan_state import ScanState
+
+def asset(name="Dog", price=1.0):
+    return {
+        "content": {"metadata": {"name": name, "symbol": "DOG"}, "files": []},
+        "token_info": {"supply": 1000, "price_info": {"price_per_token": price}}
+    }
+
+class TestScanState(unittest.TestCase):
+
+    def setUp(self):
+        self.state = ScanState(refresh_interval=60)
+        self.state.track_filters({"min_liquidity": 1})
+
+    def test_only_new_changed_or_due_are_dirty(self):
+        self.assertEqual(self.state.dirty({"a": asset(), "b": asset()}, now=0), ["a", "b"])
+        self.state.record("a", asset(), {"contract": "a"}, now=0)
+        self.state.record("b", asset(), None, now=0)
+
+        candidates = {"a": asset(), "b": asset(price=2.0), "c": asset()}
+        self.assertEqual(self.state.dirty(candidates, now=10), ["b", "c"])
+        self.assertEqual(self.state.dirty(candidates, now=60), ["a", "b", "c"])
+
+    def test_vanished_mints_are_dropped(self):
+        self.state.record("a", asset(), {"contract": "a"}, now=0)
+        self.state.dirty({}, now=1)
+        self.assertEqual(self.state.passing(), [])
+
+    def test_filter_change_forces_rescore(self):
+        self.state.record("a", asset(), {"contract": "a"}, now=0)
+        self.state.track_filters({"min_liquidity": 1})
+        self.assertEqual(self.state.dirty({"a": asset()}, now=1), [])
+        self.state.track_filters({"min_liquidity": 2})
+        self.assertEqual(self.state.dirty({"a": asset()}, now=1), ["a"])
+
+if __name__ == "__main__":
+    unittest.main()
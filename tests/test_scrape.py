@@ -0,0 +1,60 @@
+import unittest
+import aiohttp
+from aiohttp import web
+from src.bot.scrape import extract_meta_description, read_head
+
+HEAD = (
+    b'<html><head><meta charset="utf-8">'
+    b"<meta content='Dog &amp; cat coin' name=\"Description\">"
+    b"</head>"
+)
+
+async def page(request):
+    response = web.StreamResponse()
+    await response.prepare(request)
+    await response.write(HEAD)
+    for _ in range(64):
+        await response.write(b"<div>" + b"x" * 16384 + b"</div>")
+    return response
+
+async def headless(request):
+    return web.Response(body=b"<html>" + b"x" * 200000, content_type="text/html")
+
+class TestReadHead(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        app = web.Application()
+        app.router.add_get("/page", page)
+        app.router.add_get("/headless", headless)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base = f"http://127.0.0.1:{port}"
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.runner.cleanup()
+
+    async def test_stops_at_head_end(self):
+        async with self.session.get(f"{self.base}/page") as response:
+            head = await read_head(response, chunk_size=7)
+        self.assertEqual(head, HEAD)
+
+    async def test_byte_cap_is_enforced(self):
+        async with self.session.get(f"{self.base}/headless") as response:
+            head = await read_head(response, max_bytes=4096)
+        self.assertEqual(len(head), 4096)
+
+class TestExtractMetaDescription(unittest.TestCase):
+
+    def test_attribute_order_and_entities(self):
+        self.assertEqual(extract_meta_description(HEAD), "Dog & cat coin")
+
+    def test_missing_description(self):
+        self.assertIsNone(extract_meta_description(b'<head><meta charset="utf-8"></head>'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import aiohttp
+from tests.benchmark import run_benchmark
+from tests.simulator import Faults, ProviderSimulator
+
+class TestProviderSimulator(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.simulator = ProviderSimulator(tokens=30, faults=Faults(latency=0, jitter=0))
+        self.base = await self.simulator.start()
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.simulator.close()
+
+    async def test_helius_pages_follow_cursor(self):
+        payload = {"method": "searchAssets", "params": {"limit": 20, "page": 1}}
+        async with self.session.post(f"{self.base}/helius/", json=payload) as response:
+            first = (await response.json())["result"]
+        payload["params"]["cursor"] = first["cursor"]
+        async with self.session.post(f"{self.base}/helius/", json=payload) as response:
+            second = (await response.json())["result"]
+        self.assertEqual((len(first["items"]), len(second["items"])), (20, 10))
+        self.assertIsNone(second["cursor"])
+
+    async def test_birdeye_v3_routes_split_market_and_trade_data(self):
+        mints = [token["mint"] for token in self.simulator.tokens[:3]]
+        query = f"list_address={','.join(mints)}"
+        base = f"{self.base}/birdeye/defi/v3/token"
+        async with self.session.get(f"{base}/market-data/multiple?{query}") as response:
+            market = (await response.json())["data"]
+        async with self.session.get(f"{base}/trade-data/multiple?{query}") as response:
+            trade = (await response.json())["data"]
+        self.assertEqual(set(market), set(mints))
+        self.assertIn("market_cap", market[mints[0]])
+        self.assertNotIn("volume_24h_usd", market[mints[0]])
+        self.assertEqual(trade[mints[0]]["volume_24h_usd"], self.simulator.tokens[0]["volume_24h"])
+
+        too_many = ",".join(token["mint"] for token in self.simulator.tokens[:21])
+        async with self.session.get(f"{base}/market-data/multiple?list_address={too_many}") as response:
+            self.assertEqual(response.status, 400)
+
+    async def test_faults_are_injected(self):
+        self.simulator.configure("jupiter", rate_limit=1.0, retry_after=3)
+        async with self.session.get(f"{self.base}/jupiter/v4/price?ids=x") as response:
+            self.assertEqual(response.status, 429)
+            self.assertEqual(response.headers["Retry-After"], "3")
+        self.simulator.configure("jupiter", rate_limit=0.0, error_rate=1.0)
+        async with self.session.get(f"{self.base}/jupiter/v4/price?ids=x") as response:
+            self.assertEqual(response.status, 503)
+        self.assertEqual(self.simulator.requests["jupiter"], 2)
+
+class TestBenchmark(unittest.IsolatedAsyncioTestCase):
+
+    async def test_ticks_run_offline(self):
+        report = await run_benchmark(
+            ticks=2, tokens=60, candidates=40, faults=Faults(latency=0, jitter=0),
+            publish_latency=0
+        )
+        self.assertEqual(report["ticks"], 2)
+        self.assertEqual(report["requests_per_tick"]["helius"], 1)
+        self.assertGreater(report["requests_per_tick"]["birdeye"], 0)
+        self.assertEqual(report["publish"]["failed"], 0)
+        self.assertEqual(report["publish"]["submitted"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
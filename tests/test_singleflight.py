@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from src.bot.singleflight import SingleFlight
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("mint", fetch) for _ in range(5)))
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats()["saved_calls"], 4)
+        self.assertEqual(flight.stats()["in_flight"], 0)
+
+        await flight.do("mint", fetch)
+        self.assertEqual(len(calls), 2)
+
+    async def test_errors_are_shared(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            flight.do("mint", fail), flight.do("mint", fail), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(flight.stats()["upstream_calls"], 1)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "value"
+
+        leader = asyncio.ensure_future(flight.do("mint", fetch))
+        follower = asyncio.ensure_future(flight.do("mint", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        self.assertEqual(await follower, "value")
+
+    async def test_batches_join_keys_in_flight(self):
+        flight = SingleFlight()
+        batches = []
+
+        async def load(keys):
+            batches.append(keys)
+            await asyncio.sleep(0.01)
+            return {key: key.upper() for key in keys if key != "gone"}
+
+        first, second = await asyncio.gather(
+            flight.do_many(["a", "b"], load),
+            flight.do_many(["b", "c", "gone"], load)
+        )
+        self.assertEqual(batches, [["a", "b"], ["c", "gone"]])
+        self.assertEqual(first, {"a": "A", "b": "B"})
+        self.assertEqual(second, {"b": "B", "c": "C"})
+        self.assertEqual(flight.stats()["shared_keys"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
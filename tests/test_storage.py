@@ -0,0 +1,51 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from src.bot.storage import wait_for_quiet, write_json_atomic
+
+class TestWriteJsonAtomic(unittest.TestCase):
+
+    def test_replaces_file_and_keeps_it_on_failure(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "state.json"
+            write_json_atomic(path, {"a": 1})
+            write_json_atomic(path, {"a": 2})
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"a": 2})
+
+            with self.assertRaises(TypeError):
+                write_json_atomic(path, {"a": object()})
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"a": 2})
+            self.assertEqual([item.name for item in path.parent.iterdir()], ["state.json"])
+
+class TestWaitForQuiet(unittest.IsolatedAsyncioTestCase):
+
+    async def changes(self, event, count, every):
+        for _ in range(count):
+            await asyncio.sleep(every)
+            event.set()
+
+    async def test_waits_until_changes_stop(self):
+        event = asyncio.Event()
+        event.set()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        burst = asyncio.create_task(self.changes(event, 5, 0.02))
+        await wait_for_quiet(event, quiet=0.05, ceiling=5)
+        await burst
+        # The last change landed about 0.1s in; quiet follows it
+        self.assertGreaterEqual(loop.time() - started, 0.15)
+        self.assertFalse(event.is_set())
+
+    async def test_ceiling_caps_a_steady_stream(self):
+        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        stream = asyncio.create_task(self.changes(event, 100, 0.01))
+        await wait_for_quiet(event, quiet=0.05, ceiling=0.2)
+        self.assertLess(loop.time() - started, 0.5)
+        stream.cancel()
+
+if __name__ == "__main__":
+    unittest.main()
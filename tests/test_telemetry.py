@@ -0,0 +1,72 @@
+import unittest
+import aiohttp
+from src.bot.telemetry import Gauge, Registry, TelemetryServer
+
+class TestRegistry(unittest.TestCase):
+
+    def test_histogram_is_cumulative(self):
+        registry = Registry()
+        latency = registry.histogram("req_seconds", "Latency", ("provider",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value, provider="birdeye")
+        lines = registry.render().splitlines()
+
+        self.assertIn("# TYPE req_seconds histogram", lines)
+        self.assertIn('req_seconds_bucket{provider="birdeye",le="0.1"} 2', lines)
+        self.assertIn('req_seconds_bucket{provider="birdeye",le="1"} 3', lines)
+        self.assertIn('req_seconds_bucket{provider="birdeye",le="+Inf"} 4', lines)
+        self.assertIn('req_seconds_count{provider="birdeye"} 4', lines)
+        self.assertIn('req_seconds_sum{provider="birdeye"} 3.65', lines)
+
+    def test_collectors_run_at_scrape_time(self):
+        registry = Registry()
+        ticks = registry.counter("ticks_total", "Ticks", ("outcome",))
+        ticks.inc(outcome="completed")
+        calls = []
+
+        def collect():
+            calls.append(1)
+            gauge = Gauge("queued", "Queue depth")
+            gauge.set(len(calls))
+            return [gauge]
+
+        registry.collector("queue", collect)
+        registry.render()
+        text = registry.render()
+        self.assertIn('ticks_total{outcome="completed"} 1', text)
+        self.assertIn("queued 2", text)
+
+class TestTelemetryServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.ready = False
+        registry = Registry()
+        registry.counter("ticks_total", "Ticks").inc()
+        self.server = TelemetryServer(lambda: {"ready": self.ready}, registry, "127.0.0.1", 0)
+        await self.server.start()
+        self.base = f"http://127.0.0.1:{self.server.port}"
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.server.close()
+
+    async def test_liveness_and_readiness(self):
+        async with self.session.get(f"{self.base}/health") as response:
+            self.assertEqual(response.status, 200)
+            self.assertFalse((await response.json())["ready"])
+        async with self.session.get(f"{self.base}/health/ready") as response:
+            self.assertEqual(response.status, 503)
+
+        self.ready = True
+        async with self.session.get(f"{self.base}/health/ready") as response:
+            self.assertEqual(response.status, 200)
+
+    async def test_metrics_exposition(self):
+        async with self.session.get(f"{self.base}/metrics") as response:
+            self.assertEqual(response.status, 200)
+            self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+            self.assertIn("ticks_total 1", await response.text())
+
+if __name__ == "__main__":
+    unittest.main()
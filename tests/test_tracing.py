@@ -0,0 +1,105 @@
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from src.bot.tracing import Tracer, attach, span
+
+class TestTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_span_outside_tick_is_noop(self):
+        with span("discovery"):
+            pass
+        tracer = Tracer(path=self.path)
+        self.assertEqual(len(tracer.recent), 0)
+
+    def test_stages_add_up_per_tick(self):
+        tracer = Tracer(capacity=2, path=self.path)
+        for _ in range(3):
+            with tracer.tick() as trace:
+                with span("metrics", tokens=5):
+                    time.sleep(0.01)
+                with span("format"):
+                    pass
+                with span("metrics"):
+                    time.sleep(0.01)
+        self.assertEqual(len(tracer.recent), 2)
+        self.assertEqual(tracer.recent[-1]["tick"], 3)
+        self.assertEqual(set(trace.stages()), {"metrics", "format"})
+        self.assertGreaterEqual(trace.stages()["metrics"], 0.02)
+        self.assertEqual(trace.spans[0]["tokens"], 5)
+        self.assertEqual(len(tracer.slow), 0)
+
+    def test_tick_over_budget_keeps_full_trace(self):
+        tracer = Tracer(budget=0.0, path=self.path)
+        with self.assertLogs(level="WARNING"):
+            with tracer.tick():
+                with span("publish", channels=1):
+                    time.sleep(0.001)
+        self.assertEqual(len(tracer.slow), 1)
+        lines = (self.path / "slow_ticks.jsonl").read_text().splitlines()
+        self.assertEqual(json.loads(lines[0])["spans"][0]["name"], "publish")
+
+    def test_held_trace_finishes_on_last_release(self):
+        tracer = Tracer(path=self.path)
+        with tracer.tick() as trace:
+            trace.hold()
+            trace.hold()
+        trace.release()
+        self.assertEqual(len(tracer.recent), 0)
+        with attach(trace), span("publish", channel=7) as attrs:
+            attrs["action"] = "sent"
+        trace.release()
+        self.assertEqual(len(tracer.recent), 1)
+        self.assertEqual(trace.spans[-1]["action"], "sent")
+        self.assertGreaterEqual(trace.total, trace.duration)
+
+    def test_profile_covers_requested_ticks(self):
+        tracer = Tracer(path=self.path)
+        tracer.request_profile(2)
+        for _ in range(3):
+            with tracer.tick():
+                with span("filter"):
+                    sorted(range(1000), reverse=True)
+        self.assertFalse(tracer.profiling)
+        reports = list(self.path.glob("profile-*.txt"))
+        self.assertEqual(len(reports), 1)
+        report = reports[0].read_text()
+        self.assertIn("Profiled ticks: [1, 2]", report)
+        self.assertIn("filter", report)
+
+class TestProfileOffLoop(unittest.IsolatedAsyncioTestCase):
+
+    async def test_report_is_rendered_in_the_executor(self):
+        threads = []
+        render = Tracer.profile_report
+
+        def recording(profiler, summaries, limit=40):
+            threads.append(threading.current_thread())
+            return render(profiler, summaries, limit)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tracer = Tracer(path=Path(tmp))
+            tracer.profile_report = recording
+            tracer.request_profile(1)
+            with tracer.tick():
+                with span("filter"):
+                    sorted(range(1000))
+            for _ in range(100):
+                if list(Path(tmp).glob("profile-*.txt")):
+                    break
+                await asyncio.sleep(0.01)
+            self.assertIn("Profiled ticks: [1]", next(Path(tmp).glob("profile-*.txt")).read_text())
+        self.assertIsNot(threads[0], threading.main_thread())
+
+if __name__ == "__main__":
+    unittest.main()